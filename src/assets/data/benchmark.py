@@ -0,0 +1,194 @@
+"""
+Dashboard Benchmarks
+Author: Muntakim Rahman
+Description: Offline Benchmarks for the Spotify and Games ETL (No API Credentials Needed).
+    Usage: python benchmark.py [memory] [render] [steam]
+"""
+
+# Import Packages
+import pandas as pd
+import altair as alt
+import numpy as np
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+
+PWD = os.path.dirname(os.path.abspath(__file__))
+
+# Resolve Sub-Module Paths
+sys.path.insert(0, os.path.join(PWD, 'spotify'))
+sys.path.insert(0, os.path.join(PWD, 'games', 'steam'))
+sys.path.insert(0, os.path.join(PWD, 'common'))
+
+from spotify import SpotifyUser
+from steam import SteamUser
+from backup_store import writeBackup
+from vega_render import VegaRenderer
+
+def _loadSavedTracks() -> pd.DataFrame:
+    """Saved Tracks from spotify_data.json as Object-Column Frame (Current Representation)"""
+    with open(os.path.join(PWD, 'spotify', 'spotify_data.json'), 'r', encoding = 'utf-8') as f:
+        saved_tracks = json.load(f)['saved_tracks']
+
+    tracks_df = pd.DataFrame(saved_tracks).astype(object)
+    tracks_df['artist_names'] = tracks_df['artists'].str.split(', ')
+    return tracks_df
+
+def benchmarkMemory() -> pd.DataFrame:
+    """Compare Deep Memory of Current vs Compact saved_tracks_df per Column (KB)"""
+    current_df = _loadSavedTracks()
+    compact_df = SpotifyUser.compactTracks(current_df)
+
+    report = pd.DataFrame({
+        'current_kb': current_df.memory_usage(deep = True, index = False) / 1024,
+        'compact_kb': compact_df.memory_usage(deep = True, index = False) / 1024,
+        'compact_dtype': compact_df.dtypes.astype(str),
+    })
+    report.loc['TOTAL', ['current_kb', 'compact_kb']] = report[['current_kb', 'compact_kb']].sum()
+    report[['current_kb', 'compact_kb']] = report[['current_kb', 'compact_kb']].round(1)
+
+    print(f"saved_tracks_df Memory ({len(current_df):,} Tracks)")
+    print(report.fillna('').to_string())
+    print(f"Compact / Current: {report.loc['TOTAL', 'compact_kb'] / report.loc['TOTAL', 'current_kb']:.2f}x")
+    return report
+
+def benchmarkRender(repeats: int = 3) -> pd.DataFrame:
+    """Compare Per-Call Altair save() vs Compile-Once VegaRenderer for PNG + SVG + PNG @2x (ms)"""
+    with open(os.path.join(PWD, 'spotify', 'Charts', 'Muntakim_Dashboard.json'), 'r', encoding = 'utf-8') as f:
+        spec = json.load(f)
+    spec.pop('background', None) # Transparent Export Override; Not Valid for from_dict()
+
+    renderer = VegaRenderer()
+    renderer.warm() # Converter is Per-Process; Both Paths Share the Warm Instance
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        png_path, svg_path, png2_path = (os.path.join(tmp_dir, name) for name in ('chart.png', 'chart.svg', 'chart@2x.png'))
+        for run in range(repeats):
+            # Current: Every save() Rebuilds, Validates and Recompiles the Spec
+            start = time.perf_counter()
+            chart = alt.Chart.from_dict(spec)
+            chart.save(png_path)
+            chart.save(svg_path)
+            chart.save(png2_path, scale_factor = 2)
+            save_ms = (time.perf_counter() - start) * 1000
+
+            with open(png_path, 'rb') as f:
+                save_png = f.read()
+
+            # Backend: One Vega Compile, Three Renders
+            renderer.clear()
+            start = time.perf_counter()
+            backend_png = renderer.png(spec)
+            renderer.svg(spec)
+            renderer.png(spec, scale = 2)
+            backend_ms = (time.perf_counter() - start) * 1000
+
+            rows.append({'run': run + 1, 'save_ms': save_ms, 'backend_ms': backend_ms, 'png_identical': save_png == backend_png})
+
+    report = pd.DataFrame(rows).set_index('run').round(1)
+    print("PNG + SVG + PNG @2x Render Time (Spotify Standard Dashboard)")
+    print(report.to_string())
+    print(f"Backend / save(): {report['backend_ms'].mean() / report['save_ms'].mean():.2f}x")
+    return report
+
+def _syntheticSteamLibrary(n_games: int, seed: int = 0) -> tuple:
+    """GetOwnedGames / GetBadges-Shaped Frames for n_games (Sparse Fields Left NaN as the API Omits Them)"""
+    rng = np.random.default_rng(seed)
+    appids = rng.choice(np.arange(10, 3_000_000, 10), size = n_games, replace = False)
+    recent = rng.random(n_games) < 0.05
+    owned_df = pd.DataFrame({
+        'appid': appids,
+        'name': [f"Synthetic Game {i}" for i in range(n_games)],
+        'playtime_forever': rng.integers(0, 50_000, n_games),
+        'img_icon_url': [f"{value:040x}" for value in rng.integers(0, 2 ** 62, n_games)],
+        'has_community_visible_stats': np.where(rng.random(n_games) < 0.7, True, None),
+        'playtime_windows_forever': rng.integers(0, 50_000, n_games),
+        'playtime_mac_forever': np.zeros(n_games, dtype = 'int64'),
+        'playtime_linux_forever': np.zeros(n_games, dtype = 'int64'),
+        'playtime_deck_forever': rng.integers(0, 500, n_games),
+        'rtime_last_played': rng.integers(1_300_000_000, 1_790_000_000, n_games),
+        'content_descriptorids': [[1, 5] if flag else None for flag in rng.random(n_games) < 0.2],
+        'has_leaderboards': np.where(rng.random(n_games) < 0.3, True, None),
+        'playtime_disconnected': rng.integers(0, 100, n_games),
+        'playtime_2weeks': np.where(recent, rng.integers(1, 3_000, n_games), np.nan),
+    })
+
+    badged = rng.choice(appids, size = n_games // 10, replace = False)
+    badges_df = pd.DataFrame({
+        'appid': badged,
+        'badgeid': rng.integers(1, 6, len(badged)),
+        'level': rng.integers(1, 6, len(badged)),
+        'completion_time': rng.integers(1_300_000_000, 1_790_000_000, len(badged)),
+        'xp': rng.integers(100, 500, len(badged)),
+        'communityitemid': rng.integers(10 ** 9, 10 ** 10, len(badged)).astype(str),
+        'scarcity': rng.integers(1, 10 ** 6, len(badged)),
+    })
+    return owned_df, badges_df
+
+def _fullSteamStats(user: SteamUser) -> pd.DataFrame:
+    """Every Owned / Badge Column Materialized, Merged and Zero-Filled (Pre-Projection _compileStats)"""
+    stats_df = user.owned_df.copy()
+    stats_df = pd.merge(stats_df, user.badges_df, on = 'appid', how = 'left', suffixes = ('', '_badge'))
+    stats_df = stats_df[[col for col in stats_df.columns if not col.endswith('_badge')]]
+    stats_df['player_level'] = user.player_level
+    stats_df = user._consolidateApps(stats_df)
+    stats_df['playtime_forever'] = (stats_df['playtime_forever'] / 60.0).round(2)
+    return user._renameGames(stats_df.fillna(0).sort_values('playtime_forever', ascending = False))
+
+def benchmarkSteamStats(n_games: int = 5000, repeats: int = 3) -> pd.DataFrame:
+    """Compare Full vs Projected SteamUser Stats on a Synthetic Library: Build / Persist Time (ms), Memory and Backup Size (KB)"""
+    user = SteamUser.__new__(SteamUser) # Skip API Fetch in __init__
+    user.username, user.player_level = 'Synthetic', 42
+    user.owned_df, user.badges_df = _syntheticSteamLibrary(n_games)
+    user.achievements_df = pd.DataFrame()
+
+    paths = {'full': (_fullSteamStats, {}), 'projected': (SteamUser._buildStats, SteamUser.STATS_SCHEMA)}
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for run in range(repeats):
+            for path, (build, schema) in paths.items():
+                backup_path = os.path.join(tmp_dir, f"{path}.feather")
+                with contextlib.redirect_stdout(io.StringIO()): # Consolidation Notice per Build
+                    start = time.perf_counter()
+                    stats_df = build(user)
+                    build_ms = (time.perf_counter() - start) * 1000
+
+                start = time.perf_counter()
+                writeBackup(backup_path, stats_df, schema, {'player_level': user.player_level})
+                persist_ms = (time.perf_counter() - start) * 1000
+
+                rows.append({
+                    'run': run + 1, 'path': path,
+                    'columns': stats_df.shape[1],
+                    'build_ms': build_ms, 'persist_ms': persist_ms,
+                    'memory_kb': stats_df.memory_usage(deep = True, index = False).sum() / 1024,
+                    'backup_kb': os.path.getsize(backup_path) / 1024,
+                })
+
+    report = pd.DataFrame(rows).groupby('path', sort = False).mean(numeric_only = True).drop(columns = 'run').round(1)
+    print(f"SteamUser Stats ({n_games:,} Synthetic Games, Mean of {repeats} Runs)")
+    print(report.to_string())
+    print(f"Projected / Full: Memory {report.loc['projected', 'memory_kb'] / report.loc['full', 'memory_kb']:.2f}x | "
+          f"Build + Persist {(report.loc['projected', 'build_ms'] + report.loc['projected', 'persist_ms']) / (report.loc['full', 'build_ms'] + report.loc['full', 'persist_ms']):.2f}x")
+    return report
+
+BENCHMARKS = {
+    'memory': benchmarkMemory,
+    'render': benchmarkRender,
+    'steam': benchmarkSteamStats,
+}
+
+if __name__ == '__main__':
+    selected = sys.argv[1:] or list(BENCHMARKS)
+    for name in selected:
+        if name not in BENCHMARKS:
+            print(f"Unknown Benchmark '{name}' (Expected One of {list(BENCHMARKS)})")
+            continue
+        BENCHMARKS[name]()
+        print()
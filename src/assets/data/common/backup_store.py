@@ -0,0 +1,63 @@
+"""
+Backup Store
+Author: Muntakim Rahman
+Description: Typed Columnar Backups for Steam / PSN Stats (Arrow IPC / Feather).
+    Stats are Written Against an Explicit Schema (Declared Types for Known Columns, Arrow-Inferred
+    Types for the Rest), so Fallback Loads Get Back Exactly the Dtypes that were Saved.
+    Profile Scalars (Steam Level, Trophy Counts) are Stored Once in Schema Metadata Instead of
+    Being Repeated on Every Row. Files are Uncompressed so Reads are Memory-Mapped (Zero-Copy).
+"""
+
+# Import Packages
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+import json
+import os
+
+from typing import Optional
+
+BACKUP_SUFFIX = ".feather"
+PROFILE_KEY = b"profile"
+
+def _storable(values: pd.Series) -> pd.Series:
+    """Column as Arrow Can Store It (Mixed-Type Object Columns, e.g. Strings Filled with 0, as Strings)"""
+    if values.dtype != object:
+        return values
+    try:
+        pa.array(values, from_pandas = True)
+        return values
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return values.astype(str)
+
+def _scalar(value):
+    """JSON Fallback for NumPy Scalars in Profile Values"""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Profile Value {value!r} is Not JSON Serializable")
+
+def writeBackup(path: str, stats_df: pd.DataFrame, schema: dict, profile: Optional[dict] = None) -> None:
+    """Write stats_df to Feather; schema = {column: Arrow Type Alias (e.g. 'int32', 'str')} for Declared Columns (Absent Ones Ignored)"""
+    stats_df = stats_df.apply(_storable)
+    inferred = pa.Schema.from_pandas(stats_df, preserve_index = False)
+    schema = pa.schema([
+        field.with_type(pa.type_for_alias(schema[field.name])) if field.name in schema else field
+        for field in inferred
+    ], metadata = inferred.metadata) # Keeps pandas Metadata so Reads Restore Exact Dtypes
+
+    table = pa.Table.from_pandas(stats_df, schema = schema, preserve_index = False)
+    metadata = {**table.schema.metadata, PROFILE_KEY: json.dumps(profile or {}, default = _scalar).encode()}
+
+    # Write Beside and Swap In: Earlier Reads May Still Memory-Map the Old File (Zero-Copy Buffers)
+    staging_path = f"{path}.tmp"
+    feather.write_feather(table.replace_schema_metadata(metadata), staging_path, compression = "uncompressed")
+    os.replace(staging_path, path)
+
+def readBackup(path: str, columns: Optional[list] = None) -> tuple:
+    """Memory-Mapped Read of a Backup, Converting Only columns (if Given) to pandas. Returns (Stats DataFrame, Profile Dict)."""
+    table = feather.read_table(path, memory_map = True)
+    profile = json.loads((table.schema.metadata or {}).get(PROFILE_KEY, b"{}"))
+    if columns is not None:
+        table = table.select([column for column in columns if column in table.column_names])
+    return table.to_pandas(), profile
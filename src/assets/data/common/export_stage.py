@@ -0,0 +1,260 @@
+"""
+Export Stage
+Author: Muntakim Rahman
+Description: Artifact Export for Dashboard save().
+    Each Dashboard Queues Its Artifacts (JSON, HTML, PNG, SVG) Against One In-Memory Spec per Layout.
+    CPU-Bound PNG / SVG Renders are Grouped per Spec. Each Spec is Compiled to Vega Once in This
+    Process (Warm Cache, See vega_render.py) and Groups Render from That Vega Concurrently in a
+    Process Pool While JSON / HTML are Written In-Process.
+    Every Artifact Goes Through writeArtifact(), so Output is Byte-Identical to the Serial Path.
+
+    With a Manifest, Each Artifact is Recorded Against the Content Fingerprint of Its Inputs
+    (Datasets + Layout Config). Callers Check isCurrent() First and Skip Building, Rendering and
+    Writing Layouts Whose Inputs are Unchanged, so Unchanged Data Leaves the Working Tree Untouched.
+
+    Breakpoint Layouts are Also Rendered to Static SVG, Listed with Their Pixel Size in a Small
+    Breakpoint Manifest (writeBreakpointManifest); the Dashboards (components/VegaChart) Paint Them Before Vega Loads.
+
+    Selected by Environment Variables:
+        DASHBOARD_EXPORT_WORKERS = Pool Size (Default: CPU Count; 0 or 1 = Serial)
+        DASHBOARD_PNG_SCALES     = Extra PNG Scale Factors, e.g. "2,3" -> {name}@2x.png (Default: None)
+        DASHBOARD_PRECOMPILE     = 1 Adds Compiled Vega {name}.vg.json per Layout (Default: 0)
+"""
+
+# Import Packages
+import altair as alt
+from altair.utils import spec_to_html
+
+import json
+import os
+import re
+import time
+import vl_convert as vlc
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+from vega_precompile import VEGA_SUFFIX, writeVega
+from vega_render import getRenderer
+
+RENDER_FORMATS = {'png', 'svg'} # Sent to Process Pool
+MANIFEST_VERSION = 1 # Bump When Artifact Serialization Changes (Invalidates Every Entry)
+
+def _format(path: str) -> str:
+    if path.endswith(VEGA_SUFFIX):
+        return 'vega' # Compiled Vega (See vega_precompile.py)
+    return os.path.splitext(path)[1].lstrip('.').lower()
+
+def _pngScales() -> list:
+    """Extra PNG Scale Factors from DASHBOARD_PNG_SCALES"""
+    scales = os.getenv('DASHBOARD_PNG_SCALES', '')
+    return [float(scale) for scale in scales.replace(' ', '').split(',') if scale and float(scale) != 1]
+
+def _withScales(path: str) -> list:
+    """Path Plus Its Extra PNG Scale Variants ({name}@2x.png, ...)"""
+    if _format(path) != 'png':
+        return [path]
+    stem = os.path.splitext(path)[0]
+    return [path] + [f"{stem}@{extra:g}x.png" for extra in _pngScales()]
+
+class OutputManifest:
+    """File Name -> Input Fingerprint for Generated Artifacts, Stored as JSON"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.tools = f"v{MANIFEST_VERSION}|altair {alt.__version__}|vl-convert {vlc.__version__}"
+        self.files: dict = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding = 'utf-8') as f:
+                    manifest = json.load(f)
+                # Different Exporter / Renderer Versions Invalidate Every Entry
+                if manifest.get('tools') == self.tools:
+                    self.files = manifest.get('files', {})
+            except (OSError, ValueError) as e:
+                print(f"Warning: Unreadable Output Manifest {path} ({e}) - Regenerating All Artifacts")
+        self._saved = dict(self.files)
+
+    def isCurrent(self, path: str, fingerprint: str) -> bool:
+        """Artifact Exists and Was Generated from the Same Inputs"""
+        return (self.files.get(os.path.basename(path)) == fingerprint) and os.path.exists(path)
+
+    def record(self, path: str, fingerprint: str) -> None:
+        self.files[os.path.basename(path)] = fingerprint
+
+    def save(self) -> None:
+        """Write Manifest (Only if Entries Changed, so Unchanged Runs Touch No Files)"""
+        if self.files == self._saved:
+            return
+        os.makedirs(os.path.dirname(self.path), exist_ok = True)
+        with open(self.path, 'w', encoding = 'utf-8') as f:
+            json.dump({'tools': self.tools, 'files': self.files}, f, indent = 2, sort_keys = True)
+        self._saved = dict(self.files)
+
+def writeArtifact(spec: dict, path: str, json_kwds: Optional[dict] = None, scale: float = 1) -> float:
+    """Write One Artifact Straight from a Spec Dict (No Altair Chart Rebuild). Returns Seconds Taken."""
+    start = time.perf_counter()
+    versions = dict(
+        vega_version = alt.VEGA_VERSION,
+        vegalite_version = alt.VEGALITE_VERSION,
+        vegaembed_version = alt.VEGAEMBED_VERSION,
+    )
+    fmt = _format(path)
+
+    if fmt == 'json':
+        with open(path, 'w', encoding = 'utf-8') as f:
+            json.dump(spec, f, **(json_kwds or {}))
+    elif fmt == 'html':
+        with open(path, 'w', encoding = 'utf-8') as f:
+            f.write(spec_to_html(spec, mode = 'vega-lite', **versions))
+    elif fmt == 'vega':
+        writeVega(spec, path)
+    elif fmt == 'png':
+        png = getRenderer().png(spec, scale = scale)
+        with open(path, 'wb') as f:
+            f.write(png)
+    elif fmt == 'svg':
+        svg = getRenderer().svg(spec)
+        with open(path, 'w', encoding = 'utf-8') as f:
+            f.write(svg)
+    else:
+        raise ValueError(f"Unsupported Export Format '{fmt}'")
+
+    return time.perf_counter() - start
+
+def _writeRender(vega: dict, path: str, scale: float = 1) -> float:
+    """Write One PNG / SVG from Compiled Vega. Returns Seconds Taken."""
+    start = time.perf_counter()
+    if _format(path) == 'png':
+        png = getRenderer().renderPng(vega, scale = scale)
+        with open(path, 'wb') as f:
+            f.write(png)
+    else:
+        svg = getRenderer().renderSvg(vega)
+        with open(path, 'w', encoding = 'utf-8') as f:
+            f.write(svg)
+    return time.perf_counter() - start
+
+def _renderGroup(vega: dict, targets: list) -> list:
+    """Render Every (Path, Scale) Target of One Compiled Spec (Runs in a Pool Worker; No Compile There)"""
+    return [(path, _writeRender(vega, path, scale)) for path, scale in targets]
+
+def svgSize(path: str) -> tuple:
+    """Root <svg> Width / Height (px) of a Rendered SVG, or (None, None) if Unreadable"""
+    try:
+        with open(path, 'r', encoding = 'utf-8') as f:
+            root = f.read(1024)
+    except OSError:
+        return None, None
+    width = re.search(r'<svg\b[^>]*?\swidth="([\d.]+)"', root)
+    height = re.search(r'<svg\b[^>]*?\sheight="([\d.]+)"', root)
+    if not (width and height):
+        return None, None
+    return float(width.group(1)), float(height.group(1))
+
+def writeBreakpointManifest(path: str, svgs: dict) -> None:
+    """Write Breakpoint -> {svg, width, height} for Rendered Breakpoint SVGs (Only if Changed)"""
+    manifest = {}
+    for breakpoint, svg_path in svgs.items():
+        width, height = svgSize(svg_path)
+        if width is None:
+            print(f"Warning: No Static SVG for Breakpoint '{breakpoint}' ({os.path.basename(svg_path)})")
+            continue
+        manifest[breakpoint] = {'svg': os.path.basename(svg_path), 'width': int(width), 'height': int(height)}
+
+    if os.path.exists(path):
+        try:
+            with open(path, 'r', encoding = 'utf-8') as f:
+                if json.load(f) == manifest:
+                    return
+        except (OSError, ValueError):
+            pass
+    with open(path, 'w', encoding = 'utf-8') as f:
+        json.dump(manifest, f, indent = 2)
+
+class ExportStage:
+    """Queue of Spec -> File Artifacts, Written Together by run()"""
+
+    def __init__(self, max_workers: Optional[int] = None, manifest: Optional[str] = None):
+        if max_workers is None:
+            max_workers = int(os.getenv('DASHBOARD_EXPORT_WORKERS', os.cpu_count() or 1) or 0)
+        self.max_workers = max_workers
+        self.manifest = OutputManifest(manifest) if manifest else None
+        self.jobs: list = [] # (Path, Spec, JSON Kwargs, PNG Scale)
+        self.fingerprints: dict = {} # Path -> Input Fingerprint (Recorded Once Written)
+        self.skipped: list = [] # File Names Left Untouched (Inputs Unchanged)
+        self.timings: dict = {} # File Name -> ms
+
+    def isCurrent(self, paths: list, fingerprint: str) -> bool:
+        """Every Artifact in paths (Incl. Extra PNG Scales) is Up to Date for fingerprint.
+        Marks Them Skipped if So; Caller Then Skips Building / Queueing Them."""
+        if self.manifest is None:
+            return False
+        expanded = [target for path in paths for target in _withScales(path)]
+        if not all(self.manifest.isCurrent(path, fingerprint) for path in expanded):
+            return False
+        self.skipped.extend(os.path.basename(path) for path in expanded)
+        return True
+
+    def add(self, path: str, spec: dict, scale: float = 1, fingerprint: Optional[str] = None, **json_kwds) -> None:
+        """Queue Artifact (Format from Extension; json_kwds Apply to .json, scale to .png Only).
+        fingerprint = Input Fingerprint Recorded in the Manifest Once Written."""
+        self.jobs.append((path, spec, json_kwds, scale))
+
+        # Extra Scale Factors Render from the Same Compiled Vega
+        if (_format(path) == 'png') and (scale == 1):
+            stem = os.path.splitext(path)[0]
+            for extra in _pngScales():
+                self.jobs.append((f"{stem}@{extra:g}x.png", spec, {}, extra))
+
+        if fingerprint is not None:
+            for target in (_withScales(path) if scale == 1 else [path]):
+                self.fingerprints[target] = fingerprint
+
+    def run(self) -> dict:
+        """Write All Queued Artifacts. Returns Per-Artifact Timings (ms)."""
+        start = time.perf_counter()
+        self.timings = {}
+        inline_jobs = [job for job in self.jobs if _format(job[0]) not in RENDER_FORMATS]
+
+        # Group Renders by Spec so Each Spec is Compiled to Vega Once (Here; Workers Only Render)
+        render_groups: dict = {}
+        for path, spec, _, scale in self.jobs:
+            if _format(path) in RENDER_FORMATS:
+                render_groups.setdefault(id(spec), (spec, []))[1].append((path, scale))
+        workers = min(self.max_workers, len(render_groups))
+
+        if workers > 1:
+            with ProcessPoolExecutor(max_workers = workers) as pool:
+                futures = [pool.submit(_renderGroup, getRenderer().compile(spec), targets) for spec, targets in render_groups.values()]
+                for path, spec, kwds, _ in inline_jobs: # Overlap with Renders
+                    self.timings[os.path.basename(path)] = writeArtifact(spec, path, kwds) * 1000
+                for future in futures:
+                    for path, seconds in future.result():
+                        self.timings[os.path.basename(path)] = seconds * 1000
+        else:
+            workers = 1
+            for path, spec, kwds, _ in inline_jobs:
+                self.timings[os.path.basename(path)] = writeArtifact(spec, path, kwds) * 1000
+            for spec, targets in render_groups.values():
+                for path, seconds in _renderGroup(getRenderer().compile(spec), targets):
+                    self.timings[os.path.basename(path)] = seconds * 1000
+
+        # Record Fingerprints Only After Every Artifact is Written
+        if self.manifest is not None:
+            for path, fingerprint in self.fingerprints.items():
+                self.manifest.record(path, fingerprint)
+            self.manifest.save()
+
+        self.jobs = []
+        self.fingerprints = {}
+        self.report(time.perf_counter() - start, workers)
+        return self.timings
+
+    def report(self, wall: float, workers: int) -> None:
+        """Print Per-Artifact Timings and Stage Wall Time"""
+        if self.timings:
+            print("Export Timings: " + " | ".join(f"{name} {ms:.0f} ms" for name, ms in self.timings.items()))
+        unchanged = f", {len(self.skipped)} Unchanged (Skipped)" if self.skipped else ""
+        print(f"Export Stage: {len(self.timings)} Artifacts in {wall * 1000:.0f} ms ({workers} Worker{'s' if workers > 1 else ''}){unchanged}")
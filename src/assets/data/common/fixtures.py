@@ -0,0 +1,117 @@
+"""
+API Fixtures
+Author: Muntakim Rahman
+Description: Record / Replay Layer for Spotify, Steam and PSN API Clients.
+    Record Mode Captures Raw API Responses to a Versioned Fixture Directory;
+    Replay Mode Serves Them Back (Optionally with Injected Latency) so the ETL Runs Offline.
+
+    Selected by Environment Variables:
+        DASHBOARD_FIXTURES            = live | record | replay (Default: live)
+        DASHBOARD_FIXTURES_DIR        = Fixture Root (Default: src/assets/data/fixtures)
+        DASHBOARD_FIXTURES_LATENCY_MS = Per-Call Delay in Replay Mode (Default: 0)
+"""
+
+# Import Packages
+import hashlib
+import json
+import os
+import time
+
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+FIXTURE_VERSION = 1 # Bump When Recorded Response Shapes Change
+DEFAULT_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'fixtures')
+
+# Request Parameters Never Written to Fixtures or Used in Fixture Keys
+SECRET_PARAMS = {'key', 'access_token', 'npsso'}
+
+class FixtureMissing(LookupError):
+    """Raised in Replay Mode When No Fixture was Recorded for a Call"""
+
+class FixtureStore:
+    """Records or Replays JSON-Serializable API Responses Keyed by Call Name + Params"""
+
+    MODES = ('live', 'record', 'replay')
+
+    def __init__(self, mode: str = 'live', root: Optional[str] = None, latency_ms: float = 0.0):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown Fixture Mode '{mode}' (Expected One of {self.MODES})")
+
+        self.mode = mode
+        self.root = os.path.join(root or DEFAULT_ROOT, f"v{FIXTURE_VERSION}")
+        self.latency_ms = latency_ms
+
+    @classmethod
+    def fromEnv(cls) -> 'FixtureStore':
+        """Build Store from DASHBOARD_FIXTURES* Environment Variables"""
+        return cls(
+            mode = os.getenv('DASHBOARD_FIXTURES', 'live').strip().lower() or 'live',
+            root = os.getenv('DASHBOARD_FIXTURES_DIR') or None,
+            latency_ms = float(os.getenv('DASHBOARD_FIXTURES_LATENCY_MS', 0) or 0),
+        )
+
+    @property
+    def offline(self) -> bool:
+        """True if Calls are Served from Fixtures (No Network / Credentials Needed)"""
+        return self.mode == 'replay'
+
+    def _path(self, namespace: str, name: str, params: dict) -> str:
+        """Fixture File for Call: {root}/v{N}/{namespace}/{name}-{params hash}.json"""
+        digest = hashlib.sha1(json.dumps(params, sort_keys = True, default = str).encode()).hexdigest()[:12]
+        safe_name = name.strip('/').replace('/', '_')
+        return os.path.join(self.root, namespace, f"{safe_name}-{digest}.json")
+
+    def _writeManifest(self) -> None:
+        """Stamp Fixture Version and Recording Time"""
+        os.makedirs(self.root, exist_ok = True)
+        with open(os.path.join(self.root, 'manifest.json'), 'w') as f:
+            json.dump({
+                'version': FIXTURE_VERSION,
+                'recorded_at': datetime.now(timezone.utc).isoformat(),
+            }, f, indent = 2)
+
+    def call(self, namespace: str, name: str, params: dict, fetch: Optional[Callable[[], Any]]) -> Any:
+        """Run fetch() Live, Record its Result, or Replay a Recorded Result"""
+        params = {k: v for k, v in params.items() if k not in SECRET_PARAMS}
+        path = self._path(namespace, name, params)
+
+        if self.mode == 'replay':
+            if not os.path.exists(path):
+                raise FixtureMissing(f"No {namespace} Fixture for {name} {params}")
+            if self.latency_ms:
+                time.sleep(self.latency_ms / 1000)
+            with open(path, 'r', encoding = 'utf-8') as f:
+                return json.load(f)['response']
+
+        response = fetch()
+
+        if self.mode == 'record':
+            if not os.path.exists(os.path.join(self.root, 'manifest.json')):
+                self._writeManifest()
+            os.makedirs(os.path.dirname(path), exist_ok = True)
+            with open(path, 'w', encoding = 'utf-8') as f:
+                json.dump({'name': name, 'params': params, 'response': response}, f, ensure_ascii = False)
+
+        return response
+
+    def wrap(self, target: Any, namespace: str) -> Any:
+        """Route Method Calls on target Through Store (Returns target Unchanged in Live Mode)"""
+        if self.mode == 'live':
+            return target
+        return FixtureProxy(target, self, namespace)
+
+class FixtureProxy:
+    """Forwards Method Calls to Wrapped Client via FixtureStore.call"""
+
+    def __init__(self, target: Any, store: FixtureStore, namespace: str):
+        self._target = target # None in Replay Mode
+        self._store = store
+        self._namespace = namespace
+
+    def __getattr__(self, name: str) -> Callable:
+        def _call(*args, **kwargs):
+            params = {'args': list(args), **kwargs} if args else kwargs
+            fetch = (lambda: getattr(self._target, name)(*args, **kwargs)) if self._target is not None else None
+            return self._store.call(self._namespace, name, params, fetch)
+        return _call
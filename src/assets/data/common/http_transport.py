@@ -0,0 +1,174 @@
+"""
+HTTP Transport
+Author: Muntakim Rahman
+Description: Shared Pooled HTTP Session for Steam and Spotify API Clients.
+    Keep-Alive Connection Pooling (Capped per Host), Token-Bucket Throttling per Host,
+    Retry-After Aware Backoff on 429/5xx (Idempotent Methods Only; Other Methods Retry Only a 429
+    with Retry-After, Which Means the Request Was Not Processed), and Per-Endpoint Latency / Retry Stats.
+"""
+
+# Import Packages
+import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+
+import threading
+import time
+
+from typing import Optional
+from urllib.parse import urlparse
+
+class TokenBucket:
+    """Thread-Safe Token Bucket (Sustained Rate in Requests/Sec, Burst Capacity)"""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Block Until a Token is Available. Returns Seconds Waited."""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+class PooledTransport(requests.Session):
+    """Pooled requests.Session with Host Throttling, Retry-After Backoff and Endpoint Stats"""
+
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"}) # Safe to Resend After a 5xx / Dropped Connection
+
+    # Sustained Requests/Sec and Burst per Host
+    HOST_LIMITS = {
+        "api.spotify.com": (10.0, 20),
+        "api.steampowered.com": (5.0, 10),
+    }
+    DEFAULT_LIMIT = (10.0, 20)
+
+    def __init__(self,
+        pool_maxsize: int = 16,
+        timeout: float = 10.0,
+        max_retries: int = 4,
+        backoff: float = 0.5,
+        max_retry_after: float = 60.0,
+        allowed_methods: frozenset = IDEMPOTENT_METHODS,
+    ):
+        super().__init__()
+        self.timeout = timeout # Default (Connect, Read) Timeout if Caller Sets None
+        self.max_retries = max_retries
+        self.backoff = backoff # Exponential Backoff Base (Seconds) When No Retry-After
+        self.max_retry_after = max_retry_after # Cap on Server-Requested Wait
+        self.allowed_methods = frozenset(method.upper() for method in allowed_methods) # Retried on Any RETRY_STATUSES / Connection Error
+
+        # Keep-Alive Pool; pool_block Caps Open Connections per Host at pool_maxsize
+        adapter = HTTPAdapter(pool_connections = 4, pool_maxsize = pool_maxsize, pool_block = True)
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+
+        self._buckets: dict = {}
+        self._stats: list = [] # (Endpoint, Status, Seconds, Retries, Throttled Seconds)
+        self._lock = threading.Lock()
+
+    def _bucket(self, host: str) -> TokenBucket:
+        """Get or Create Token Bucket for Host"""
+        with self._lock:
+            if host not in self._buckets:
+                rate, capacity = self.HOST_LIMITS.get(host, self.DEFAULT_LIMIT)
+                self._buckets[host] = TokenBucket(rate, capacity)
+            return self._buckets[host]
+
+    def _retryable(self, method: str, response: Optional[requests.Response]) -> bool:
+        """Whether a Failed Attempt May be Resent (response is None for a Connection Error)"""
+        if method.upper() in self.allowed_methods:
+            return (response is None) or (response.status_code in self.RETRY_STATUSES)
+        # Non-Idempotent (e.g. POST): Only a Rate-Limit Rejection with Retry-After is Known Not to Have Run
+        return (response is not None) and (response.status_code == 429) and ("Retry-After" in response.headers)
+
+    def _retryDelay(self, response: Optional[requests.Response], attempt: int) -> float:
+        """Seconds to Wait Before Retry (Honours Retry-After if Sent)"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_retry_after)
+            except ValueError: # HTTP-Date Form - Fall Back to Backoff
+                pass
+        return self.backoff * (2 ** attempt)
+
+    def request(self, method, url, **kwargs) -> requests.Response:
+        """Throttled Request with Retries on 429/5xx and Connection Errors (See _retryable)"""
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self.timeout
+
+        parsed = urlparse(url)
+        endpoint = f"{parsed.netloc}{parsed.path}"
+        bucket = self._bucket(parsed.netloc)
+
+        start = time.perf_counter()
+        throttled = 0.0 # Token Bucket Wait, Excluded from Latency
+        attempt = 0
+        while True:
+            throttled += bucket.acquire()
+            try:
+                response = super().request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if (attempt >= self.max_retries) or not self._retryable(method, None):
+                    self._record(endpoint, None, time.perf_counter() - start - throttled, attempt, throttled)
+                    raise
+                response = None
+
+            if (response is not None) and ((attempt >= self.max_retries) or not self._retryable(method, response)):
+                self._record(endpoint, response.status_code, time.perf_counter() - start - throttled, attempt, throttled)
+                return response
+
+            time.sleep(self._retryDelay(response, attempt))
+            attempt += 1
+
+    def _record(self, endpoint: str, status: Optional[int], seconds: float, retries: int, throttled: float) -> None:
+        """Record Latency / Retries for a Completed Call"""
+        with self._lock:
+            self._stats.append((endpoint, status, seconds, retries, throttled))
+
+    def stats(self) -> pd.DataFrame:
+        """Per-Endpoint Call Count, Latency (ms), Retry Totals and Throttle Wait (ms)"""
+        with self._lock:
+            calls_df = pd.DataFrame(self._stats, columns = ["endpoint", "status", "seconds", "retries", "throttled"])
+        if calls_df.empty:
+            return pd.DataFrame()
+
+        calls_df["ms"] = calls_df["seconds"] * 1000
+        calls_df["throttled_ms"] = calls_df["throttled"] * 1000
+        return calls_df.groupby("endpoint").agg(
+            calls = ("ms", "size"),
+            mean_ms = ("ms", "mean"),
+            p95_ms = ("ms", lambda ms: ms.quantile(0.95)),
+            max_ms = ("ms", "max"),
+            retries = ("retries", "sum"),
+            throttled_ms = ("throttled_ms", "sum"),
+        ).round(1).sort_values("calls", ascending = False)
+
+    def report(self) -> None:
+        """Print Per-Endpoint Stats Table"""
+        stats_df = self.stats()
+        if not stats_df.empty:
+            print("HTTP Endpoint Stats:")
+            print(stats_df.to_string())
+
+_TRANSPORT: Optional[PooledTransport] = None
+
+def getTransport() -> PooledTransport:
+    """Process-Wide Shared Transport (Steam and Spotify Clients Reuse One Pool)"""
+    global _TRANSPORT
+    if _TRANSPORT is None:
+        _TRANSPORT = PooledTransport()
+    return _TRANSPORT
@@ -0,0 +1,96 @@
+"""
+Play History
+Author: Muntakim Rahman
+Description: Append-Only Log of Recently Played Tracks, Partitioned by Month (CSV).
+    Spotify Only Returns the Last 50 Plays, so Each Run Appends Plays Newer than the Log's Latest
+    played_at (history_dir/YYYY-MM.csv, played_at Stored as Unix ms). Range Reads Open Only the
+    Partitions Overlapping [start, end).
+"""
+
+# Import Packages
+import pandas as pd
+
+import os
+
+from typing import Optional
+
+def _utc(ts) -> Optional[pd.Timestamp]:
+    """Coerce Timestamp to UTC (Naive Timestamps Treated as UTC)"""
+    if ts is None:
+        return None
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+class PlayHistory:
+    """Append-Only Log of Recently Played Tracks, Partitioned by Month for Range Reads"""
+
+    COLUMNS = ["played_at", "id", "track", "artists"] # played_at Stored as Unix ms
+
+    def __init__(self, history_dir: str):
+        self.history_dir = history_dir
+
+    def _partitionPath(self, period: pd.Period) -> str:
+        """Monthly Partition File (e.g. 2026-03.csv)"""
+        return os.path.join(self.history_dir, f"{period}.csv")
+
+    def _partitions(self) -> list:
+        """Sorted Monthly Partitions on Disk"""
+        if not os.path.isdir(self.history_dir):
+            return []
+        return sorted(pd.Period(file[:-4], freq = "M") for file in os.listdir(self.history_dir) if file.endswith(".csv"))
+
+    def lastPlayedAt(self) -> Optional[pd.Timestamp]:
+        """Cursor for Next Fetch: Latest played_at in the Log"""
+        partitions = self._partitions()
+        if not partitions:
+            return None
+        latest = pd.read_csv(self._partitionPath(partitions[-1]), usecols = ["played_at"])["played_at"]
+        return pd.to_datetime(latest.max(), unit = "ms", utc = True) if not latest.empty else None
+
+    def append(self, plays_df: pd.DataFrame) -> int:
+        """Append Plays Newer than Log Cursor, Deduplicated on played_at. Returns Rows Written."""
+        if plays_df.empty:
+            return 0
+
+        plays = plays_df.copy()
+        plays["played_at"] = pd.to_datetime(plays["played_at"], utc = True, format = "ISO8601")
+
+        cursor = self.lastPlayedAt()
+        if cursor is not None:
+            plays = plays[plays["played_at"] > cursor]
+        plays = plays.drop_duplicates("played_at").sort_values("played_at")
+        if plays.empty:
+            return 0
+
+        os.makedirs(self.history_dir, exist_ok = True)
+        periods = plays["played_at"].dt.tz_localize(None).dt.to_period("M")
+        plays["played_at"] = (plays["played_at"] - pd.Timestamp(0, tz = "UTC")) // pd.Timedelta(milliseconds = 1) # Unix ms
+
+        for period, rows in plays.groupby(periods, sort = True):
+            path = self._partitionPath(period)
+            rows.reindex(columns = self.COLUMNS).to_csv(path, mode = "a", header = not os.path.exists(path), index = False)
+        return len(plays)
+
+    def read(self, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Read Plays in [start, end), Touching Only Overlapping Monthly Partitions (Naive Bounds are UTC)"""
+        start, end = _utc(start), _utc(end)
+
+        frames = []
+        for period in self._partitions():
+            if (start is not None) and (period.end_time < start.tz_localize(None)):
+                continue
+            if (end is not None) and (period.start_time >= end.tz_localize(None)):
+                continue
+            frames.append(pd.read_csv(self._partitionPath(period), dtype = {"played_at": "int64"}))
+
+        if not frames:
+            return pd.DataFrame(columns = self.COLUMNS)
+
+        plays = pd.concat(frames, ignore_index = True)
+        plays["played_at"] = pd.to_datetime(plays["played_at"], unit = "ms", utc = True)
+        mask = pd.Series(True, index = plays.index)
+        if start is not None:
+            mask &= plays["played_at"] >= start
+        if end is not None:
+            mask &= plays["played_at"] < end
+        return plays[mask].reset_index(drop = True)
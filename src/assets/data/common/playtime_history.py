@@ -0,0 +1,136 @@
+"""
+Playtime History
+Author: Muntakim Rahman
+Description: Append-Only Playtime Snapshots for Steam and PSN, Partitioned by Month (Parquet).
+    Each Run Appends a Compact Snapshot (snapshot_at, key, playtime, delta) to the Month's Partition
+    (history_dir/YYYY-MM.parquet) for Games Whose Playtime Changed Since the Previous Snapshot
+    (the First Snapshot Stores Every Game as a Baseline with delta = 0).
+
+    delta is Computed Once at Append Time Against a Small Latest-Playtime File, so Per-Period
+    Hours Played are a Groupby-Sum over the Partitions Overlapping the Requested Range Only.
+    Hours are Attributed to the Snapshot That Observed Them (One Snapshot per Run).
+"""
+
+# Import Packages
+import pandas as pd
+
+import os
+
+from typing import Optional
+
+def _utc(ts) -> Optional[pd.Timestamp]:
+    """Coerce Timestamp to UTC (Naive Timestamps Treated as UTC)"""
+    if ts is None:
+        return None
+    ts = pd.Timestamp(ts)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+class PlaytimeHistory:
+    """Append-Only Playtime Snapshot Log Keyed by Game ID (appid / title_id)"""
+
+    COLUMNS = ["snapshot_at", "key", "playtime", "delta"] # Hours; snapshot_at in UTC
+    PERIODS = {"daily": "D", "weekly": "W", "monthly": "M"} # Granularity → Pandas Period Frequency
+    LATEST_FILE = "latest.parquet"
+
+    def __init__(self, history_dir: str, key: str):
+        self.history_dir = history_dir
+        self.key = key # Game ID Column in stats_df
+
+    def _partitionPath(self, period: pd.Period) -> str:
+        """Monthly Partition File (e.g. 2026-03.parquet)"""
+        return os.path.join(self.history_dir, f"{period}.parquet")
+
+    def _partitions(self) -> list:
+        """Sorted Monthly Partitions on Disk"""
+        if not os.path.isdir(self.history_dir):
+            return []
+        return sorted(
+            pd.Period(file[:-len(".parquet")], freq = "M")
+            for file in os.listdir(self.history_dir)
+            if file.endswith(".parquet") and (file != self.LATEST_FILE)
+        )
+
+    def latest(self) -> pd.DataFrame:
+        """Most Recent Cumulative Playtime per Game (key, playtime)"""
+        path = os.path.join(self.history_dir, self.LATEST_FILE)
+        if not os.path.exists(path):
+            return pd.DataFrame(columns = ["key", "playtime"])
+        return pd.read_parquet(path)
+
+    def append(self, stats_df: pd.DataFrame, snapshot_at: Optional[pd.Timestamp] = None) -> int:
+        """Append Snapshot of stats_df Playtime (Changed Games Only; Naive snapshot_at is UTC). Returns Rows Written."""
+        if stats_df.empty or (self.key not in stats_df.columns) or ("playtime_forever" not in stats_df.columns):
+            return 0
+
+        current = stats_df[[self.key, "playtime_forever"]].dropna().drop_duplicates(self.key)
+        current = current.rename(columns = {self.key: "key", "playtime_forever": "playtime"})
+        current["playtime"] = current["playtime"].astype("float32")
+        current = current.sort_values("key", ignore_index = True) # Stable Order so Unchanged Runs Compare Equal
+
+        previous = self.latest()
+        snapshot = current.merge(previous, on = "key", how = "left", suffixes = ("", "_previous"))
+        if previous.empty: # Baseline: Playtime Before the First Snapshot is Unattributed
+            snapshot["delta"] = 0.0
+        else:
+            # New Games Were Played Since the Previous Snapshot; Resets Never Count as Negative Hours
+            snapshot["delta"] = (snapshot["playtime"] - snapshot["playtime_previous"].fillna(0)).clip(lower = 0)
+            snapshot = snapshot[snapshot["playtime"] != snapshot["playtime_previous"]]
+
+        # Latest Playtime is Committed by the Workflow: Rewritten Only When Its Contents Change
+        os.makedirs(self.history_dir, exist_ok = True)
+        if not current.equals(previous):
+            current.to_parquet(os.path.join(self.history_dir, self.LATEST_FILE), index = False)
+        if snapshot.empty:
+            return 0
+
+        snapshot_at = _utc(snapshot_at if snapshot_at is not None else pd.Timestamp.now(tz = "UTC"))
+        snapshot = snapshot.assign(snapshot_at = snapshot_at.floor("s"), delta = snapshot["delta"].astype("float32"))
+        snapshot = snapshot.reindex(columns = self.COLUMNS)
+        written = len(snapshot)
+
+        # Parquet Files are Immutable: Rewrite the Current Month's Partition with the New Rows Appended
+        path = self._partitionPath(snapshot_at.tz_localize(None).to_period("M"))
+        if os.path.exists(path):
+            snapshot = pd.concat([pd.read_parquet(path), snapshot], ignore_index = True)
+        snapshot.to_parquet(path, index = False)
+        return written
+
+    def read(self, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None, columns: Optional[list] = None) -> pd.DataFrame:
+        """Read Snapshot Rows in [start, end), Touching Only Overlapping Monthly Partitions (Naive Bounds are UTC)"""
+        start, end = _utc(start), _utc(end)
+        columns = list(dict.fromkeys(["snapshot_at"] + (columns or self.COLUMNS)))
+
+        frames = []
+        for period in self._partitions():
+            if (start is not None) and (period.end_time < start.tz_localize(None)):
+                continue
+            if (end is not None) and (period.start_time >= end.tz_localize(None)):
+                continue
+            frames.append(pd.read_parquet(self._partitionPath(period), columns = columns))
+
+        if not frames:
+            return pd.DataFrame(columns = columns)
+
+        snapshots = pd.concat(frames, ignore_index = True)
+        mask = pd.Series(True, index = snapshots.index)
+        if start is not None:
+            mask &= snapshots["snapshot_at"] >= start
+        if end is not None:
+            mask &= snapshots["snapshot_at"] < end
+        return snapshots[mask].reset_index(drop = True)
+
+    def deltas(self, granularity: str = "daily", start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None, by_game: bool = False) -> pd.DataFrame:
+        """Hours Played per Period (and per Game if by_game) in [start, end)"""
+        freq = self.PERIODS.get(granularity.lower())
+        if freq is None:
+            print(f"Unknown Playtime Granularity '{granularity}' (Expected One of {list(self.PERIODS)})")
+            return pd.DataFrame()
+
+        snapshots = self.read(start, end, columns = ["key", "delta"] if by_game else ["delta"])
+        if snapshots.empty:
+            return pd.DataFrame(columns = ["period"] + (["key"] if by_game else []) + ["hours"])
+
+        periods = snapshots["snapshot_at"].dt.tz_localize(None).dt.to_period(freq).dt.start_time.rename("period")
+        groups = [periods, snapshots["key"]] if by_game else [periods]
+        hours = snapshots["delta"].astype("float64").groupby(groups).sum().round(2).rename("hours")
+        return hours.reset_index()
@@ -0,0 +1,251 @@
+"""
+Spec Templates
+Author: Muntakim Rahman
+Description: Compile-Once Vega-Lite Layout Templates for Data-Only Refreshes.
+    A Layout is Built Through Altair Once and Compiled to a Template with Named Dataset Slots
+    (Plus Value Slots for Data-Dependent Titles / Scales). Later Runs Serialize Only the Fresh
+    Datasets into Those Slots, Skipping Altair Construction and Schema Validation.
+
+    Templates are Keyed by a Layout Fingerprint (Dashboard Source + Layout Config + Slot Names),
+    so the Full Altair Path Runs Again Only When Layout Code Changes.
+
+    Responsive Layout JSONs Can Also Share Datasets (DASHBOARD_DATASETS = shared | inline, Default shared):
+    Each Layout Refers to Datasets by Name and the Records are Written Once to a Compact Data File,
+    which the React Dashboards Merge Back into the Spec Before Rendering.
+"""
+
+# Import Packages
+import pandas as pd
+import altair as alt
+from altair.utils.data import to_values
+
+import copy
+import hashlib
+import inspect
+import json
+import os
+
+from typing import Any, Optional
+
+TEMPLATE_VERSION = 1 # Bump When Template File Layout Changes
+
+def toRecords(df: pd.DataFrame) -> list:
+    """Serialize DataFrame Exactly as Altair Inlines It (Sanitized Records)"""
+    return to_values(df)["values"]
+
+def datasetName(values: list) -> str:
+    """Content-Hash Dataset Name (Same Scheme Altair Uses for Top-Level Datasets)"""
+    if values == [{}]:
+        return "empty"
+    values_json = json.dumps(values, sort_keys = True, default = str)
+    return "data-" + hashlib.sha256(values_json.encode()).hexdigest()[:32]
+
+def layoutFingerprint(*parts: Any) -> str:
+    """Hash of Layout Code / Config (Classes and Functions Contribute Their Source)"""
+    digest = hashlib.sha1(f"v{TEMPLATE_VERSION}|altair {alt.__version__}".encode())
+    for part in parts:
+        if inspect.isclass(part) or inspect.isfunction(part):
+            part = inspect.getsource(part)
+        digest.update(json.dumps(part, sort_keys = True, default = str).encode())
+    return digest.hexdigest()[:16]
+
+def contentFingerprint(layout_fingerprint: str, datasets: dict, values: Optional[dict] = None, **options: Any) -> str:
+    """Hash of Everything a Layout's Output Depends On (Layout Code / Config + Slot Data + Output Options)"""
+    digest = hashlib.sha1(layout_fingerprint.encode())
+    digest.update(json.dumps([datasets, values or {}, options], sort_keys = True, default = str).encode())
+    return digest.hexdigest()[:16]
+
+def sharedDatasetsEnabled() -> bool:
+    """Layout JSONs Refer to a Shared Data File (DASHBOARD_DATASETS = shared) vs Embed Datasets (inline)"""
+    mode = os.getenv("DASHBOARD_DATASETS", "shared").strip().lower()
+    if mode not in {"shared", "inline"}:
+        print(f"Warning: Unknown DASHBOARD_DATASETS '{mode}' (Expected shared | inline) - Using shared")
+        return True
+    return mode == "shared"
+
+def splitDatasets(spec: dict, shared: dict) -> dict:
+    """Move Spec Datasets into shared (Keyed by Content Name). Returned Spec Refers to Them by Name Only."""
+    datasets = spec.get("datasets")
+    if not datasets:
+        return spec
+
+    renames = {}
+    for key, records in datasets.items():
+        name = datasetName(records)
+        if name != key:
+            renames[key] = name
+        shared.setdefault(name, records)
+    return {key: _renameRefs(value, renames) for key, value in spec.items() if key != "datasets"}
+
+def readDatasets(path: str) -> dict:
+    """Shared Data File Written Alongside the Layouts (Empty if Missing / Unreadable)"""
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding = "utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"Warning: Unreadable Shared Datasets {path} ({e})")
+        return {}
+
+def _strings(node: Any, found: set) -> set:
+    """Every String Value in node (Dataset References Included)"""
+    if isinstance(node, dict):
+        for child in node.values():
+            _strings(child, found)
+    elif isinstance(node, list):
+        for child in node:
+            _strings(child, found)
+    elif isinstance(node, str):
+        found.add(node)
+    return found
+
+def joinDatasets(spec: dict, shared: dict) -> dict:
+    """Inverse of splitDatasets: Re-Attach the Shared Datasets a Spec Refers To"""
+    if "datasets" in spec:
+        return spec
+    referenced = _strings(spec, set())
+    return {**spec, "datasets": {name: records for name, records in shared.items() if name in referenced}}
+
+def _findPaths(node: Any, target: Any, path: list, found: list) -> None:
+    """Collect JSON Paths Where node == target (Dataset Values Excluded)"""
+    if node == target:
+        found.append(list(path))
+        return
+    if isinstance(node, dict):
+        for key, child in node.items():
+            if (not path) and (key == "datasets"):
+                continue
+            _findPaths(child, target, path + [key], found)
+    elif isinstance(node, list):
+        for i, child in enumerate(node):
+            _findPaths(child, target, path + [i], found)
+
+def _ambiguousPaths(paths: list) -> bool:
+    """Value Found Under Different Keys (e.g. 'subtitle' and 'text'): It Also Coincides with Unrelated Spec Nodes"""
+    return len({path[-1] for path in paths}) > 1
+
+def _renameRefs(node: Any, renames: dict) -> Any:
+    """Replace Dataset Name References (data.name, _cardData, ...) Throughout Spec"""
+    if isinstance(node, dict):
+        return {key: _renameRefs(child, renames) for key, child in node.items()}
+    if isinstance(node, list):
+        return [_renameRefs(child, renames) for child in node]
+    if isinstance(node, str):
+        return renames.get(node, node)
+    return node
+
+class TemplateStore:
+    """Compiled Layout Templates Stored as {root}/{name}.json"""
+
+    def __init__(self, root: str):
+        self.root = root
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.root, f"{name}.json")
+
+    def _load(self, name: str, fingerprint: str) -> Optional[dict]:
+        """Template for Layout, or None if Missing / Compiled from Different Layout Code"""
+        path = self._path(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding = "utf-8") as f:
+                template = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Unreadable Template {path} ({e}) - Recompiling")
+            return None
+        return template if template.get("fingerprint") == fingerprint else None
+
+    def compile(self, name: str, fingerprint: str, spec: dict, datasets: dict, values: Optional[dict] = None) -> bool:
+        """Compile Altair-Built Spec into Template with Named Slots
+
+        Args:
+            datasets: Slot Name -> Records (Same Records Altair Inlined into spec)
+            values: Slot Name -> Data-Dependent Value Embedded in spec (Titles, Scale Domains, ...)
+
+        Returns False (No Template Written) if Any Slot Cannot be Located in spec.
+        """
+        values = values or {}
+        spec_datasets = spec.get("datasets", {})
+
+        slots = {}
+        for slot, records in datasets.items():
+            key = datasetName(records)
+            if key not in spec_datasets:
+                print(f"Warning: Dataset Slot '{slot}' Not Found in '{name}' Spec - Template Not Compiled")
+                return False
+            if key in slots.values():
+                print(f"Warning: Dataset Slot '{slot}' Shares Content with Another Slot in '{name}' - Template Not Compiled")
+                return False
+            slots[slot] = key
+
+        # Value Slots are Located by Equality, so Only Distinctive Values (Non-Empty Strings / Lists) Found Under
+        # One Spec Key are Trusted; Anything That Could Coincide with Another Node Keeps the Altair Path
+        value_paths = {}
+        claimed = set()
+        for slot, value in values.items():
+            if not (isinstance(value, (str, list)) and value):
+                print(f"Warning: Value Slot '{slot}' in '{name}' is Not a Distinctive String / List - Template Not Compiled")
+                return False
+            paths = []
+            _findPaths(spec, value, [], paths)
+            if not paths:
+                print(f"Warning: Value Slot '{slot}' Not Found in '{name}' Spec - Template Not Compiled")
+                return False
+            keys = {tuple(path) for path in paths}
+            if _ambiguousPaths(paths) or (keys & claimed):
+                print(f"Warning: Value Slot '{slot}' Matches Unrelated Nodes in '{name}' Spec - Template Not Compiled")
+                return False
+            claimed |= keys
+            value_paths[slot] = paths
+
+        # Slot Datasets are Stored Empty (Filled on Render); Static Datasets Kept as-is
+        slot_keys = set(slots.values())
+        template_spec = dict(spec)
+        template_spec["datasets"] = {
+            key: ([] if key in slot_keys else records) for key, records in spec_datasets.items()
+        }
+
+        os.makedirs(self.root, exist_ok = True)
+        with open(self._path(name), "w", encoding = "utf-8") as f:
+            json.dump({
+                "fingerprint": fingerprint,
+                "slots": slots,
+                "values": value_paths,
+                "spec": template_spec,
+            }, f, ensure_ascii = False)
+        return True
+
+    def render(self, name: str, fingerprint: str, datasets: dict, values: Optional[dict] = None) -> Optional[dict]:
+        """Fill Template Slots with Fresh Data. Returns None if No Current Template (Caller Builds via Altair)."""
+        template = self._load(name, fingerprint)
+        if template is None:
+            return None
+
+        values = values or {}
+        if (set(template["slots"]) != set(datasets)) or (set(template["values"]) != set(values)):
+            return None
+
+        slot_by_key = {key: slot for slot, key in template["slots"].items()}
+        renames = {}
+        fresh_datasets = {}
+        for key, records in template["spec"]["datasets"].items():
+            if key in slot_by_key:
+                records = datasets[slot_by_key[key]]
+                renames[key] = datasetName(records)
+                key = renames[key]
+            fresh_datasets.setdefault(key, records)
+
+        # Rebuild in Template Key Order so Output Matches the Altair Path
+        spec = {
+            k: (fresh_datasets if k == "datasets" else _renameRefs(v, renames))
+            for k, v in template["spec"].items()
+        }
+        for slot, paths in template["values"].items():
+            for path in paths:
+                node = spec
+                for step in path[:-1]:
+                    node = node[step]
+                node[path[-1]] = copy.deepcopy(values[slot])
+        return spec
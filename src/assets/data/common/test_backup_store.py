@@ -0,0 +1,65 @@
+"""
+Backup Store Tests
+Author: Muntakim Rahman
+Description: Typed Feather Backups Round-Trip Dtypes and Profile Metadata, Project Columns and Survive Overwrites While Mapped.
+"""
+
+# Import Packages
+import os
+import pandas as pd
+
+from backup_store import readBackup, writeBackup
+
+SCHEMA = {"appid": "int32", "name": "str", "playtime_forever": "float64", "achievements_total": "int16"}
+
+def _stats() -> pd.DataFrame:
+    return pd.DataFrame({
+        "appid": pd.Series([72850, 10], dtype = "int32"),
+        "name": pd.Series(["Skyrim", "Counter-Strike"], dtype = "str"),
+        "playtime_forever": [120.25, 3.5],
+        "achievements_total": pd.Series([75, 0], dtype = "int16"),
+        "rtime_last_played": [1767225600, 0], # Undeclared: Arrow-Inferred Type
+    })
+
+def test_round_trip_keeps_dtypes_and_profile(tmp_path):
+    path = str(tmp_path / "SteamData.feather")
+    writeBackup(path, _stats(), SCHEMA, {"player_level": 42})
+
+    stats_df, profile = readBackup(path)
+    pd.testing.assert_frame_equal(stats_df, _stats())
+    assert profile == {"player_level": 42}
+    assert "player_level" not in stats_df.columns # Profile Lives in Metadata, Not on Every Row
+
+def test_declared_schema_downcasts(tmp_path):
+    path = str(tmp_path / "SteamData.feather")
+    writeBackup(path, _stats().astype({"appid": "int64", "achievements_total": "int64"}), SCHEMA)
+
+    stats_df, profile = readBackup(path)
+    assert stats_df["appid"].dtype == "int32"
+    assert stats_df["achievements_total"].dtype == "int16"
+    assert profile == {}
+
+def test_projection_reads_only_requested_columns(tmp_path):
+    path = str(tmp_path / "SteamData.feather")
+    writeBackup(path, _stats(), SCHEMA)
+
+    stats_df, _ = readBackup(path, columns = ["appid", "playtime_forever", "not_stored"])
+    assert list(stats_df.columns) == ["appid", "playtime_forever"]
+
+def test_mixed_object_column_stored_as_strings(tmp_path):
+    path = str(tmp_path / "SteamData.feather")
+    writeBackup(path, _stats().assign(img_icon_url = pd.Series(["abc123", 0], dtype = object)), SCHEMA)
+
+    stats_df, _ = readBackup(path)
+    assert stats_df["img_icon_url"].tolist() == ["abc123", "0"]
+
+def test_overwrite_while_memory_mapped(tmp_path):
+    path = str(tmp_path / "SteamData.feather")
+    writeBackup(path, _stats(), SCHEMA, {"player_level": 1})
+    mapped_df, _ = readBackup(path) # Zero-Copy Buffers Still Reference the File
+
+    writeBackup(path, mapped_df.assign(playtime_forever = mapped_df["playtime_forever"] + 1), SCHEMA, {"player_level": 2})
+    stats_df, profile = readBackup(path)
+    assert stats_df["playtime_forever"].tolist() == [121.25, 4.5]
+    assert profile == {"player_level": 2}
+    assert os.listdir(tmp_path) == ["SteamData.feather"] # Staging File Swapped In
@@ -0,0 +1,86 @@
+"""
+Export Stage Tests
+Author: Muntakim Rahman
+Description: Parallel and Serial Exports Write Identical Artifacts; the Manifest Skips Unchanged Inputs.
+"""
+
+# Import Packages
+import json
+import os
+import pytest
+
+from export_stage import ExportStage, svgSize, writeBreakpointManifest
+from vega_render import getRenderer
+
+SPEC = {
+    "$schema": "https://vega.github.io/schema/vega-lite/v5.20.1.json",
+    "data": {"values": [{"game": "Skyrim", "hours": 120.5}, {"game": "Doom", "hours": 30.0}]},
+    "mark": "bar",
+    "encoding": {"x": {"field": "game", "type": "nominal"}, "y": {"field": "hours", "type": "quantitative"}},
+    "width": 120,
+    "height": 80,
+}
+
+def _export(directory, max_workers: int, manifest = None, fingerprint = None) -> ExportStage:
+    exports = ExportStage(max_workers = max_workers, manifest = manifest)
+    for ext in ("json", "html", "svg", "png"):
+        exports.add(os.path.join(directory, f"Dashboard.{ext}"), SPEC, fingerprint = fingerprint, indent = 2)
+    exports.run()
+    return exports
+
+def test_parallel_matches_serial(tmp_path):
+    serial, parallel = tmp_path / "serial", tmp_path / "parallel"
+    serial.mkdir(), parallel.mkdir()
+    _export(str(serial), max_workers = 1)
+    _export(str(parallel), max_workers = 2)
+
+    for name in sorted(os.listdir(serial)):
+        assert (serial / name).read_bytes() == (parallel / name).read_bytes(), name
+    assert json.loads((serial / "Dashboard.json").read_text()) == SPEC
+
+def test_manifest_skips_unchanged_inputs(tmp_path):
+    manifest = str(tmp_path / "Templates" / "manifest.json")
+    paths = [str(tmp_path / f"Dashboard.{ext}") for ext in ("json", "html", "svg", "png")]
+
+    assert not ExportStage(manifest = manifest).isCurrent(paths, "fp-1") # Nothing Written Yet
+    _export(str(tmp_path), max_workers = 1, manifest = manifest, fingerprint = "fp-1")
+    written = {path: os.stat(path).st_mtime_ns for path in paths}
+
+    exports = ExportStage(manifest = manifest)
+    assert exports.isCurrent(paths, "fp-1")
+    assert sorted(exports.skipped) == sorted(os.path.basename(path) for path in paths)
+    assert not ExportStage(manifest = manifest).isCurrent(paths, "fp-2") # Inputs Changed
+    assert {path: os.stat(path).st_mtime_ns for path in paths} == written
+
+    os.remove(paths[0]) # Deleted Artifact is Never Current
+    assert not ExportStage(manifest = manifest).isCurrent(paths, "fp-1")
+
+def test_manifest_untouched_when_entries_unchanged(tmp_path):
+    manifest = str(tmp_path / "manifest.json")
+    _export(str(tmp_path), max_workers = 1, manifest = manifest, fingerprint = "fp-1")
+    before = os.stat(manifest).st_mtime_ns
+
+    exports = ExportStage(manifest = manifest)
+    exports.run() # Nothing Queued
+    assert os.stat(manifest).st_mtime_ns == before
+
+def test_breakpoint_manifest_lists_svg_sizes(tmp_path):
+    _export(str(tmp_path), max_workers = 1)
+    svg = str(tmp_path / "Dashboard.svg")
+    width, height = svgSize(svg)
+
+    path = tmp_path / "Breakpoints.json"
+    writeBreakpointManifest(str(path), {"Standard": svg, "Portrait": str(tmp_path / "Missing.svg")})
+    assert json.loads(path.read_text()) == {"Standard": {"svg": "Dashboard.svg", "width": int(width), "height": int(height)}}
+
+def test_parallel_renders_compile_in_parent(tmp_path):
+    compiles = getRenderer().stats["compiles"]
+    getRenderer().clear()
+    _export(str(tmp_path), max_workers = 2) # Workers Receive Compiled Vega
+    assert getRenderer().stats["compiles"] == compiles + 1
+
+def test_unsupported_format(tmp_path):
+    exports = ExportStage(max_workers = 1)
+    exports.add(str(tmp_path / "Dashboard.pdf"), SPEC)
+    with pytest.raises(ValueError):
+        exports.run()
@@ -0,0 +1,62 @@
+"""
+API Fixture Tests
+Author: Muntakim Rahman
+Description: Record / Replay Round-Trip Through FixtureProxy, Secret Stripping and Missing Fixtures.
+"""
+
+# Import Packages
+import json
+import os
+import pytest
+
+from fixtures import FixtureMissing, FixtureStore
+
+class FakeClient:
+    """Stands in for a Spotify / Steam / PSN Client"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def getOwned(self, steam_id, key = None):
+        self.calls += 1
+        return {"games": [{"appid": 72850, "playtime_forever": 6000}], "steam_id": steam_id}
+
+def test_record_then_replay_round_trip(tmp_path):
+    live = FakeClient()
+    recorded = FixtureStore("record", root = str(tmp_path)).wrap(live, "steam").getOwned("765", key = "SECRET")
+
+    # Replay Needs No Client (or Credentials): Same Call, Same Response
+    replayed = FixtureStore("replay", root = str(tmp_path)).wrap(None, "steam").getOwned("765", key = "OTHER")
+    assert replayed == recorded
+    assert live.calls == 1
+
+def test_secrets_never_written(tmp_path):
+    FixtureStore("record", root = str(tmp_path)).wrap(FakeClient(), "steam").getOwned("765", key = "SECRET")
+
+    fixture_dir = tmp_path / "v1" / "steam"
+    (fixture,) = os.listdir(fixture_dir)
+    assert "SECRET" not in (fixture_dir / fixture).read_text()
+    assert json.loads((tmp_path / "v1" / "manifest.json").read_text())["version"] == 1
+
+def test_replay_without_fixture_raises(tmp_path):
+    proxy = FixtureStore("replay", root = str(tmp_path)).wrap(None, "steam")
+    with pytest.raises(FixtureMissing):
+        proxy.getOwned("unrecorded")
+
+def test_live_mode_leaves_client_unwrapped(tmp_path):
+    client = FakeClient()
+    assert FixtureStore("live", root = str(tmp_path)).wrap(client, "steam") is client
+    assert not os.listdir(tmp_path)
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        FixtureStore("mock")
+
+def test_from_env(monkeypatch, tmp_path):
+    monkeypatch.setenv("DASHBOARD_FIXTURES", " Replay ")
+    monkeypatch.setenv("DASHBOARD_FIXTURES_DIR", str(tmp_path))
+    monkeypatch.setenv("DASHBOARD_FIXTURES_LATENCY_MS", "25")
+
+    store = FixtureStore.fromEnv()
+    assert store.offline and (store.latency_ms == 25.0)
+    assert store.root == os.path.join(str(tmp_path), "v1")
@@ -0,0 +1,127 @@
+"""
+HTTP Transport Tests
+Author: Muntakim Rahman
+Description: Retry / Backoff on 429 and 5xx, Retry-After Handling and Endpoint Stats (No Network: Scripted Adapter).
+"""
+
+# Import Packages
+import pytest
+import requests
+import threading
+import time
+from requests.adapters import HTTPAdapter
+
+from http_transport import PooledTransport, TokenBucket
+
+class ScriptedAdapter(HTTPAdapter):
+    """Answers Each Request with the Next Scripted (Status, Headers) or Raises a Scripted Exception"""
+
+    def __init__(self, script: list):
+        super().__init__()
+        self.script = list(script)
+        self.timeouts = []
+
+    def send(self, request, **kwargs):
+        self.timeouts.append(kwargs.get("timeout"))
+        step = self.script.pop(0)
+        if isinstance(step, Exception):
+            raise step
+        status, headers = step
+        response = requests.Response()
+        response.status_code = status
+        response.headers.update(headers)
+        response.url = request.url
+        response.request = request
+        response._content = b"{}"
+        return response
+
+@pytest.fixture
+def sleeps(monkeypatch) -> list:
+    """Record Backoff Sleeps Instead of Waiting"""
+    slept = []
+    monkeypatch.setattr("http_transport.time.sleep", slept.append)
+    return slept
+
+def _transport(script: list, **kwargs) -> tuple:
+    transport = PooledTransport(**kwargs)
+    adapter = ScriptedAdapter(script)
+    transport.mount("https://", adapter)
+    return transport, adapter
+
+def test_retries_honour_retry_after_then_backoff(sleeps):
+    transport, adapter = _transport([(429, {"Retry-After": "3"}), (503, {}), (200, {})], backoff = 0.5)
+
+    response = transport.get("https://api.steampowered.com/IPlayerService/GetOwnedGames/v1/")
+    assert response.status_code == 200
+    assert sleeps == [3.0, 1.0] # Retry-After, Then backoff * 2 ** attempt
+    assert adapter.timeouts == [transport.timeout] * 3
+
+    stats = transport.stats()
+    assert stats.loc["api.steampowered.com/IPlayerService/GetOwnedGames/v1/", "retries"] == 2
+
+def test_retry_after_capped(sleeps):
+    transport, _ = _transport([(429, {"Retry-After": "600"}), (200, {})], max_retry_after = 60.0)
+    transport.get("https://api.spotify.com/v1/me/tracks")
+    assert sleeps == [60.0]
+
+def test_gives_up_after_max_retries(sleeps):
+    transport, _ = _transport([(500, {})] * 3, max_retries = 2)
+    assert transport.get("https://api.spotify.com/v1/me").status_code == 500
+    assert len(sleeps) == 2
+
+def test_connection_errors_retried_then_raised(sleeps):
+    transport, _ = _transport([requests.ConnectionError("reset")] * 2, max_retries = 1)
+    with pytest.raises(requests.ConnectionError):
+        transport.get("https://api.spotify.com/v1/me")
+    assert transport.stats()["retries"].sum() == 1
+
+def test_post_5xx_not_retried(sleeps):
+    transport, adapter = _transport([(500, {}), (200, {})])
+    assert transport.post("https://accounts.spotify.com/api/token").status_code == 500
+    assert (sleeps == []) and (len(adapter.script) == 1) # Second Response Never Requested
+
+def test_post_retried_only_on_429_with_retry_after(sleeps):
+    transport, _ = _transport([(429, {"Retry-After": "2"}), (200, {})])
+    assert transport.post("https://accounts.spotify.com/api/token").status_code == 200
+    assert sleeps == [2.0]
+
+    transport, _ = _transport([(429, {}), (200, {})])
+    assert transport.post("https://accounts.spotify.com/api/token").status_code == 429
+
+def test_post_connection_error_not_retried(sleeps):
+    transport, adapter = _transport([requests.ConnectionError("reset"), (200, {})])
+    with pytest.raises(requests.ConnectionError):
+        transport.post("https://accounts.spotify.com/api/token")
+    assert len(adapter.script) == 1
+
+def test_allowed_methods_override(sleeps):
+    transport, _ = _transport([(503, {}), (200, {})], allowed_methods = {"get", "post"})
+    assert transport.post("https://accounts.spotify.com/api/token").status_code == 200
+
+def test_token_bucket_waits_when_empty(monkeypatch):
+    slept = []
+    monkeypatch.setattr("http_transport.time.sleep", slept.append)
+    bucket = TokenBucket(rate = 1000.0, capacity = 1)
+
+    assert bucket.acquire() == 0.0
+    bucket.acquire() # Bucket Drained: Must Wait for a Refill
+    assert slept and (slept[0] > 0)
+
+def test_token_bucket_paces_concurrent_callers():
+    rate, callers = 100.0, 8
+    bucket = TokenBucket(rate = rate, capacity = 1)
+    granted = []
+
+    def call():
+        bucket.acquire()
+        granted.append(time.monotonic())
+
+    threads = [threading.Thread(target = call) for _ in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # One Token Up Front, Then One per 1 / rate Seconds Shared Across Every Thread (No Double Grants)
+    assert len(granted) == callers
+    assert max(granted) - min(granted) >= 0.9 * (callers - 1) / rate
@@ -0,0 +1,72 @@
+"""
+Play History Tests
+Author: Muntakim Rahman
+Description: Append / Read Round-Trip, Cursor Deduplication and Monthly Partition Boundaries.
+"""
+
+# Import Packages
+import os
+import pandas as pd
+import pytest
+
+from play_history import PlayHistory
+
+def _plays(*played_at: str) -> pd.DataFrame:
+    """Recently Played Rows (ISO played_at, Newest First as Spotify Returns Them)"""
+    return pd.DataFrame({
+        "played_at": list(played_at),
+        "id": [f"t{i}" for i in range(len(played_at))],
+        "track": [f"Song {i}" for i in range(len(played_at))],
+        "artists": ["Arijit Singh, Pritam"] * len(played_at),
+        "album": ["Not Stored"] * len(played_at),
+    })[::-1].reset_index(drop = True)
+
+@pytest.fixture
+def history(tmp_path) -> PlayHistory:
+    history = PlayHistory(str(tmp_path / "Tester_PlayHistory"))
+    history.append(_plays("2026-01-31T23:59:59.500Z", "2026-02-01T00:00:00Z", "2026-02-14T08:30:00.123Z"))
+    return history
+
+def test_round_trip(history):
+    plays = history.read()
+    assert list(plays.columns) == PlayHistory.COLUMNS
+    assert plays["played_at"].tolist() == [
+        pd.Timestamp("2026-01-31 23:59:59.500", tz = "UTC"),
+        pd.Timestamp("2026-02-01 00:00:00", tz = "UTC"),
+        pd.Timestamp("2026-02-14 08:30:00.123", tz = "UTC"), # Millisecond Precision Kept
+    ]
+    assert plays["track"].tolist() == ["Song 0", "Song 1", "Song 2"]
+    assert plays["artists"].eq("Arijit Singh, Pritam").all()
+    assert history.lastPlayedAt() == pd.Timestamp("2026-02-14 08:30:00.123", tz = "UTC")
+
+def test_append_skips_plays_at_or_before_cursor(history):
+    overlap = _plays("2026-02-14T08:30:00.123Z", "2026-02-14T09:00:00Z", "2026-02-14T09:00:00Z")
+    assert history.append(overlap) == 1
+    assert history.append(overlap) == 0
+    assert len(history.read()) == 4
+
+def test_partition_boundary(history):
+    assert sorted(os.listdir(history.history_dir)) == ["2026-01.csv", "2026-02.csv"]
+
+    january = history.read(end = "2026-02-01") # Naive Bounds are UTC; end is Exclusive
+    assert january["track"].tolist() == ["Song 0"]
+
+    february = history.read(start = pd.Timestamp("2026-02-01", tz = "UTC"))
+    assert february["track"].tolist() == ["Song 1", "Song 2"]
+
+    shifted = history.read(start = pd.Timestamp("2026-01-31 19:00", tz = "US/Eastern")) # = 2026-02-01 00:00 UTC
+    assert shifted["track"].tolist() == ["Song 1", "Song 2"]
+
+def test_read_touches_only_overlapping_partitions(history, monkeypatch):
+    read = []
+    original = pd.read_csv
+    monkeypatch.setattr(pd, "read_csv", lambda path, **kwargs: read.append(path) or original(path, **kwargs))
+
+    history.read(start = "2026-02-01")
+    assert [os.path.basename(path) for path in read] == ["2026-02.csv"]
+
+def test_empty_log(tmp_path):
+    history = PlayHistory(str(tmp_path / "Empty"))
+    assert history.lastPlayedAt() is None
+    assert history.read().empty
+    assert history.append(_plays()) == 0
@@ -0,0 +1,79 @@
+"""
+Playtime History Tests
+Author: Muntakim Rahman
+Description: Snapshot Appends (Baseline, Changed-Only, Resets, Naive Timestamps) and Per-Period Deltas.
+"""
+
+# Import Packages
+import os
+import pandas as pd
+import pytest
+
+from playtime_history import PlaytimeHistory
+
+def _stats(**playtime) -> pd.DataFrame:
+    """stats_df with appid Keys ('g1' -> 1) and Cumulative Hours"""
+    return pd.DataFrame({
+        "appid": [int(key[1:]) for key in playtime],
+        "playtime_forever": list(playtime.values()),
+    })
+
+@pytest.fixture
+def history(tmp_path) -> PlaytimeHistory:
+    history = PlaytimeHistory(str(tmp_path / "history"), key = "appid")
+    history.append(_stats(g1 = 10.0, g2 = 5.0), pd.Timestamp("2026-01-30 12:00", tz = "UTC")) # Baseline
+    history.append(_stats(g1 = 12.5, g2 = 5.0), pd.Timestamp("2026-01-31 09:00", tz = "UTC"))
+    history.append(_stats(g1 = 13.0, g2 = 8.0, g3 = 1.0), pd.Timestamp("2026-02-02 18:00", tz = "UTC"))
+    return history
+
+def test_baseline_then_changed_games_only(history):
+    rows = history.read()
+    assert len(rows) == 2 + 1 + 3 # Baseline Stores Every Game; Later Snapshots Only Changes
+    assert rows.loc[rows["snapshot_at"] == pd.Timestamp("2026-01-30 12:00", tz = "UTC"), "delta"].eq(0).all()
+    assert history.append(_stats(g1 = 13.0, g2 = 8.0, g3 = 1.0), pd.Timestamp("2026-02-03", tz = "UTC")) == 0
+
+def test_naive_snapshot_is_utc(tmp_path):
+    history = PlaytimeHistory(str(tmp_path), key = "appid")
+    history.append(_stats(g1 = 1.0), pd.Timestamp("2026-03-01 08:00"))
+    assert history.append(_stats(g1 = 2.0), pd.Timestamp("2026-03-01 09:30")) == 1
+    assert history.read()["snapshot_at"].tolist() == [
+        pd.Timestamp("2026-03-01 08:00", tz = "UTC"), pd.Timestamp("2026-03-01 09:30", tz = "UTC"),
+    ]
+
+def test_reset_never_counts_negative(tmp_path):
+    history = PlaytimeHistory(str(tmp_path), key = "appid")
+    history.append(_stats(g1 = 10.0), pd.Timestamp("2026-03-01", tz = "UTC"))
+    history.append(_stats(g1 = 4.0), pd.Timestamp("2026-03-02", tz = "UTC"))
+    assert history.deltas("daily")["hours"].sum() == 0
+
+def test_deltas_by_period(history):
+    daily = history.deltas("daily")
+    assert daily["hours"].tolist() == [0.0, 2.5, 4.5]
+
+    monthly = history.deltas("monthly")
+    assert dict(zip(monthly["period"].dt.month, monthly["hours"])) == {1: 2.5, 2: 4.5}
+
+def test_deltas_by_game_in_range(history):
+    february = history.deltas("monthly", start = "2026-02-01", end = "2026-03-01", by_game = True)
+    assert dict(zip(february["key"], february["hours"])) == {1: 0.5, 2: 3.0, 3: 1.0}
+
+def test_read_touches_only_overlapping_partitions(history, monkeypatch):
+    read = []
+    original = pd.read_parquet
+    monkeypatch.setattr(pd, "read_parquet", lambda path, **kwargs: read.append(path) or original(path, **kwargs))
+
+    history.read(start = "2026-02-01")
+    assert [path.rsplit("/", 1)[-1] for path in read] == ["2026-02.parquet"]
+
+def test_unknown_granularity(history):
+    assert history.deltas("hourly").empty
+
+def test_latest_rewritten_only_on_change(history):
+    latest = os.path.join(history.history_dir, PlaytimeHistory.LATEST_FILE)
+    before = os.stat(latest).st_mtime_ns
+
+    history.append(_stats(g3 = 1.0, g1 = 13.0, g2 = 8.0), pd.Timestamp("2026-02-04", tz = "UTC")) # Same Playtime, Other Order
+    assert os.stat(latest).st_mtime_ns == before
+
+    history.append(_stats(g1 = 13.0, g2 = 8.0), pd.Timestamp("2026-02-05", tz = "UTC")) # Game Dropped
+    assert history.latest()["key"].tolist() == [1, 2]
@@ -0,0 +1,59 @@
+"""
+Spec Template Tests
+Author: Muntakim Rahman
+Description: Compiled Templates Render the Same Spec as Altair, Reject Ambiguous Value Slots and Round-Trip Shared Datasets.
+"""
+
+# Import Packages
+import altair as alt
+import pandas as pd
+
+from spec_template import TemplateStore, datasetName, joinDatasets, splitDatasets, toRecords
+
+def _chart(df: pd.DataFrame, subtitle: str, axis_title: str = "Hours") -> dict:
+    """Small Layout with One Dataset Slot and One Value Slot (Title Subtitle)"""
+    return alt.Chart(df).mark_bar().encode(
+        x = alt.X("game:N"),
+        y = alt.Y("hours:Q", title = axis_title),
+    ).properties(title = alt.TitleParams("Playtime", subtitle = subtitle)).to_dict()
+
+def _slots(df: pd.DataFrame, subtitle: str) -> tuple:
+    return {"games": toRecords(df)}, {"subtitle": subtitle}
+
+FIRST = pd.DataFrame({"game": ["Skyrim", "Doom"], "hours": [120.5, 30.0]})
+SECOND = pd.DataFrame({"game": ["Skyrim", "Doom", "Halo"], "hours": [125.0, 30.0, 12.25]})
+
+def test_render_matches_altair(tmp_path):
+    store = TemplateStore(str(tmp_path))
+    assert store.compile("layout", "fp", _chart(FIRST, "Total: 150.5 Hrs"), *_slots(FIRST, "Total: 150.5 Hrs"))
+
+    rendered = store.render("layout", "fp", *_slots(SECOND, "Total: 167.25 Hrs"))
+    assert rendered == _chart(SECOND, "Total: 167.25 Hrs")
+
+def test_render_needs_matching_fingerprint_and_slots(tmp_path):
+    store = TemplateStore(str(tmp_path))
+    store.compile("layout", "fp", _chart(FIRST, "Total"), *_slots(FIRST, "Total"))
+
+    assert store.render("layout", "changed", *_slots(SECOND, "Total")) is None
+    assert store.render("layout", "fp", {"games": toRecords(SECOND)}, {}) is None
+
+def test_value_coinciding_with_other_node_is_not_compiled(tmp_path):
+    # Subtitle Happens to Equal the Axis Title: Patching by Equality Would Also Rewrite the Axis
+    store = TemplateStore(str(tmp_path))
+    spec = _chart(FIRST, "Hours", axis_title = "Hours")
+    assert not store.compile("layout", "fp", spec, *_slots(FIRST, "Hours"))
+    assert store.render("layout", "fp", *_slots(SECOND, "Total")) is None
+
+def test_scalar_value_slot_is_not_compiled(tmp_path):
+    store = TemplateStore(str(tmp_path))
+    spec = _chart(FIRST, "Total")
+    assert not store.compile("layout", "fp", spec, {"games": toRecords(FIRST)}, {"count": 2})
+
+def test_shared_datasets_round_trip():
+    spec = _chart(FIRST, "Total")
+    shared = {}
+    split = splitDatasets(spec, shared)
+
+    assert "datasets" not in split
+    assert list(shared) == [datasetName(toRecords(FIRST))]
+    assert joinDatasets(split, {**shared, "data-unused": [{"x": 1}]}) == spec
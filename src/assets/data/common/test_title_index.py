@@ -0,0 +1,62 @@
+"""
+Title Index Tests
+Author: Muntakim Rahman
+Description: normalizeTitle Pairs That Must (and Must Not) Share a Game Key, Plus TitleIndex Aliases / Lookups.
+"""
+
+# Import Packages
+import pandas as pd
+import pytest
+
+from title_index import TitleIndex, normalizeTitle
+
+SAME_GAME = [
+    ("Horizon Zero Dawn™", "Horizon Zero Dawn"),
+    ("Batman™: Arkham Knight", "batman arkham knight"),
+    ("Pokémon Legends: Arceus", "Pokemon Legends Arceus"),
+    ("The Witcher 3: Wild Hunt - Game of the Year Edition", "The Witcher 3: Wild Hunt"),
+    ("Batman: Arkham City GOTY", "Batman: Arkham City"),
+    ("Sleeping Dogs: Definitive Edition", "Sleeping Dogs"),
+    ("Fallout 4: Game of the Year Edition", "Fallout 4"),
+    ("Skyrim – Special Edition", "Skyrim"),
+    ("Halo: The Master Chief Collection  ", "HALO: the master chief collection"),
+    ("Tomb Raider: 20th Anniversary Edition", "Tomb Raider"),
+]
+
+DIFFERENT_GAMES = [
+    ("Doom (2016)", "Doom"),
+    ("Tomb Raider (2013)", "Tomb Raider"),
+    ("BioShock Remastered", "BioShock"),
+    ("The Elder Scrolls IV: Oblivion Remastered", "The Elder Scrolls IV: Oblivion"),
+    ("Tomb Raider: Anniversary", "Tomb Raider"),
+    ("Mass Effect 2 (2010) Edition", "Mass Effect 2 (2010)"),
+    ("Dark Souls II", "Dark Souls III"),
+    ("Halo: Reach", "Halo"),
+    ("Final Fantasy VII Remake", "Final Fantasy VII"),
+    ("Crash Bandicoot N. Sane Trilogy", "Crash Bandicoot"),
+]
+
+@pytest.mark.parametrize("title, other", SAME_GAME)
+def test_same_game_shares_key(title, other):
+    assert normalizeTitle(title) == normalizeTitle(other)
+
+@pytest.mark.parametrize("title, other", DIFFERENT_GAMES)
+def test_different_games_keep_distinct_keys(title, other):
+    assert normalizeTitle(title) != normalizeTitle(other)
+
+def test_aliases_pair_titles_normalization_keeps_apart():
+    index = TitleIndex(aliases = {"Mass Effect 2 (2010) Edition": "Mass Effect 2 (2010)"})
+    assert index.key("Mass Effect 2 (2010) Edition") == index.key("Mass Effect 2 (2010)")
+    assert index.key("Doom (2016)") != index.key("Doom")
+
+def test_add_maps_platform_ids_to_keys():
+    index = TitleIndex()
+    steam_df = pd.DataFrame({"appid": [1, 2], "name": ["Horizon Zero Dawn™", "Doom"], "playtime_forever": [10.0, 2.0]})
+    psn_df = pd.DataFrame({"title_id": ["PPSA1"], "name": ["Horizon Zero Dawn"], "playtime_forever": [5.0]})
+
+    rows = index.add("steam", steam_df, "appid")
+    index.add("psn", psn_df, "title_id")
+
+    assert list(rows.columns) == ["key", "name", "playtime_forever"]
+    assert index.keyFor("steam", 1) == index.keyFor("psn", "PPSA1") == "horizon zero dawn"
+    assert index.keyFor("psn", "missing") is None
@@ -0,0 +1,50 @@
+"""
+Vega Precompile Tests
+Author: Muntakim Rahman
+Description: Pruned Vega Renders Identically to the Unpruned Compile (Shipped Spotify Layouts) and Drops Only Defaults / Unused Config.
+"""
+
+# Import Packages
+import json
+import os
+import pytest
+import vl_convert as vlc
+
+from spec_template import joinDatasets, readDatasets
+from vega_precompile import SHIPPED_VL_VERSION, compileVega, pruneVega
+
+CHARTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "spotify", "Charts")
+LAYOUTS = ["Standard", "Tablet", "TabletPortrait", "Landscape", "Portrait"]
+
+def _shipped(label: str) -> dict:
+    """Shipped Spotify Layout with Its Shared Datasets Joined Back In"""
+    with open(os.path.join(CHARTS, f"Muntakim_{label}.json"), "r", encoding = "utf-8") as f:
+        spec = json.load(f)
+    return joinDatasets(spec, readDatasets(os.path.join(CHARTS, "Muntakim_Datasets.json")))
+
+@pytest.mark.parametrize("label", LAYOUTS)
+def test_pruned_vega_renders_identical_svg(label):
+    spec = {key: value for key, value in _shipped(label).items() if not key.startswith("_")}
+    unpruned = vlc.vegalite_to_vega(spec, vl_version = SHIPPED_VL_VERSION)
+    pruned, _ = compileVega(spec)
+
+    assert len(json.dumps(pruned)) < len(json.dumps(unpruned))
+    assert vlc.vega_to_svg(pruned) == vlc.vega_to_svg(unpruned)
+
+def test_prune_drops_only_defaults():
+    vega = pruneVega({
+        "autosize": "pad", "padding": 5,
+        "marks": [{"type": "rect", "clip": False, "zindex": 1, "interactive": 0}], # 0 is Not the Boolean Default
+        "axes": [{"orient": "bottom", "grid": False, "zindex": 0}],
+        "config": {"axisX": {"labelFontSize": 8}, "legend": {"orient": "top"}, "rect": {"fill": "red"}, "arc": {"fill": "blue"},
+            "style": {"cell": {"stroke": None}, "unused": {"fill": "green"}}},
+        "style": "cell",
+    })
+
+    assert vega == {
+        "padding": 5,
+        "marks": [{"type": "rect", "zindex": 1, "interactive": 0}],
+        "axes": [{"orient": "bottom"}],
+        "config": {"axisX": {"labelFontSize": 8}, "rect": {"fill": "red"}, "style": {"cell": {"stroke": None}}},
+        "style": "cell",
+    }
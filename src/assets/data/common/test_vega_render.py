@@ -0,0 +1,35 @@
+"""
+Vega Render Tests
+Author: Muntakim Rahman
+Description: Vega-Lite Version Matches Altair's chart.save(), Compiles are Cached Until clear(), Renders from Compiled Vega.
+"""
+
+# Import Packages
+import altair as alt
+
+from vega_render import VegaRenderer, vlVersion
+
+SPEC = {
+    "data": {"values": [{"game": "Skyrim", "hours": 120.5}, {"game": "Doom", "hours": 30.0}]},
+    "mark": "bar",
+    "encoding": {"x": {"field": "game", "type": "nominal"}, "y": {"field": "hours", "type": "quantitative"}},
+}
+
+def test_vl_version_follows_altair_schema():
+    assert alt.SCHEMA_VERSION.lstrip("v").startswith(vlVersion() + ".")
+
+def test_compile_cached_until_clear():
+    renderer = VegaRenderer()
+    assert renderer.compile(SPEC) is renderer.compile(dict(SPEC)) # Same Content, One Compile
+    assert renderer.stats["compiles"] == 1
+
+    renderer.clear()
+    renderer.compile(SPEC)
+    assert renderer.stats["compiles"] == 2
+
+def test_render_from_compiled_vega_matches_spec_render():
+    renderer = VegaRenderer()
+    vega = renderer.compile(SPEC)
+    assert renderer.renderSvg(vega) == renderer.svg(SPEC)
+    assert renderer.renderPng(vega, scale = 2) == renderer.png(SPEC, scale = 2)
+    assert renderer.stats["compiles"] == 1
@@ -0,0 +1,89 @@
+"""
+Title Index
+Author: Muntakim Rahman
+Description: Canonical Game Keys for Cross-Platform (Steam / PSN) Matching.
+    Store Titles Differ in Trademark Symbols, Case, Diacritics and Edition Suffixes
+    ("Horizon Zero Dawn™", "... Game of the Year Edition", "...: Definitive Edition"),
+    so Each Distinct Title is Normalized Once per Run to a Game Key and Every Platform ID
+    (Steam appid, PSN title_id) is Mapped to That Key. Platforms are Then Joined on the Key.
+"""
+
+# Import Packages
+import pandas as pd
+
+import difflib
+import re
+import unicodedata
+
+from typing import Optional
+
+TRADEMARKS = str.maketrans("", "", "\u2122\u00ae\u00a9") # ™ ® © (NFKD Would Spell ™ Out as "TM")
+
+# Trailing Edition Markers Only ("... GOTY Edition", "...: Definitive Edition"). Years, "Remastered" and
+# Bare Words Like "Complete" are Kept: They Distinguish Different Games ("Doom" vs "Doom (2016)"), so Such
+# Pairs Go in the Caller's Alias Table Instead.
+EDITION_SUFFIX = re.compile(
+    r"[\s:\-\u2013\u2014]*(?:"
+    r"(?:game\s+of\s+the\s+year|goty|definitive|complete|enhanced|ultimate|deluxe|digital\s+deluxe|special|standard|gold"
+    r"|(?:\d+(?:st|nd|rd|th)\s+)?anniversary)\s+edition"
+    r"|game\s+of\s+the\s+year|goty"
+    r")$"
+)
+PUNCTUATION = re.compile(r"[^\w\s]")
+WHITESPACE = re.compile(r"\s+")
+
+def normalizeTitle(title: str) -> str:
+    """Game Key: No ™/®/©, Case and Diacritics Folded, Edition Suffixes Dropped, Punctuation Collapsed"""
+    key = unicodedata.normalize("NFKD", str(title).translate(TRADEMARKS))
+    key = "".join(char for char in key if not unicodedata.combining(char)).casefold()
+    key = WHITESPACE.sub(" ", key).strip()
+
+    key = EDITION_SUFFIX.sub("", key).strip()
+    return WHITESPACE.sub(" ", PUNCTUATION.sub(" ", key)).strip()
+
+class TitleIndex:
+    """Store Title / Platform ID -> Canonical Game Key, Built Once per Run"""
+
+    def __init__(self, aliases: Optional[dict] = None):
+        self.titles: dict = {} # Title -> Game Key (Each Distinct Title Normalized Once)
+        self.ids: dict = {} # (Platform, ID) -> Game Key
+        self.platforms: dict = {} # Platform -> Set of Game Keys
+
+        # Titles Whose Stores Disagree Beyond Normalization (Alias -> Title It Should Match)
+        self.aliases = {normalizeTitle(alias): normalizeTitle(title) for alias, title in (aliases or {}).items()}
+
+    def key(self, title: str) -> str:
+        """Game Key for a Store Title"""
+        if title not in self.titles:
+            key = normalizeTitle(title)
+            self.titles[title] = self.aliases.get(key, key)
+        return self.titles[title]
+
+    def add(self, platform: str, stats_df: pd.DataFrame, id_column: str) -> pd.DataFrame:
+        """Register a Platform's Titles. Returns (key, name, playtime_forever) Rows for Joining."""
+        if stats_df.empty or ('name' not in stats_df.columns):
+            self.platforms[platform] = set()
+            return pd.DataFrame(columns = ['key', 'name', 'playtime_forever'])
+
+        keys = stats_df['name'].map({title: self.key(title) for title in stats_df['name'].unique()})
+        if id_column in stats_df.columns:
+            self.ids.update(zip(((platform, game_id) for game_id in stats_df[id_column]), keys))
+        self.platforms[platform] = set(keys)
+
+        return pd.DataFrame({'key': keys, 'name': stats_df['name'], 'playtime_forever': stats_df['playtime_forever']})
+
+    def keyFor(self, platform: str, game_id) -> Optional[str]:
+        """Game Key for a Platform ID (Steam appid / PSN title_id)"""
+        return self.ids.get((platform, game_id))
+
+    def nearDuplicates(self, platform: str, other: str, cutoff: float = 0.8) -> list:
+        """(Key, Closest Other-Platform Key, Similarity) for Unmatched Keys That Nearly Match"""
+        left = sorted(self.platforms.get(platform, set()) - self.platforms.get(other, set()))
+        right = sorted(self.platforms.get(other, set()) - self.platforms.get(platform, set()))
+
+        matches = []
+        for key in left:
+            close = difflib.get_close_matches(key, right, n = 1, cutoff = cutoff)
+            if close:
+                matches.append((key, close[0], round(difflib.SequenceMatcher(None, key, close[0]).ratio(), 2)))
+        return matches
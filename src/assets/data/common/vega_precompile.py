@@ -0,0 +1,149 @@
+"""
+Vega Precompile
+Author: Muntakim Rahman
+Description: Build-Time Vega-Lite -> Vega Compilation for Shipped Layout JSONs.
+    The Site Ships Vega-Lite, so Every Visitor's Browser Runs the Vega-Lite Compiler Before Rendering.
+    With DASHBOARD_PRECOMPILE = 1 the Exporters Also Write {name}.vg.json: the Same Layout Compiled
+    to Vega (Vega-Lite Version Matching the Shipped $schema), with Unused Config and Properties That
+    Restate Vega Defaults Pruned. Each Write Prints a Size / Parse-Time Comparison for the Layout.
+"""
+
+# Import Packages
+import vl_convert as vlc
+
+import json
+import os
+import time
+
+from typing import Any, Optional
+
+SHIPPED_VL_VERSION = "5.20" # Layout JSONs Declare Vega-Lite v5.20.1 (react-vega 7 / Vega 5 Runtime)
+VEGA_SUFFIX = ".vg.json"
+
+# Properties Equal to Vega's Own Default, per Parent Key (Safe to Drop; Output Renders Identically)
+VEGA_DEFAULTS = {
+    "axes": {"zindex": 0, "grid": False},
+    "legends": {"zindex": 0},
+    "marks": {"interactive": True, "clip": False, "zindex": 0},
+    "layout": {"bounds": "full"},
+    "transform": {"offset": "zero"}, # Stack Offset
+}
+TOP_LEVEL_DEFAULTS = {"autosize": "pad", "padding": 0}
+
+# Config Sections Only Read When the Spec Has the Matching Component
+CONFIG_COMPONENTS = {"axes": "axis", "legends": "legend", "title": "title"}
+MARK_TYPES = {"arc", "area", "image", "group", "line", "path", "rect", "rule", "shape", "symbol", "text", "trail"}
+
+def precompileEnabled() -> bool:
+    """DASHBOARD_PRECOMPILE = 1 Emits Compiled Vega Alongside Each Layout JSON"""
+    return os.getenv("DASHBOARD_PRECOMPILE", "0").strip().lower() in {"1", "true", "yes"}
+
+def vegaPath(path: str) -> str:
+    """Compiled Vega Path for a Vega-Lite Layout JSON ({name}.json -> {name}.vg.json)"""
+    return os.path.splitext(path)[0] + VEGA_SUFFIX
+
+def _collect(node: Any, key: str, found: list) -> None:
+    """All Values Stored Under key Anywhere in node"""
+    if isinstance(node, dict):
+        for child_key, child in node.items():
+            if child_key == key:
+                found.append(child)
+            _collect(child, key, found)
+    elif isinstance(node, list):
+        for child in node:
+            _collect(child, key, found)
+
+def _pruneDefaults(node: Any, parent: Optional[str] = None) -> Any:
+    """Drop Properties Restating Vega Defaults (Keyed by the List / Object They Live In)"""
+    if isinstance(node, list):
+        return [_pruneDefaults(child, parent) for child in node]
+    if not isinstance(node, dict):
+        return node
+
+    defaults = VEGA_DEFAULTS.get(parent, {})
+    return {
+        key: _pruneDefaults(child, key)
+        for key, child in node.items()
+        if not ((key in defaults) and (child == defaults[key]) and (type(child) is type(defaults[key])))
+    }
+
+def _pruneConfig(vega: dict) -> None:
+    """Drop Config Sections for Components / Marks / Styles the Spec Never Uses"""
+    config = vega.get("config")
+    if not config:
+        vega.pop("config", None)
+        return
+
+    body = {key: value for key, value in vega.items() if key != "config"}
+    for component, prefix in CONFIG_COMPONENTS.items():
+        found = []
+        _collect(body, component, found)
+        if not found:
+            for key in [key for key in config if key.startswith(prefix)]:
+                del config[key]
+
+    mark_types = []
+    _collect(body.get("marks", []), "type", mark_types)
+    for key in [key for key in config if (key in MARK_TYPES) and (key not in mark_types)]:
+        del config[key]
+
+    if "style" in config:
+        used = set()
+        styles = []
+        _collect(body, "style", styles)
+        for style in styles:
+            used.update(style if isinstance(style, list) else [style])
+        config["style"] = {name: value for name, value in config["style"].items() if name in used}
+        if not config["style"]:
+            del config["style"]
+
+    if not config:
+        del vega["config"]
+
+def pruneVega(vega: dict) -> dict:
+    """Compiled Vega Without Unused Config or Default-Valued Properties"""
+    vega = _pruneDefaults(vega)
+    for key, default in TOP_LEVEL_DEFAULTS.items():
+        if vega.get(key) == default:
+            del vega[key]
+    _pruneConfig(vega)
+    return vega
+
+_WARM = False
+
+def compileVega(spec: dict) -> tuple:
+    """Vega-Lite Layout -> Pruned Vega. Returns (Vega, Compile Seconds)."""
+    global _WARM
+    if not _WARM: # First Compile per Version Loads the Compiler; Keep It Out of the Report
+        vlc.vegalite_to_vega({"mark": "point"}, vl_version = SHIPPED_VL_VERSION)
+        _WARM = True
+
+    # Custom Top-Level Fields (e.g. _cardData) are React-Only
+    spec = {key: value for key, value in spec.items() if not key.startswith("_")}
+    start = time.perf_counter()
+    vega = vlc.vegalite_to_vega(spec, vl_version = SHIPPED_VL_VERSION)
+    return pruneVega(vega), time.perf_counter() - start
+
+def _parseMs(text: str, repeats: int = 5) -> float:
+    """Best-of JSON Parse Time (Proxy for the Browser's Parse Cost)"""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        json.loads(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+def writeVega(spec: dict, path: str) -> None:
+    """Compile, Prune and Write {name}.vg.json; Print Size / Parse-Time vs the Vega-Lite Layout"""
+    vega, compile_seconds = compileVega(spec)
+    vega_json = json.dumps(vega, separators = (",", ":"), ensure_ascii = False)
+    with open(path, "w", encoding = "utf-8") as f:
+        f.write(vega_json)
+
+    lite_json = json.dumps(spec, separators = (",", ":"), ensure_ascii = False)
+    print(
+        f"Precompiled {os.path.basename(path)}: "
+        f"Vega-Lite {len(lite_json) / 1024:.1f} KB -> Vega {len(vega_json) / 1024:.1f} KB | "
+        f"Parse {_parseMs(lite_json):.2f} -> {_parseMs(vega_json):.2f} ms | "
+        f"Vega-Lite Compile {compile_seconds * 1000:.0f} ms Moved to Build"
+    )
@@ -3,7 +3,7 @@ Games Dashboard Generator
 Author: Muntakim Rahman
 Description: Combines PlayStation Network and Steam gaming data for the same player,
     merging playtime for cross-platform games and generating unified Altair visualizations.
-    Loads from CSV backups (steam/, psn/) or fetches live from both APIs.
+    Loads from typed backups (steam/, psn/) or fetches live from both APIs.
     Dashboard exported as JSON (Standard, Tablet, Landscape, Portrait), HTML, PNG, SVG.
 """
 
@@ -12,6 +12,7 @@ import pandas as pd
 import altair as alt
 
 import json
+import time
 import os
 import sys
 from dotenv import load_dotenv
@@ -23,19 +24,28 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 
 sys.path.insert(0, os.path.join(current_dir, 'steam'))
 sys.path.insert(0, os.path.join(current_dir, 'psn'))
+sys.path.insert(0, os.path.join(current_dir, '..', 'common'))
 
 from steam import SteamUser, SteamAPI
 from psn import PSN_User, PSN_API
+from fixtures import FixtureStore
+from http_transport import getTransport
+from export_stage import ExportStage, writeBreakpointManifest
+from vega_precompile import precompileEnabled, vegaPath
+from title_index import TitleIndex
+from spec_template import TemplateStore, contentFingerprint, joinDatasets, layoutFingerprint, readDatasets, sharedDatasetsEnabled, splitDatasets, toRecords
 
 PWD = os.path.dirname(os.path.abspath(__file__))
 
 class Games_User:
     """Combines PSN and Steam Gaming Data for the Same Player"""
 
-    # Games with Different Store Names on Each Platform after Custom Name Mapping.
-    # Key = Steam Custom Name, Value = PSN Custom Name (Label Kept in Combined Data).
+    # Same Game Under Names That Still Differ after Title Normalization (See title_index.py), Across or Within Stores.
+    # Key = Alias, Value = Name It Matches (PSN Custom Name for Cross-Platform Titles; Label Kept in Combined Data).
+    # Years and "Remastered" are Not Normalized Away, so Re-Listings of One Game are Paired Here Explicitly.
     CROSS_PLATFORM_NAMES = {
         'SoS: A Wonderful Life': 'Harvest Moon: AWL',
+        'Mass Effect 2 (2010) Edition': 'Mass Effect 2 (2010)', # Steam Re-Listing after Legendary Edition
     }
 
     def __init__(self, steam_user: SteamUser, psn_user: PSN_User):
@@ -44,28 +54,39 @@ class Games_User:
 
         # Combined Data
         self.combined_df = pd.DataFrame()
+        self.title_index = TitleIndex(aliases = self.CROSS_PLATFORM_NAMES)
 
         self._merge()
 
     def _merge(self) -> None:
-        """Merge Steam and PSN Game Data, Summing Playtime for Cross-Platform Titles"""
-        steam_df = self.steam_user.stats_df[['name', 'playtime_forever']].copy()
-        psn_df   = self.psn_user.stats_df[['name',  'playtime_forever']].copy()
-
-        # Remap Steam-Side Aliases to PSN Label so Groupby Merges Them
-        for steam_name, psn_name in self.CROSS_PLATFORM_NAMES.items():
-            steam_df.loc[steam_df['name'] == steam_name, 'name'] = psn_name
+        """Join Steam and PSN Game Data on Canonical Game Key, Summing Playtime for Cross-Platform Titles"""
+        steam_df = self.title_index.add('steam', self.steam_user.stats_df, 'appid')
+        psn_df   = self.title_index.add('psn', self.psn_user.stats_df, 'title_id')
+
+        # One Row per Game Key per Platform; Label from the Most-Played Entry
+        def _byKey(df: pd.DataFrame) -> pd.DataFrame:
+            return (
+                df.sort_values('playtime_forever', ascending = False, kind = 'stable')
+                .groupby('key', sort = False)
+                .agg(name = ('name', 'first'), playtime_forever = ('playtime_forever', 'sum'))
+            )
 
-        combined = pd.concat([steam_df, psn_df], ignore_index = True)
+        joined = _byKey(steam_df).join(_byKey(psn_df), how = 'outer', lsuffix = '_steam', rsuffix = '_psn')
 
         self.combined_df = (
-            combined
-            .groupby('name', as_index = False)['playtime_forever']
-            .sum()
+            pd.DataFrame({
+                'name': joined['name_psn'].fillna(joined['name_steam']).str.strip(), # PSN Label Kept for Cross-Platform Titles
+                'playtime_forever': joined['playtime_forever_steam'].fillna(0) + joined['playtime_forever_psn'].fillna(0),
+            })
             .sort_values('playtime_forever', ascending = False)
             .reset_index(drop = True)
         )
 
+        cross_platform = joined['name_steam'].notna() & joined['name_psn'].notna()
+        print(f"Title Index: {len(steam_df)} Steam + {len(psn_df)} PSN Entries -> {len(joined)} Games ({cross_platform.sum()} Cross-Platform)")
+        for steam_key, psn_key, similarity in self.title_index.nearDuplicates('steam', 'psn'):
+            print(f"Unmatched Near-Duplicate: '{steam_key}' (Steam) ~ '{psn_key}' (PSN) [{similarity}] - Add to CROSS_PLATFORM_NAMES if Same Game")
+
     def getTopData(self, n: int = 10) -> pd.DataFrame:
         """Get Top N Games by Combined Playtime"""
         return (
@@ -86,6 +107,7 @@ class Games_Dashboard:
     """Creates Unified Visualizations for Combined PSN + Steam Data"""
 
     # Responsive Layout Configurations — Scaled per Breakpoint
+    # pie.top_n is the Breakpoint's Data Budget: Games Beyond It are Dropped Before Serializing (Shares Stay Relative to Standard)
     BREAKPOINTS = {
         'Standard': { # Desktop (> 1200px)
             'view':            {'continuousWidth': 300,  'continuousHeight': 300},
@@ -94,7 +116,7 @@ class Games_Dashboard:
             'level':           {'width': 150,  'height': 150, 'fontSize': 60, 'y': 50,  'titleFontSize': 18},
             'played':          {'width': 300,  'height': 150, 'fontSize': 80, 'y': 50,  'titleFontSize': 20},
             'trophy_bar':      {'width': 250,  'height': 150, 'labelFontSize': 13, 'titleFontSize': 20, 'subtitleFontSize': 14},
-            'pie':             {'width': 700,  'height': 400, 'titleFontSize': 26, 'subtitleFontSize': 16},
+            'pie':             {'width': 700,  'height': 400, 'titleFontSize': 26, 'subtitleFontSize': 16, 'top_n': 10},
             'stats_title':     30,
             'dashboard_title': 40,
             # Keep padding small — MacBook Air (~1280–1440px) clips with 250px sides
@@ -107,7 +129,7 @@ class Games_Dashboard:
             'level':           {'width': 100,  'height': 120, 'fontSize': 50, 'y': 40,  'titleFontSize': 16},
             'played':          {'width': 200,  'height': 120, 'fontSize': 70, 'y': 40,  'titleFontSize': 18},
             'trophy_bar':      {'width': 200,  'height': 120, 'labelFontSize': 11, 'titleFontSize': 18, 'subtitleFontSize': 12},
-            'pie':             {'width': 400,  'height': 320, 'titleFontSize': 22, 'subtitleFontSize': 15},
+            'pie':             {'width': 400,  'height': 320, 'titleFontSize': 22, 'subtitleFontSize': 15, 'top_n': 10},
             'stats_title':     22,
             'dashboard_title': 28,
             'padding':         {'left': 40,  'right': 40,  'top': 10, 'bottom': 10},
@@ -119,7 +141,7 @@ class Games_Dashboard:
             'level':           {'width': 65,   'height': 60,  'fontSize': 16, 'y': 35,  'titleFontSize': 12},
             'played':          {'width': 130,  'height': 60,  'fontSize': 20, 'y': 45,  'titleFontSize': 16},
             'trophy_bar':      {'width': 110,  'height': 60,  'labelFontSize': 7,  'titleFontSize': 12, 'subtitleFontSize': 9},
-            'pie':             {'width': 130,  'height': 130, 'titleFontSize': 18, 'subtitleFontSize': 13},
+            'pie':             {'width': 130,  'height': 130, 'titleFontSize': 18, 'subtitleFontSize': 13, 'top_n': 6},
             'stats_title':     18,
             'dashboard_title': 18,
             'padding':         {'left': 10,  'right': 10,  'top': 0,  'bottom': 0},
@@ -131,7 +153,7 @@ class Games_Dashboard:
             'level':           {'width': 50,   'height': 40,  'fontSize': 11, 'y': 25,  'titleFontSize': 9},
             'played':          {'width': 100,  'height': 40,  'fontSize': 13, 'y': 30,  'titleFontSize': 10},
             'trophy_bar':      {'width': 85,   'height': 45,  'labelFontSize': 5,  'titleFontSize': 8,  'subtitleFontSize': 7},
-            'pie':             {'width': 90,   'height': 90,  'titleFontSize': 12, 'subtitleFontSize': 10},
+            'pie':             {'width': 90,   'height': 90,  'titleFontSize': 12, 'subtitleFontSize': 10, 'top_n': 5},
             'stats_title':     12,
             'dashboard_title': 14,
             'padding':         {'left': 10,  'right': 10,  'top': 0,  'bottom': 0},
@@ -147,8 +169,58 @@ class Games_Dashboard:
             "#20B2AA", "#E91E63", "#006400"
         ]
 
-        self.dashboard = None
-        self.generateDashboard()
+        self.dashboard = None # Built on Demand (generateDashboard / Template Miss in save)
+
+    def _playtimeRows(self, top_n: int = 10) -> pd.DataFrame:
+        """Top Games with Share of Standard Top-N Playtime (%), Cut to top_n After the Shares are Taken"""
+        share_n = self.BREAKPOINTS['Standard']['pie']['top_n']
+        top_df = self.user.getTopData(max(top_n, share_n)).copy()
+        total  = top_df['playtime_forever'].head(share_n).sum()
+        top_df['playtime_percentage'] = (top_df['playtime_forever'] / total * 100).round(2)
+        return top_df.head(top_n)
+
+    def _playtimeSubtitle(self) -> str:
+        """Pie Subtitle (Data-Dependent, Patched into Templates)"""
+        return f'Total Playtime: {self.user.getTotalPlaytime():.1f} Hrs'
+
+    @staticmethod
+    def _metricRow(metric: str, value) -> pd.DataFrame:
+        """Single-Row Frame Backing a Big-Number Display"""
+        return pd.DataFrame({'Metric': [metric], 'Value': [value]})
+
+    def _trophyRows(self) -> pd.DataFrame:
+        """PSN Trophy Counts by Type (Zero Counts Dropped)"""
+        trophy_df = pd.DataFrame([
+            {'type': 'Platinum', 'count': self.user.psn_user.trophy_counts.get('platinum', 0)},
+            {'type': 'Gold',     'count': self.user.psn_user.trophy_counts.get('gold',     0)},
+            {'type': 'Silver',   'count': self.user.psn_user.trophy_counts.get('silver',   0)},
+            {'type': 'Bronze',   'count': self.user.psn_user.trophy_counts.get('bronze',   0)},
+        ])
+
+        # Remove Trophy Types with Zero Count
+        return trophy_df[trophy_df['count'] > 0]
+
+    @staticmethod
+    def _trophySubtitle(trophy_df: pd.DataFrame) -> str:
+        """Trophy Subtitle (Data-Dependent, Patched into Templates)"""
+        return f"Total: {trophy_df['count'].sum():,}"
+
+    def _layoutSlots(self, cfg: Optional[dict] = None) -> tuple:
+        """Fresh Datasets and Data-Dependent Values for a Breakpoint (Pandas Only; Default Standard)"""
+        cfg = cfg or self.BREAKPOINTS['Standard']
+        trophy_df = self._trophyRows()
+        datasets = {
+            'steam_level': toRecords(self._metricRow('Steam Level', self.user.steam_user.player_level)),
+            'psn_level':   toRecords(self._metricRow('PSN Level', self.user.psn_user.trophy_level)),
+            'played':      toRecords(self._metricRow('Played', self.user.getNumberPlayed())),
+            'trophies':    toRecords(trophy_df),
+            'games':       toRecords(self._playtimeRows(cfg['pie']['top_n'])),
+        }
+        values = {
+            'playtime_subtitle': self._playtimeSubtitle(),
+            'trophy_subtitle':   self._trophySubtitle(trophy_df),
+        }
+        return datasets, values
 
     def _buildDashboard(self, cfg: dict) -> alt.Chart:
         """Build Complete Dashboard for a Given Breakpoint Config"""
@@ -158,10 +230,8 @@ class Games_Dashboard:
         ic  = cfg['pie']        # Pie Chart Config
         lgd = cfg['legend']     # Legend Config (None for Small Breakpoints)
 
-        # Pie Chart
-        top_df = self.user.getTopData(10).copy()
-        total  = top_df['playtime_forever'].sum()
-        top_df['playtime_percentage'] = (top_df['playtime_forever'] / total * 100).round(2)
+        # Pie Chart (Cut to Breakpoint's Data Budget)
+        top_df = self._playtimeRows(ic['top_n'])
 
         playtime_chart = alt.Chart(top_df).mark_arc(
             stroke = 'black', strokeWidth = 1
@@ -190,7 +260,7 @@ class Games_Dashboard:
             width  = ic['width'], height = ic['height'],
             title  = alt.TitleParams(
                 text             = 'Top Games',
-                subtitle         = f'Total Playtime: {self.user.getTotalPlaytime():.1f} Hrs',
+                subtitle         = self._playtimeSubtitle(),
                 anchor           = 'middle',
                 fontSize         = ic['titleFontSize'],
                 subtitleFontSize = ic['subtitleFontSize']
@@ -198,7 +268,7 @@ class Games_Dashboard:
         )
 
         # Steam Level Display
-        steam_data  = pd.DataFrame({'Metric': ['Steam Level'], 'Value': [self.user.steam_user.player_level]})
+        steam_data  = self._metricRow('Steam Level', self.user.steam_user.player_level)
         steam_level = alt.Chart(steam_data).mark_text(
             align = 'center', baseline = 'middle',
             fontSize = lc['fontSize'], fontWeight = 'bold', color = '#141331'
@@ -212,7 +282,7 @@ class Games_Dashboard:
         )
 
         # PSN Level Display
-        psn_data  = pd.DataFrame({'Metric': ['PSN Level'], 'Value': [self.user.psn_user.trophy_level]})
+        psn_data  = self._metricRow('PSN Level', self.user.psn_user.trophy_level)
         psn_level = alt.Chart(psn_data).mark_text(
             align = 'center', baseline = 'middle',
             fontSize = lc['fontSize'], fontWeight = 'bold', color = '#141331'
@@ -226,7 +296,7 @@ class Games_Dashboard:
         )
 
         # Played Display
-        played_data = pd.DataFrame({'Metric': ['Played'], 'Value': [self.user.getNumberPlayed()]})
+        played_data = self._metricRow('Played', self.user.getNumberPlayed())
         played      = alt.Chart(played_data).mark_text(
             align = 'center', baseline = 'middle',
             fontSize = pc['fontSize'], fontWeight = 'bold', color = '#141331'
@@ -240,16 +310,7 @@ class Games_Dashboard:
         )
 
         # PSN Trophies Bar Chart
-        trophy_df = pd.DataFrame([
-            {'type': 'Platinum', 'count': self.user.psn_user.trophy_counts.get('platinum', 0)},
-            {'type': 'Gold',     'count': self.user.psn_user.trophy_counts.get('gold',     0)},
-            {'type': 'Silver',   'count': self.user.psn_user.trophy_counts.get('silver',   0)},
-            {'type': 'Bronze',   'count': self.user.psn_user.trophy_counts.get('bronze',   0)},
-        ])
-
-        # Remove Trophy Types with Zero Count
-        trophy_df      = trophy_df[trophy_df['count'] > 0]
-        total_trophies = trophy_df['count'].sum()
+        trophy_df = self._trophyRows()
 
         psn_trophies = alt.Chart(trophy_df).mark_bar(
             stroke = 'black', strokeWidth = 1
@@ -276,7 +337,7 @@ class Games_Dashboard:
             width  = tc['width'], height = tc['height'],
             title  = alt.TitleParams(
                 text             = 'PSN Trophies',
-                subtitle         = f'Total: {total_trophies:,}',
+                subtitle         = self._trophySubtitle(trophy_df),
                 anchor           = 'middle',
                 fontSize         = tc['titleFontSize'],
                 subtitleFontSize = tc['subtitleFontSize']
@@ -314,8 +375,8 @@ class Games_Dashboard:
         """Generate Default (Standard) Dashboard"""
         self.dashboard = self._buildDashboard(self.BREAKPOINTS['Standard'])
 
-    def updateTemplate(self, template_json: dict, fresh_json: dict, output_path: str) -> None:
-        """Update Existing JSON Template with Fresh Data while Preserving Structure"""
+    def updateTemplate(self, template_json: dict, fresh_json: dict, output_path: str) -> bool:
+        """Update Existing JSON Template In-Place with Fresh Data while Preserving Structure (Caller Writes output_path)"""
         def _get_keys(current_json: dict) -> dict:
             keys = {
                 'SteamLevel': None,
@@ -353,58 +414,102 @@ class Games_Dashboard:
                 elif t_key:
                     print(f"Warning: No Fresh Data for '{key}' - Skipping Update for this Dataset")
 
-            with open(output_path, 'w') as f:
-                json.dump(template_json, f, indent = 2)
-
             print(f"Template Updated Successfully: {output_path}")
+            return True
         except Exception as e:
             print(f"Error Updating Template: {e}")
+            return False
 
     def save(self, filename: Optional[str] = None) -> None:
-        """Save Dashboard as JSON (All Breakpoints), HTML, PNG, SVG"""
-        if self.dashboard is None:
-            print("Dashboard Not Generated")
-            return
-
+        """Save Dashboard as JSON (All Breakpoints), HTML, PNG, SVG (Plus Static SVG + Size Manifest per Breakpoint)"""
         if filename is None:
             filename = f"{self.user.psn_user.username}_Games_Dashboard"
 
         if not os.path.exists(os.path.join(PWD, 'Charts')):
             os.makedirs(os.path.join(PWD, 'Charts'))
 
-        # Save Main Dashboard JSON (Standard Layout)
-        with open(os.path.join(PWD, f"Charts/{filename}.json"), 'w') as f:
-            json.dump(self.dashboard.to_dict(), f, indent = 2)
-
-        # Load Dashboard from JSON File
-        with open(os.path.join(PWD, f"Charts/{filename}.json"), 'r') as f:
-            spec = json.load(f)
-
-        self.dashboard = alt.Chart.from_dict(spec)
-
-        # Save as HTML (Interactive)
-        with open(os.path.join(PWD, f"Charts/{filename}.html"), 'w') as f:
-            f.write(self.dashboard.to_html())
+        # Fresh Datasets per Breakpoint (Cut to Each Data Budget); Main Dashboard Uses Standard
+        breakpoint_datasets = {name: self._layoutSlots(cfg)[0] for name, cfg in self.BREAKPOINTS.items()}
+        datasets, values = self._layoutSlots()
+
+        # Main Dashboard (Standard Layout): Fill Compiled Template; Altair Only Runs When Layout Code Changes
+        start = time.perf_counter()
+        templates = TemplateStore(os.path.join(PWD, 'Charts', 'Templates'))
+        exports = ExportStage(manifest = os.path.join(PWD, 'Charts', 'Templates', 'manifest.json'))
+        shared = sharedDatasetsEnabled()
+        fingerprint = layoutFingerprint(Games_Dashboard, sorted(datasets), sorted(values))
+        content = contentFingerprint(fingerprint, breakpoint_datasets, values, shared = shared)
+
+        # Breakpoint Layouts Share Datasets (Each Distinct Dataset Written Once to the Data File When Shared)
+        paths = [os.path.join(PWD, f"Charts/{filename}.{ext}") for ext in ('json', 'html', 'png', 'svg')]
+        breakpoint_paths = {name: os.path.join(PWD, f"Charts/{filename}_{name}.json") for name in self.BREAKPOINTS}
+        breakpoint_svgs = {name: os.path.join(PWD, f"Charts/{filename}_{name}.svg") for name in self.BREAKPOINTS}
+        data_path = os.path.join(PWD, f"Charts/{filename}_Datasets.json")
+        manifest_path = os.path.join(PWD, f"Charts/{filename}_Breakpoints.json")
+
+        # Unchanged Inputs: Skip Building, Rendering and Writing
+        breakpoint_vegas = {name: vegaPath(path) for name, path in breakpoint_paths.items()} if precompileEnabled() else {}
+        targets = paths + list(breakpoint_paths.values()) + list(breakpoint_svgs.values()) + list(breakpoint_vegas.values()) + ([data_path] if shared else [])
+        if exports.isCurrent(targets, content):
+            print(f"Dashboard Unchanged in {(time.perf_counter() - start) * 1000:.0f} ms - Skipping Export")
+            exports.run()
+            writeBreakpointManifest(manifest_path, breakpoint_svgs)
+            return
 
-        self.dashboard.save(os.path.join(PWD, f"Charts/{filename}.png")) # Save as PNG (Static)
-        self.dashboard.save(os.path.join(PWD, f"Charts/{filename}.svg")) # Save as SVG (Vector)
+        spec = templates.render(filename, fingerprint, datasets, values)
+        source = 'template'
+        if spec is None:
+            self.generateDashboard()
+            spec = self.dashboard.to_dict()
+            templates.compile(filename, fingerprint, spec, datasets, values)
+            source = 'altair'
+        print(f"Dashboard Spec Built in {(time.perf_counter() - start) * 1000:.0f} ms ({source})")
+
+        # Save Main Dashboard JSON (Standard Layout), HTML (Interactive), PNG (Static), SVG (Vector)
+        json_path, html_path, png_path, svg_path = paths
+        exports.add(json_path, spec, fingerprint = content, indent = 2)
+        exports.add(html_path, spec, fingerprint = content)
+        exports.add(png_path, spec, fingerprint = content)
+        exports.add(svg_path, spec, fingerprint = content)
 
         # Save Responsive JSON Variants for Each Breakpoint
+        stored_datasets = readDatasets(data_path)
+        shared_datasets = {}
         for name, cfg in self.BREAKPOINTS.items():
-            chart = self._buildDashboard(cfg)
-            path  = os.path.join(PWD, f"Charts/{filename}_{name}.json")
+            path = breakpoint_paths[name]
 
+            template_json = None
             if os.path.exists(path):
-                # Template exists — update datasets only, preserve background/structure
                 with open(path, 'r') as f:
                     template_json = json.load(f)
-                self.updateTemplate(template_json, chart.to_dict(), path)
+                if ('datasets' not in template_json) and (not stored_datasets):
+                    print(f"Warning: Shared Datasets Missing for {filename}_{name}.json - Rebuilding Layout")
+                    template_json = None
+
+            if template_json is not None:
+                # Template exists — update datasets only, preserve background/structure (No Altair Build)
+                template_json = joinDatasets(template_json, stored_datasets)
+                if not self.updateTemplate(template_json, {'datasets': breakpoint_datasets[name]}, path):
+                    continue
             else:
-                # First run — write fresh JSON
-                with open(path, 'w') as f:
-                    json.dump(chart.to_dict(), f, indent = 2)
+                # First run — build fresh JSON
+                template_json = self._buildDashboard(cfg).to_dict()
                 print(f"Saved: {filename}_{name}.json")
 
+            # Static First-Paint SVG per Breakpoint (Rendered with Datasets Inline)
+            exports.add(breakpoint_svgs[name], template_json, fingerprint = content)
+            if name in breakpoint_vegas:
+                exports.add(breakpoint_vegas[name], template_json, fingerprint = content)
+            if shared:
+                template_json = splitDatasets(template_json, shared_datasets)
+            exports.add(path, template_json, fingerprint = content, indent = 2)
+
+        # Compact Shared Data File (React Merges It Back into Each Breakpoint Spec)
+        if shared:
+            exports.add(data_path, shared_datasets, fingerprint = content, separators = (',', ':'))
+        exports.run()
+        writeBreakpointManifest(manifest_path, breakpoint_svgs)
+
 if __name__ == '__main__':
     load_dotenv(os.path.join(current_dir, 'steam', '.env'))
     load_dotenv(os.path.join(current_dir, 'psn',   '.env'))
@@ -415,13 +520,15 @@ if __name__ == '__main__':
 
     STEAM_API_KEY = os.getenv("STEAM_API_KEY")
     NPSSO_CODE = os.getenv("NPSSO_CODE")
+    FIXTURES = FixtureStore.fromEnv() # DASHBOARD_FIXTURES = record | replay for Offline Runs
 
     try:
         games_user = Games_User(
-            steam_user = SteamUser(STEAM_USERNAME, SteamAPI(STEAM_API_KEY)),
-            psn_user = PSN_User(PSN_USERNAME, PSN_API(NPSSO_CODE), use_client = USE_PSN_CLIENT)
+            steam_user = SteamUser(STEAM_USERNAME, SteamAPI(STEAM_API_KEY, fixtures = FIXTURES)),
+            psn_user = PSN_User(PSN_USERNAME, PSN_API(NPSSO_CODE, fixtures = FIXTURES), use_client = USE_PSN_CLIENT)
         )
         Games_Dashboard(games_user).save()
+        getTransport().report()
         print("Execution Completed Successfully!")
 
     except Exception as e:
@@ -3,7 +3,7 @@ PSN Dashboard Generator
 Author: Muntakim Rahman
 Description: Interacts with PlayStation Network API (via PSNAWP) to Fetch User Data
     (Played Games, Playtime, Trophies) and Generates Visualizations using Altair.
-    Data is Saved to CSV for Backup and Dashboard is Exported as JSON, HTML, PNG, SVG.
+    Data is Saved to a Typed Feather Backup and Dashboard is Exported as JSON, HTML, PNG, SVG.
 """
 
 # Import Packages
@@ -11,10 +11,13 @@ import pandas as pd
 import altair as alt
 
 import json
+import time
 import os
+import sys
 from datetime import timedelta
 from dotenv import load_dotenv
 
+from types import SimpleNamespace
 from typing import Optional
 
 from psnawp_api import PSNAWP
@@ -22,37 +25,62 @@ from psnawp_api.models.trophies import PlatformType
 
 PWD = os.path.dirname(os.path.abspath(__file__))
 
+# Resolve Shared Module Path
+sys.path.insert(0, os.path.join(PWD, '..', '..', 'common'))
+
+from backup_store import BACKUP_SUFFIX, readBackup, writeBackup
+from fixtures import FixtureStore
+from export_stage import ExportStage
+from playtime_history import PlaytimeHistory
+from vega_precompile import VEGA_SUFFIX, precompileEnabled, vegaPath
+from spec_template import TemplateStore, contentFingerprint, layoutFingerprint, toRecords
+
 class PSN_API:
     """Handles PSN API Interactions via PSNAWP"""
 
-    def __init__(self, npsso_code: str):
-        self.psnawp = PSNAWP(npsso_code)
+    def __init__(self, npsso_code: str, fixtures: Optional[FixtureStore] = None):
+        self.fixtures = fixtures or FixtureStore() # Live by Default; Record / Replay for Offline Runs
+        self.psnawp = PSNAWP(npsso_code) if not self.fixtures.offline else None # Replay Skips Authentication
+
+    def _lookupUser(self, name: str, params: dict, lookup):
+        """Resolve PSNAWP User, Recording Only its Username (Replay Returns a Stand-In)"""
+        if self.fixtures.offline:
+            return SimpleNamespace(**self.fixtures.call('psn', name, params, None))
+
+        user = lookup()
+        self.fixtures.call('psn', name, params, lambda: {'username': user.username})
+        return user
 
     def getClient(self):
         """Get Authenticated Client (Your Account)"""
-        return self.psnawp.me()
+        return self._lookupUser('me', {}, self.psnawp.me if self.psnawp else None)
 
     def getUser(self, username: str):
         """Get User by Online ID"""
         try:
-            return self.psnawp.user(username = username)
+            return self._lookupUser('user', {'username': username}, lambda: self.psnawp.user(username = username))
         except Exception as e:
             print(f"Failed to Get User {username}: {e}")
             return None
 
+    def _fetchTitleStats(self, user) -> list:
+        """Flatten PSNAWP Title Stats into JSON Rows"""
+        titles = []
+        for title in user.title_stats():
+            play_hours = title.play_duration.total_seconds() / 3600.0 if title.play_duration else 0.0 # Convert TimeDelta to Hours
+
+            titles.append({
+                'title_id': title.title_id, # Unique Identifier for the Game
+                'name': title.name, # Game Title
+                'category': str(title.category).split('.')[-1] if title.category else 'UNKNOWN', # Platform (PS4/PS5)
+                'playtime_forever': round(play_hours, 2), # Total Playtime in Hours
+            })
+        return titles
+
     def getTitleStats(self, user) -> pd.DataFrame:
         """Fetch User's Played Games with Playtime Data (PS4/PS5 Only)"""
         try:
-            titles = []
-            for title in user.title_stats():
-                play_hours = title.play_duration.total_seconds() / 3600.0 if title.play_duration else 0.0 # Convert TimeDelta to Hours
-
-                titles.append({
-                    'title_id': title.title_id, # Unique Identifier for the Game
-                    'name': title.name, # Game Title
-                    'category': str(title.category).split('.')[-1] if title.category else 'UNKNOWN', # Platform (PS4/PS5)
-                    'playtime_forever': round(play_hours, 2), # Total Playtime in Hours
-                })
+            titles = self.fixtures.call('psn', 'title_stats', {'username': user.username}, lambda: self._fetchTitleStats(user))
 
             if titles:
                 print(pd.DataFrame(titles))
@@ -66,7 +94,7 @@ class PSN_API:
 
     def getTrophySummary(self, user) -> dict:
         """Fetch User's Trophy Summary"""
-        try:
+        def fetch() -> dict:
             summary = user.trophy_summary()
             return {
                 'level': summary.trophy_level,
@@ -75,6 +103,9 @@ class PSN_API:
                 'silver': summary.earned_trophies.silver,
                 'bronze': summary.earned_trophies.bronze,
             }
+
+        try:
+            return self.fixtures.call('psn', 'trophy_summary', {'username': user.username}, fetch)
         except Exception as e:
             print(f"Failed to Get Trophy Summary: {e}")
             return {'level': 0, 'platinum': 0, 'gold': 0, 'silver': 0, 'bronze': 0}
@@ -97,6 +128,16 @@ class PSN_User:
         "Spotify"
     }
 
+    TROPHY_TYPES = ['platinum', 'gold', 'silver', 'bronze']
+
+    # Declared Backup Column Types (Arrow Aliases); Other Columns Keep Their Inferred Types
+    BACKUP_SCHEMA = {
+        'title_id': 'string',
+        'name': 'string',
+        'category': 'string',
+        'playtime_forever': 'float64',
+    }
+
     def __init__(self, username: str, api_client: PSN_API, use_client: bool = False):
         self.username = username
         self.api_client = api_client
@@ -115,12 +156,14 @@ class PSN_User:
             return df
 
         mapped_df = df.copy()
-
-        # Apply Mappings
-        for psn_name, custom_name in self.CUSTOM_NAMES.items():
-            mapped_df.loc[mapped_df['name'] == psn_name, 'name'] = custom_name
+        mapped_df['name'] = mapped_df['name'].replace(self.CUSTOM_NAMES) # Single Lookup Pass over All Mappings
         return mapped_df
 
+    @property
+    def history(self) -> PlaytimeHistory:
+        """Playtime History for Resolved Username (use_client Replaces It with the Client's Own)"""
+        return PlaytimeHistory(os.path.join(PWD, f"{self.username}_PlaytimeHistory"), key = 'title_id')
+
     def getCurrentGameNames(self) -> list:
         """Get Current Game Names for Mapping Reference"""
         if self.stats_df.empty:
@@ -154,22 +197,20 @@ class PSN_User:
 
         except Exception as e:
             print(f"Error Fetching User Data: {e}")
-            self._loadFromCSV()
-
-    def _loadFromCSV(self) -> None:
-        """Load Data from Backup CSV if API Fails"""
-        csv_file = f"{self.username}_PSNData.csv"
-        if os.path.exists(os.path.join(PWD, csv_file)):
-            print(f"Loading Data from CSV File: {csv_file}")
-            self.stats_df = pd.read_csv(os.path.join(PWD, csv_file))
-            if not self.stats_df.empty:
-                row = self.stats_df.iloc[0]
-                if 'trophy_level' in self.stats_df.columns:
-                    self.trophy_level = row['trophy_level']
-                for key in ['platinum', 'gold', 'silver', 'bronze']:
-                    col = f'trophy_{key}'
-                    if col in self.stats_df.columns:
-                        self.trophy_counts[key] = int(row[col])
+            self._loadBackup()
+
+    def _backupPath(self, filename: Optional[str] = None) -> str:
+        """Path to Typed PSN Backup ({username}_PSNData.feather by Default)"""
+        return os.path.join(PWD, filename or f"{self.username}_PSNData{BACKUP_SUFFIX}")
+
+    def _loadBackup(self) -> None:
+        """Load Stats and Trophy Profile from Typed Backup if API Fails"""
+        path = self._backupPath()
+        if os.path.exists(path):
+            print(f"Loading Data from Backup: {os.path.basename(path)}")
+            self.stats_df, profile = readBackup(path)
+            self.trophy_level = profile.get('trophy_level', self.trophy_level)
+            self.trophy_counts.update(profile.get('trophy_counts', {}))
         else:
             print("No Backup Data Available")
 
@@ -181,22 +222,31 @@ class PSN_User:
 
         stats_df = self.stats_df.copy()
         stats_df = stats_df[~stats_df['name'].isin(self.HIDDEN_APPS)]
-        stats_df['trophy_level'] = self.trophy_level
-        for key in ['platinum', 'gold', 'silver', 'bronze']:
-            stats_df[f'trophy_{key}'] = self.trophy_counts.get(key, 0)
         stats_df = stats_df.fillna(0).sort_values('playtime_forever', ascending = False)
         self.stats_df = self._renameGames(stats_df)
 
         self.saveData()
+        self._snapshotPlaytime()
 
     def saveData(self, filename: Optional[str] = None) -> None:
-        """Save User Data to CSV"""
-        if filename is None:
-            filename = f"{self.username}_PSNData.csv"
-
+        """Save User Data to Typed Backup (Trophy Level / Counts in Metadata)"""
         if not self.stats_df.empty:
-            self.stats_df.to_csv(os.path.join(PWD, filename), index = False)
-            print(f"Data Saved to {filename}")
+            path = self._backupPath(filename)
+            profile = {
+                'trophy_level': self.trophy_level,
+                'trophy_counts': {key: self.trophy_counts.get(key, 0) for key in self.TROPHY_TYPES},
+            }
+            writeBackup(path, self.stats_df, self.BACKUP_SCHEMA, profile)
+            print(f"Data Saved to {os.path.basename(path)}")
+
+    def _snapshotPlaytime(self) -> None:
+        """Append Current Cumulative Playtime to Playtime History (Changed Games Only)"""
+        written = self.history.append(self.stats_df)
+        print(f"Playtime History: {written} Snapshot Rows Logged")
+
+    def getPlaytimeDeltas(self, granularity: str = 'daily', start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None, by_game: bool = False) -> pd.DataFrame:
+        """Hours Played per Day / Week / Month from Playtime History (No API Calls)"""
+        return self.history.deltas(granularity, start, end, by_game)
 
     def getTopData(self, n: int = 15) -> pd.DataFrame:
         """Get Top N Games By Playtime"""
@@ -224,14 +274,28 @@ class PSN_Dashboard:
             "#FFD700", "#4682B4", "#2E8B57"
         ]
 
-        self.dashboard = None
-        self.generateDashboard()
+        self.dashboard = None # Built on Demand (generateDashboard / Template Miss in save)
 
-    def generatePlaytimeChart(self, top_n: int = 10) -> alt.Chart:
-        """Generate Pie Chart of Top Games by Playtime"""
+    def _playtimeRows(self, top_n: int = 10) -> pd.DataFrame:
+        """Top Games with Share of Top-N Playtime (%)"""
         top_df = self.user.getTopData(top_n).copy()
         total_playtime = top_df['playtime_forever'].sum()
         top_df['playtime_percentage'] = (top_df['playtime_forever'] / total_playtime * 100).round(2)
+        return top_df
+
+    @staticmethod
+    def _playtimeSubtitle(top_df: pd.DataFrame) -> str:
+        """Pie Subtitle (Data-Dependent, Patched into Templates)"""
+        return f"Total Playtime: {top_df['playtime_forever'].sum():.1f} Hrs"
+
+    @staticmethod
+    def _metricRow(metric: str, value) -> pd.DataFrame:
+        """Single-Row Frame Backing a Big-Number Display"""
+        return pd.DataFrame({'Metric': [metric], 'Value': [value]})
+
+    def generatePlaytimeChart(self, top_n: int = 10) -> alt.Chart:
+        """Generate Pie Chart of Top Games by Playtime"""
+        top_df = self._playtimeRows(top_n)
 
         return alt.Chart(top_df).mark_arc(
             stroke = 'black', strokeWidth = 1
@@ -257,17 +321,14 @@ class PSN_Dashboard:
             width = 700, height = 400,
             title = alt.TitleParams(
                 text = f"Top Games",
-                subtitle = f"Total Playtime: {total_playtime:.1f} Hrs",
+                subtitle = self._playtimeSubtitle(top_df),
                 anchor = 'middle', fontSize = 20, subtitleFontSize = 16
             )
         )
 
     def generateLevelDisplay(self) -> alt.Chart:
         """Generate Trophy Level Display"""
-        data = pd.DataFrame({
-            'Metric': ['Trophy Level'],
-            'Value': [self.user.trophy_level]
-        })
+        data = self._metricRow('Trophy Level', self.user.trophy_level)
 
         return alt.Chart(data).mark_text(
             align = 'center', baseline = 'middle',
@@ -283,10 +344,7 @@ class PSN_Dashboard:
 
     def generatePlayedDisplay(self) -> alt.Chart:
         """Create Played Games Display"""
-        data = pd.DataFrame({
-            'Metric': ['Played'],
-            'Value': [self.user.getNumberPlayed()]
-        })
+        data = self._metricRow('Played', self.user.getNumberPlayed())
 
         return alt.Chart(data).mark_text(
             align = 'center', baseline = 'middle',
@@ -300,8 +358,8 @@ class PSN_Dashboard:
             title = alt.TitleParams(text = 'Played', anchor = 'middle', fontSize = 20)
         )
 
-    def generateTrophyChart(self) -> alt.Chart:
-        """Generate Horizontal Bar Chart of Trophy Counts"""
+    def _trophyRows(self) -> pd.DataFrame:
+        """Trophy Counts by Type (Zero Counts Dropped)"""
         trophy_data = pd.DataFrame([
             {'type': 'Platinum', 'count': self.user.trophy_counts.get('platinum', 0)},
             {'type': 'Gold', 'count': self.user.trophy_counts.get('gold', 0)},
@@ -310,9 +368,16 @@ class PSN_Dashboard:
         ])
 
         # Remove Trophy Types with Zero Count
-        trophy_data = trophy_data[trophy_data['count'] > 0]
+        return trophy_data[trophy_data['count'] > 0]
 
-        total = trophy_data['count'].sum()
+    @staticmethod
+    def _trophySubtitle(trophy_data: pd.DataFrame) -> str:
+        """Trophy Subtitle (Data-Dependent, Patched into Templates)"""
+        return f"Total: {trophy_data['count'].sum():,}"
+
+    def generateTrophyChart(self) -> alt.Chart:
+        """Generate Horizontal Bar Chart of Trophy Counts"""
+        trophy_data = self._trophyRows()
 
         return alt.Chart(trophy_data).mark_bar(
             stroke = 'black', strokeWidth = 1
@@ -339,11 +404,27 @@ class PSN_Dashboard:
             width = 250, height = 150,
             title = alt.TitleParams(
                 text     = 'Trophies',
-                subtitle = f'Total: {total:,}',
+                subtitle = self._trophySubtitle(trophy_data),
                 anchor   = 'middle', fontSize = 20, subtitleFontSize = 14
             )
         )
 
+    def _layoutSlots(self) -> tuple:
+        """Fresh Datasets and Data-Dependent Values Filling the Dashboard Template (Pandas Only)"""
+        top_df = self._playtimeRows()
+        trophy_data = self._trophyRows()
+        datasets = {
+            'level': toRecords(self._metricRow('Trophy Level', self.user.trophy_level)),
+            'played': toRecords(self._metricRow('Played', self.user.getNumberPlayed())),
+            'trophies': toRecords(trophy_data),
+            'games': toRecords(top_df),
+        }
+        values = {
+            'playtime_subtitle': self._playtimeSubtitle(top_df),
+            'trophy_subtitle': self._trophySubtitle(trophy_data),
+        }
+        return datasets, values
+
     def generateDashboard(self) -> None:
         """Generate Complete Dashboard"""
         playtime_chart = self.generatePlaytimeChart()
@@ -368,7 +449,7 @@ class PSN_Dashboard:
             labelFontSize = 12, titleFontSize = 16
         )
 
-    def updateTemplate(self, template_json: dict, output_path: str) -> None:
+    def updateTemplate(self, template_json: dict, output_path: str, fresh_json: Optional[dict] = None) -> None:
         """Update Existing JSON Template with Fresh Data while Preserving Structure"""
         def _get_keys(current_json: dict) -> dict:
             keys_dict = {
@@ -387,8 +468,8 @@ class PSN_Dashboard:
             return keys_dict
 
         try:
-            # Load Dashboard JSON with Fresh Data
-            dashboard_json = self.dashboard.to_dict()
+            # Load Dashboard JSON with Fresh Data (Serialized Once by save)
+            dashboard_json = fresh_json if (fresh_json is not None) else self.dashboard.to_dict()
             dashboard_datasets = dashboard_json.get('datasets', {})
 
             # Identify Keys for Level, Played, Games Data in Template
@@ -420,41 +501,56 @@ class PSN_Dashboard:
 
     def save(self, filename: Optional[str] = None) -> None:
         """Save Dashboard to File"""
-        if self.dashboard is None:
-            print("Dashboard Not Generated")
-            return
-
         if filename is None:
             filename = f"{self.user.username}_Dashboard"
 
         if not os.path.exists(os.path.join(PWD, 'Charts')):
             os.makedirs(os.path.join(PWD, 'Charts'))
 
-        with open(os.path.join(PWD, f"Charts/{filename}.json"), 'w') as f:
-            json.dump(self.dashboard.to_dict(), f, indent = 2)
-
-        # Load Dashboard from JSON File
-        with open(os.path.join(PWD, f"Charts/{filename}.json"), 'r') as f:
-            spec = json.load(f)
-
-        self.dashboard = alt.Chart.from_dict(spec)
-
-        # Save as HTML (Interactive)
-        with open(os.path.join(PWD, f"Charts/{filename}.html"), 'w') as f:
-            f.write(self.dashboard.to_html())
+        # Fill Compiled Template with Fresh Data; Altair Only Runs When Layout Code Changes
+        start = time.perf_counter()
+        templates = TemplateStore(os.path.join(PWD, 'Charts', 'Templates'))
+        exports = ExportStage(manifest = os.path.join(PWD, 'Charts', 'Templates', 'manifest.json'))
+        datasets, values = self._layoutSlots()
+        fingerprint = layoutFingerprint(PSN_Dashboard, sorted(datasets), sorted(values))
+        content = contentFingerprint(fingerprint, datasets, values)
+
+        # Unchanged Inputs: Skip Building, Rendering and Writing (Nothing New to Commit / Deploy)
+        paths = [os.path.join(PWD, f"Charts/{filename}.{ext}") for ext in ('json', 'html', 'png', 'svg')]
+        vega_paths = [vegaPath(paths[0])] if precompileEnabled() else [] # Compiled Vega (DASHBOARD_PRECOMPILE = 1)
+        if exports.isCurrent(paths + vega_paths, content):
+            print(f"Dashboard Unchanged in {(time.perf_counter() - start) * 1000:.0f} ms - Skipping Export")
+            exports.run()
+            return
 
-        self.dashboard.save(os.path.join(PWD, f"Charts/{filename}.png")) # Save as PNG (Static)
-        self.dashboard.save(os.path.join(PWD, f"Charts/{filename}.svg")) # Save as SVG (Vector)
+        spec = templates.render(filename, fingerprint, datasets, values)
+        source = 'template'
+        if spec is None:
+            self.generateDashboard()
+            spec = self.dashboard.to_dict()
+            templates.compile(filename, fingerprint, spec, datasets, values)
+            source = 'altair'
+        print(f"Dashboard Spec Built in {(time.perf_counter() - start) * 1000:.0f} ms ({source})")
+
+        # Save as JSON, HTML (Interactive), PNG (Static), SVG (Vector)
+        json_path, html_path, png_path, svg_path = paths
+        exports.add(json_path, spec, fingerprint = content, indent = 2)
+        exports.add(html_path, spec, fingerprint = content)
+        exports.add(png_path, spec, fingerprint = content)
+        exports.add(svg_path, spec, fingerprint = content)
+        for vega_path in vega_paths:
+            exports.add(vega_path, spec, fingerprint = content)
+        exports.run()
 
         # Replace All JSON with Fresh Data while Preserving Structure
         for file in os.listdir(os.path.join(PWD, 'Charts')):
-            if file.endswith('.json'):
+            if file.endswith('.json') and (not file.endswith(VEGA_SUFFIX)): # Compiled Vega is Not a Template
                 template_path = os.path.join(PWD, 'Charts', file)
 
                 with open(template_path, 'r') as f:
                     template_json = json.load(f)
 
-                self.updateTemplate(template_json, template_path)
+                self.updateTemplate(template_json, template_path, spec)
 
 if __name__ == '__main__':
     load_dotenv()
@@ -463,9 +559,10 @@ if __name__ == '__main__':
     USE_CLIENT = True # True = Use Authenticated Account, False = Lookup by Online ID
 
     NPSSO_CODE = os.getenv("NPSSO_CODE")
+    FIXTURES = FixtureStore.fromEnv() # DASHBOARD_FIXTURES = record | replay for Offline Runs
 
     try:
-        api = PSN_API(NPSSO_CODE)
+        api = PSN_API(NPSSO_CODE, fixtures = FIXTURES)
         user = PSN_User(USERNAME, api, use_client = USE_CLIENT)
         PSN_Dashboard(user).save()
         print("Execution Completed Successfully!")
@@ -0,0 +1,67 @@
+"""
+PSN Tests
+Author: Muntakim Rahman
+Description: PSN_User Backup Fallback; Typed Feather Backups Load with Declared Dtypes and Trophy Profile, Older Backups Still Load.
+"""
+
+# Import Packages
+import pandas as pd
+import pytest
+
+from types import SimpleNamespace
+
+import psn
+from backup_store import writeBackup
+
+TITLES = [
+    {'title_id': 'PPSA01', 'name': 'God of War Ragnarök', 'category': 'PS5', 'playtime_forever': 42.5},
+    {'title_id': 'CUSA02', 'name': 'Netflix', 'category': 'PS4', 'playtime_forever': 300.0}, # Hidden App
+    {'title_id': 'CUSA03', 'name': 'Bloodborne', 'category': 'PS4', 'playtime_forever': 0.0},
+]
+TROPHIES = {'level': 312, 'platinum': 4, 'gold': 30, 'silver': 90, 'bronze': 400}
+
+class FakePSN:
+    """Stands In for PSN_API; failing Makes the User Lookup Fail so PSN_User Falls Back to Its Backup"""
+
+    def __init__(self, failing: bool = False):
+        self.failing = failing
+
+    def getUser(self, username: str):
+        return None if self.failing else SimpleNamespace(username = username)
+
+    def getTitleStats(self, user) -> pd.DataFrame:
+        return pd.DataFrame(TITLES)
+
+    def getTrophySummary(self, user) -> dict:
+        return dict(TROPHIES)
+
+@pytest.fixture
+def psn_env(tmp_path, monkeypatch):
+    """PSN_User Factory; Backup and History Written Under tmp_path"""
+    monkeypatch.setattr(psn, 'PWD', str(tmp_path))
+    return lambda failing = False: psn.PSN_User('Tester', FakePSN(failing))
+
+def test_backup_fallback_keeps_dtypes_and_profile(psn_env):
+    live = psn_env()
+    user = psn_env(failing = True)
+
+    pd.testing.assert_frame_equal(user.stats_df, live.stats_df.reset_index(drop = True), check_dtype = False)
+    assert all(pd.api.types.is_string_dtype(user.stats_df[column]) for column in ['title_id', 'name', 'category'])
+    assert user.stats_df['playtime_forever'].dtype == 'float64'
+    assert user.stats_df['name'].tolist() == ['God of War Ragnarok', 'Bloodborne'] # Renamed, Hidden Apps Dropped
+    assert user.trophy_level == 312
+    assert user.trophy_counts == {'platinum': 4, 'gold': 30, 'silver': 90, 'bronze': 400}
+
+def test_older_backup_without_profile_or_columns(psn_env, tmp_path):
+    stats_df = pd.DataFrame({'title_id': ['CUSA03'], 'name': ['Bloodborne'], 'playtime_forever': [12.0]}) # No category
+    writeBackup(str(tmp_path / 'Tester_PSNData.feather'), stats_df, psn.PSN_User.BACKUP_SCHEMA)
+
+    user = psn_env(failing = True)
+    assert user.stats_df.columns.tolist() == ['title_id', 'name', 'playtime_forever']
+    assert user.getTotalPlaytime() == 12.0
+    assert (user.trophy_level, user.trophy_counts) == (0, {}) # No Profile Metadata: Defaults Kept
+
+def test_no_backup_leaves_stats_empty(psn_env, capsys):
+    user = psn_env(failing = True)
+    assert user.stats_df.empty
+    assert 'No Backup Data Available' in capsys.readouterr().out
@@ -3,7 +3,7 @@ Steam Dashboard Generator
 Author: Muntakim Rahman
 Description: Interacts with Steam Web API to Fetch User Data
     (Owned Games, Recently Played, Badges, Level) and Generates Visualizations using Altair.
-    Data is Saved to CSV for Backup and Dashboard is Exported as JSON, HTML, PNG, SVG.
+    Data is Saved to a Typed Feather Backup and Dashboard is Exported as JSON, HTML, PNG, SVG.
 """
 
 # Import Packages
@@ -12,22 +12,52 @@ import altair as alt
 
 import requests
 import json
+import time
 
 import os
+import sys
 from dotenv import load_dotenv
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from IPython.display import display
 
 PWD = os.path.dirname(os.path.abspath(__file__))
 
+# Resolve Shared Module Path
+sys.path.insert(0, os.path.join(PWD, '..', '..', 'common'))
+
+from backup_store import BACKUP_SUFFIX, readBackup, writeBackup
+from fixtures import FixtureMissing, FixtureStore
+from http_transport import PooledTransport, getTransport
+from export_stage import ExportStage
+from playtime_history import PlaytimeHistory
+from vega_precompile import VEGA_SUFFIX, precompileEnabled, vegaPath
+from spec_template import TemplateStore, contentFingerprint, layoutFingerprint, toRecords
+
 class SteamAPI:
     """Handles Steam API Interactions"""
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, transport: Optional[PooledTransport] = None, fixtures: Optional[FixtureStore] = None, timeout: float = 10.0):
         self.api_key = api_key
         self.base_url = "http://api.steampowered.com"
+        self.session = transport or getTransport() # Pooled Keep-Alive Session
+        self.timeout = timeout # Per-Call (Connect, Read) Timeout in Seconds
+        self.fixtures = fixtures or FixtureStore() # Live by Default; Record / Replay for Offline Runs
+
+    def _get(self, request_url: str, params: dict, empty_statuses: tuple = ()) -> dict:
+        """GET Endpoint and Return Raw JSON (Recorded / Replayed via Fixtures).
+        Statuses in empty_statuses are Answers, Not Failures: Returned (and Recorded) as {}."""
+        def fetch() -> dict:
+            response = self.session.get(request_url, params = params, timeout = self.timeout)
+            if response.status_code in empty_statuses:
+                return {}
+            response.raise_for_status()
+            return response.json()
+
+        endpoint = request_url[len(self.base_url):]
+        return self.fixtures.call('steam', endpoint, params, fetch)
 
     def getSteamID(self, username: str) -> Optional[str]:
         """Convert Steam Username to ID"""
@@ -35,11 +65,8 @@ class SteamAPI:
         params = {'key': self.api_key, 'vanityurl': username}
 
         try:
-            response = requests.get(request_url, params = params)
-            response.raise_for_status()
-
-            return response.json().get('response', {}).get('steamid')
-        except requests.RequestException as e:
+            return self._get(request_url, params).get('response', {}).get('steamid')
+        except (requests.RequestException, FixtureMissing) as e:
             print(f"Failed to Get Steam ID for {username}: {e}")
             return None
 
@@ -55,16 +82,13 @@ class SteamAPI:
         }
 
         try:
-            response = requests.get(request_url, params = params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._get(request_url, params)
             if 'games' in data.get('response', {}): # Check for Games
                 return pd.DataFrame(data['response']['games'])
             else:
                 print(f"No Games Found for Steam ID: {steam_id}")
                 return pd.DataFrame()
-        except requests.RequestException as e:
+        except (requests.RequestException, FixtureMissing) as e:
             print(f"Failed to Get Owned Games: {e}")
             return pd.DataFrame()
 
@@ -80,16 +104,13 @@ class SteamAPI:
         }
 
         try:
-            response = requests.get(request_url, params = params)
-            response.raise_for_status()
-
-            data = response.json()
+            data = self._get(request_url, params)
             if 'games' in data.get('response', {}): # Check for Games
                 return pd.DataFrame(data['response']['games'])
             else:
                 print(f"No Recently Played Games Found for Steam ID: {steam_id}")
                 return pd.DataFrame()
-        except requests.RequestException as e:
+        except (requests.RequestException, FixtureMissing) as e:
             print(f"Failed to get Recently Played Games: {e}")
             return pd.DataFrame()
 
@@ -103,16 +124,14 @@ class SteamAPI:
         }
 
         try:
-            response = requests.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            data = self._get(url, params)
 
             if 'badges_df' in data.get('response', {}): # Check for Badges
                 return pd.DataFrame(data['response']['badges_df'])
             else:
                 print(f"No Badges Found for Steam ID: {steam_id}")
                 return pd.DataFrame()
-        except requests.RequestException as e:
+        except (requests.RequestException, FixtureMissing) as e:
             print(f"Failed to Get Badges: {e}")
             return pd.DataFrame()
 
@@ -126,18 +145,87 @@ class SteamAPI:
         }
 
         try:
-            response = requests.get(request_url, params=params)
-            response.raise_for_status()
-            return response.json().get('response', {}).get('player_level', 0)
-        except requests.RequestException as e:
+            return self._get(request_url, params).get('response', {}).get('player_level', 0)
+        except (requests.RequestException, FixtureMissing) as e:
             print(f"Failed to Get Player Level: {e}")
             return -1
+
+    def getAchievements(self, steam_id: str, appid: int) -> Optional[list]:
+        """Fetch User's Achievements for One Game ([] if the Game Has No Stats, None on Failure)"""
+        request_url = f"{self.base_url}/ISteamUserStats/GetPlayerAchievements/v0001/"
+        params = {
+            'key': self.api_key,
+            'steamid': steam_id,
+            'appid': appid,
+            'format': 'json'
+        }
+
+        try:
+            # 400 = Requested App Has No Stats: an Empty Answer, Recorded so Replay Serves It Too
+            return self._get(request_url, params, empty_statuses = (400,)).get('playerstats', {}).get('achievements', [])
+        except (requests.RequestException, FixtureMissing):
+            return None # Counted by Caller (One Summary Line per Run)
+
+    def getSchema(self, appid: int) -> Optional[dict]:
+        """Fetch Game's Achievement Schema: {achievements: {apiname: displayName}} (None on Failure)"""
+        request_url = f"{self.base_url}/ISteamUserStats/GetSchemaForGame/v2/"
+        params = {
+            'key': self.api_key,
+            'appid': appid,
+            'format': 'json'
+        }
+
+        try:
+            game = self._get(request_url, params).get('game', {})
+        except (requests.RequestException, FixtureMissing):
+            return None
+
+        achievements = game.get('availableGameStats', {}).get('achievements', [])
+        return {
+            'achievements': {achievement['name']: achievement.get('displayName', achievement['name']) for achievement in achievements},
+        }
+
 class SteamUser:
     """Represents a Steam User and Their Gaming Data"""
 
     SKYRIM_ID = 72850
     SKYRIM_SE_ID = 489830
 
+    # Canonical appid -> Edition appids Folded into It (GOTY / Remaster / SE Re-Releases)
+    CONSOLIDATED_APPS = {
+        SKYRIM_ID: [SKYRIM_SE_ID],
+    }
+
+    # Per-Column Aggregation Across a Consolidated Group (Unlisted Columns Keep the Canonical Entry's Value).
+    # Only Columns in STATS_CONSUMERS Reach Consolidation; completion_pct is Recomputed Afterwards.
+    CONSOLIDATION_RULES = {
+        'playtime_forever': 'sum',
+        'achievements_unlocked': 'sum',
+        'achievements_total': 'sum',
+    }
+
+    ACHIEVEMENT_WORKERS = 8 # Concurrent Per-Game Achievement Calls (Host Token Bucket Still Applies)
+    ACTIVITY_COLUMNS = ['playtime_2weeks', 'rtime_last_played'] # Unchanged Since Last Run -> Achievements Unchanged
+    SCHEMA_CACHE = os.path.join(PWD, 'SteamSchemas.json') # Shared Across Users (appid -> Schema, Refetched on Name Mismatch)
+
+    # Columns Each Consumer Reads from stats_df; Only Their Union is Materialized, Merged and Persisted
+    STATS_CONSUMERS = {
+        'dashboard': ['appid', 'name', 'playtime_forever'], # getTopData / getNumberPlayed / getTotalPlaytime
+        'games': ['appid', 'name', 'playtime_forever'], # Games_User Title Index Join
+        'history': ['appid', 'playtime_forever'], # Playtime Snapshots
+        'achievements': ['achievements_unlocked', 'achievements_total', 'completion_pct'],
+    }
+
+    # Declared (Downcast) Dtypes for Consumer Columns; Also the Backup Schema (Pandas / Arrow Aliases Agree)
+    STATS_SCHEMA = {
+        'appid': 'int32',
+        'name': 'str',
+        'playtime_forever': 'float64', # Hours to 2 dp; float32 Would Leak Rounding Noise into Chart JSON
+        'achievements_unlocked': 'int16',
+        'achievements_total': 'int16',
+        'completion_pct': 'float32',
+    }
+
     CUSTOM_NAMES = {
         'The Elder Scrolls V: Skyrim': 'Skyrim',
         'Batman™: Arkham Knight': 'Batman: Arkham Knight',
@@ -159,11 +247,13 @@ class SteamUser:
 
         self.steam_id = None
         self.player_level = 0
+        self.history = PlaytimeHistory(os.path.join(PWD, f"{username}_PlaytimeHistory"), key = 'appid')
 
         # Steam Data
         self.owned_df = pd.DataFrame()
         self.recent_df = pd.DataFrame()
         self.badges_df = pd.DataFrame()
+        self.achievements_df = pd.DataFrame()
         self.stats_df = pd.DataFrame()
 
         self._getData()
@@ -174,10 +264,7 @@ class SteamUser:
             return df
 
         mapped_df = df.copy()
-
-        # Apply Mappings
-        for steam_name, custom_name in self.CUSTOM_NAMES.items():
-            mapped_df.loc[mapped_df['name'] == steam_name, 'name'] = custom_name
+        mapped_df['name'] = mapped_df['name'].replace(self.CUSTOM_NAMES) # Single Lookup Pass over All Mappings
         return mapped_df
 
     def getCurrentGameNames(self) -> list:
@@ -194,11 +281,17 @@ class SteamUser:
             if not self.steam_id:
                 raise ValueError(f"Could Not Find Steam ID for {self.username}")
 
-            self.owned_df = self.api_client.getOwned(self.steam_id)
-            self.recent_df = self.api_client.getRecent(self.steam_id)
-            self.badges_df = self.api_client.getBadges(self.steam_id)
-            self.player_level = self.api_client.getLevel(self.steam_id)
+            self._fetchEndpoints()
 
+            if self.owned_df.empty: # Stats are Built on Owned Games; Keep Other Endpoints' Results
+                print("Owned Games Unavailable - Loading Stats from Backup")
+                live_level = self.player_level
+                self._loadBackup()
+                if live_level >= 0:
+                    self.player_level = live_level
+                return
+
+            self._syncAchievements()
             self._compileStats()
 
             print(f"Successfully Fetched Data for {self.username}")
@@ -208,95 +301,224 @@ class SteamUser:
 
         except Exception as e:
             print(f"Error Fetching User Data: {e}")
-            self._loadFromCSV()
-
-    def _loadFromCSV(self) -> None:
-        """Load Data from Backup CSV if API Fails"""
-        csv_file = f"{self.username}_SteamData.csv"
-        if os.path.exists(os.path.join(PWD, csv_file)):
-            print(f"Loading Data from CSV File: {csv_file}")
-            self.stats_df = pd.read_csv(os.path.join(PWD, csv_file))
-            if not self.stats_df.empty:
-                self.player_level = self.stats_df['player_level'].iloc[0]
-        else:
-            print("No Backup Data Available")
+            self._loadBackup()
+
+    def _fetchEndpoints(self) -> None:
+        """Fetch Owned Games, Recently Played, Badges and Level Concurrently over the Pooled Session.
+        A Failed Endpoint Keeps Its Empty Default; the Others' Results are Kept."""
+        endpoints = {
+            'owned_df': (self.api_client.getOwned, pd.DataFrame()),
+            'recent_df': (self.api_client.getRecent, pd.DataFrame()),
+            'badges_df': (self.api_client.getBadges, pd.DataFrame()),
+            'player_level': (self.api_client.getLevel, -1),
+        }
 
-    def _compileStats(self) -> None:
-        """Compile Stats from all Data sources"""
-        if self.owned_df.empty:
-            print("No Owned Game Data Available")
-            return
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers = len(endpoints)) as pool:
+            futures = {attr: pool.submit(fetch, self.steam_id) for attr, (fetch, _) in endpoints.items()}
+
+            for attr, future in futures.items():
+                try:
+                    setattr(self, attr, future.result())
+                except Exception as e:
+                    print(f"Failed to Fetch {attr}: {e}")
+                    setattr(self, attr, endpoints[attr][1])
+        print(f"Steam Fetch: {len(endpoints)} Endpoints in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    @staticmethod
+    def _loadCache(path: str) -> dict:
+        """Load JSON Cache File ({} if Missing or Unreadable)"""
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, 'r', encoding = 'utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to Load Cache {os.path.basename(path)}: {e}")
+            return {}
+
+    @staticmethod
+    def _saveCache(path: str, cache: dict) -> None:
+        """Write JSON Cache File"""
+        with open(path, 'w', encoding = 'utf-8') as f:
+            json.dump(cache, f, ensure_ascii = False, sort_keys = True)
+
+    def _achievementsPath(self) -> str:
+        """Path to Persisted Per-Game Achievement Counts"""
+        return os.path.join(PWD, f"{self.username}_Achievements.json")
+
+    def _fetchAchievements(self, appid: str, schemas: dict) -> Optional[tuple]:
+        """Unlocked / Total Achievements for One Game, Plus Its Schema if Refetched.
+        The Player Call Lists Every Achievement (Locked Ones Too), so Its Names are the Cache Check:
+        the Cached Schema is Reused Until They No Longer Match (an Update Added, Removed or Renamed
+        Achievements). Steam's gameVersion is Only Available from the Schema Call Itself, so It is
+        Not Tracked; Updates That Leave the Names Alone Do Not Change the Counts. Returns None if
+        the Player Call Failed."""
+        achievements = self.api_client.getAchievements(self.steam_id, int(appid))
+        if achievements is None:
+            return None
 
-        stats_df = self.owned_df.copy()
-        if not self.badges_df.empty:
-            stats_df = pd.merge(
-                stats_df, self.badges_df,
-                on = 'appid', how = 'left',
-                suffixes = ('', '_badge')
-            )
-            stats_df = stats_df[[col for col in stats_df.columns if not col.endswith('_badge')]]
+        names = {achievement['apiname'] for achievement in achievements}
+        unlocked = sum(1 for achievement in achievements if achievement.get('achieved'))
 
-        stats_df['player_level'] = self.player_level
+        schema = schemas.get(appid)
+        fetched = None
+        if names and ((schema is None) or (set(schema['achievements']) != names)):
+            fetched = self.api_client.getSchema(int(appid))
+            schema = fetched or schema
 
-        stats_df = self._consolidateSkyrim(stats_df)
+        if schema and (set(schema['achievements']) >= names):
+            total = len(schema['achievements'])
+        else:
+            total = len(names) # Player List Covers Locked Achievements Too
+        return {'unlocked': unlocked, 'total': total}, fetched
+
+    def _syncAchievements(self) -> None:
+        """Fetch Per-Game Achievement Counts over a Bounded Worker Pool.
+        Only Games Whose playtime_2weeks / rtime_last_played Changed Since the Last Run are Re-Queried;
+        Counts for Every Other Game Come from the Persisted Store."""
+        if self.owned_df.empty or ('appid' not in self.owned_df.columns):
+            return
 
-        stats_df['playtime_forever'] = (stats_df['playtime_forever'] / 60.0).round(2)
+        store = self._loadCache(self._achievementsPath())
+        games = store.get('games', {}) if store.get('steam_id') == self.steam_id else {}
+        schemas = self._loadCache(self.SCHEMA_CACHE)
+
+        activity_df = self.owned_df.reindex(columns = self.ACTIVITY_COLUMNS).fillna(0).astype('int64')
+        activity = dict(zip(self.owned_df['appid'].astype(str), activity_df.values.tolist()))
+        stale = [appid for appid, seen in activity.items() if games.get(appid, {}).get('activity') != seen]
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers = self.ACHIEVEMENT_WORKERS) as pool:
+            results = list(pool.map(lambda appid: self._fetchAchievements(appid, schemas), stale))
+
+        failed = 0
+        schemas_changed = False
+        for appid, result in zip(stale, results):
+            if result is None: # Keep Previous Counts; Activity Left Stale so Next Run Retries
+                failed += 1
+                continue
+            counts, schema = result
+            games[appid] = {'activity': activity[appid], **counts}
+            if schema is not None:
+                schemas[appid] = schema
+                schemas_changed = True
+
+        print(
+            f"Achievements: {len(stale) - failed} Games Queried in {(time.perf_counter() - start) * 1000:.0f} ms, "
+            f"{len(activity) - len(stale)} Unchanged (Cached){f', {failed} Failed' if failed else ''}"
+        )
 
-        stats_df = stats_df.fillna(0).sort_values('playtime_forever', ascending = False)
-        self.stats_df = self._renameGames(stats_df)
+        if games != store.get('games', {}):
+            self._saveCache(self._achievementsPath(), {'steam_id': self.steam_id, 'games': games})
+        if schemas_changed:
+            self._saveCache(self.SCHEMA_CACHE, schemas)
+
+        owned = [appid for appid in activity if appid in games]
+        if owned:
+            self.achievements_df = pd.DataFrame({
+                'appid': [int(appid) for appid in owned],
+                'achievements_unlocked': [games[appid]['unlocked'] for appid in owned],
+                'achievements_total': [games[appid]['total'] for appid in owned],
+            })
+
+    def _backupPath(self, filename: Optional[str] = None) -> str:
+        """Path to Typed Steam Backup ({username}_SteamData.feather by Default)"""
+        return os.path.join(PWD, filename or f"{self.username}_SteamData{BACKUP_SUFFIX}")
+
+    def _loadBackup(self) -> None:
+        """Load Stats and Profile from Typed Backup if API Fails"""
+        path = self._backupPath()
+        if os.path.exists(path):
+            print(f"Loading Data from Backup: {os.path.basename(path)}")
+            self.stats_df, profile = readBackup(path, columns = self._statsColumns())
+            self.player_level = profile.get('player_level', self.player_level)
+        else:
+            print("No Backup Data Available")
 
-        self.saveData()
+    def _statsColumns(self) -> list:
+        """Union of Consumer Columns (Declared Order)"""
+        return list(dict.fromkeys(column for columns in self.STATS_CONSUMERS.values() for column in columns))
 
-    def _consolidateSkyrim(self, stats_df: pd.DataFrame) -> pd.DataFrame:
-        """Consolidate Skyrim and Skyrim SE Data into Single Entry"""
+    def _buildStats(self) -> pd.DataFrame:
+        """Project Owned Games / Badges / Achievements to Consumer Columns, Consolidate and Downcast"""
+        columns = self._statsColumns()
+        stats_df = self.owned_df[[col for col in columns if col in self.owned_df.columns]].copy() # Columns are Assigned Below
 
-        skyrim_mask = stats_df['appid'] == self.SKYRIM_ID
-        skyrim_se_mask = stats_df['appid'] == self.SKYRIM_SE_ID
+        for source_df in (self.badges_df, self.achievements_df):
+            merged = [col for col in columns if (col in source_df.columns) and (col not in stats_df.columns)]
+            if merged:
+                stats_df = pd.merge(stats_df, source_df[['appid'] + merged], on = 'appid', how = 'left')
 
-        if not (skyrim_mask.any() and skyrim_se_mask.any()):
-            print("Consolidation Not Required: Either/Both Skyrim / Skyrim SE Data Missing")
-            return stats_df
+        stats_df = self._consolidateApps(stats_df)
 
-        print("Consolidating Skyrim, Skyrim SE Data...")
+        if 'achievements_total' in stats_df.columns:
+            achievable = stats_df['achievements_total'].where(stats_df['achievements_total'] > 0)
+            stats_df['completion_pct'] = (100 * stats_df['achievements_unlocked'] / achievable).round(1)
 
-        skyrim_data = stats_df[skyrim_mask].copy()
-        skyrim_se_data = stats_df[skyrim_se_mask].copy()
+        stats_df['playtime_forever'] = (stats_df['playtime_forever'] / 60.0).round(2)
 
-        acc_cols = ['playtime_forever', 'completion_time', 'xp']
-        max_cols = ['rtime_last_played', 'badgeid', 'communityitemid', 'level']
-        avg_cols = ['scarcity']
+        numeric = stats_df.select_dtypes('number').columns
+        stats_df[numeric] = stats_df[numeric].fillna(0)
+        stats_df = stats_df.astype({col: dtype for col, dtype in self.STATS_SCHEMA.items() if col in stats_df.columns})
+        return self._renameGames(stats_df.sort_values('playtime_forever', ascending = False))
 
-        for col in acc_cols:
-            if col in stats_df.columns:
-                skyrim_val = skyrim_data[col].iloc[0] if (not skyrim_data[col].isna().iloc[0]) else 0
-                skyrim_se_val = skyrim_se_data[col].iloc[0] if (not skyrim_se_data[col].isna().iloc[0]) else 0
+    def _compileStats(self) -> None:
+        """Compile Stats from all Data sources"""
+        if self.owned_df.empty:
+            print("No Owned Game Data Available")
+            return
 
-                stats_df.loc[skyrim_mask, col] = skyrim_val + skyrim_se_val
+        self.stats_df = self._buildStats()
 
-        for col in max_cols:
-            if col in stats_df.columns:
-                skyrim_val = skyrim_data[col].iloc[0] if (not skyrim_data[col].isna().iloc[0]) else 0
-                skyrim_se_val = skyrim_se_data[col].iloc[0] if (not skyrim_se_data[col].isna().iloc[0]) else 0
+        self.saveData()
+        self._snapshotPlaytime()
+
+    def _consolidateApps(self, stats_df: pd.DataFrame) -> pd.DataFrame:
+        """Fold Edition appids into Their Canonical Entry per CONSOLIDATED_APPS.
+        Rule Columns are Aggregated in One groupby().agg() Pass; Missing Values are Skipped."""
+        present = set(stats_df['appid'])
+        editions = {
+            edition: canonical
+            for canonical, members in self.CONSOLIDATED_APPS.items() if canonical in present
+            for edition in members if edition in present
+        }
 
-                stats_df.loc[skyrim_mask, col] = max(skyrim_val, skyrim_se_val)
+        if not editions:
+            print("Consolidation Not Required: No Edition Owned Alongside Its Canonical Entry")
+            return stats_df
 
-        for col in avg_cols:
-            if col in stats_df.columns:
-                skyrim_val = skyrim_data[col].iloc[0] if (not skyrim_data[col].isna().iloc[0]) else 0
-                skyrim_se_val = skyrim_se_data[col].iloc[0] if (not skyrim_se_data[col].isna().iloc[0]) else skyrim_val
+        print(f"Consolidating {len(editions)} Edition(s) into {len(set(editions.values()))} Canonical Entries...")
 
-                stats_df.loc[skyrim_mask, col] = (skyrim_val + skyrim_se_val) / 2
+        group_ids = stats_df['appid'].replace(editions)
+        in_group = group_ids.isin(set(editions.values()))
+        rules = {col: rule for col, rule in self.CONSOLIDATION_RULES.items() if col in stats_df.columns}
+        aggregated = stats_df.loc[in_group, list(rules)].groupby(group_ids[in_group]).agg(rules)
 
-        return stats_df[~skyrim_se_mask] # Remove Skyrim SE Entry
+        consolidated = stats_df[~stats_df['appid'].isin(editions.keys())].copy()
+        canonical_mask = consolidated['appid'].isin(aggregated.index)
+        canonical_ids = consolidated.loc[canonical_mask, 'appid']
+        for col, rule in rules.items():
+            if rule == 'mean':
+                consolidated[col] = consolidated[col].astype('float64')
+            consolidated.loc[canonical_mask, col] = aggregated[col].reindex(canonical_ids).to_numpy()
+        return consolidated
 
     def saveData(self, filename: Optional[str] = None) -> None:
-        """Save User Data to CSV"""
-        if filename is None:
-            filename = f"{self.username}_SteamData.csv"
-
+        """Save User Data to Typed Backup (Steam Level in Metadata)"""
         if not self.stats_df.empty:
-            self.stats_df.to_csv(os.path.join(PWD, filename), index = False)
-            print(f"Data Saved to {filename}")
+            path = self._backupPath(filename)
+            writeBackup(path, self.stats_df, self.STATS_SCHEMA, {'player_level': self.player_level})
+            print(f"Data Saved to {os.path.basename(path)}")
+
+    def _snapshotPlaytime(self) -> None:
+        """Append Current Cumulative Playtime to Playtime History (Changed Games Only)"""
+        written = self.history.append(self.stats_df)
+        print(f"Playtime History: {written} Snapshot Rows Logged")
+
+    def getPlaytimeDeltas(self, granularity: str = 'daily', start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None, by_game: bool = False) -> pd.DataFrame:
+        """Hours Played per Day / Week / Month from Playtime History (No API Calls)"""
+        return self.history.deltas(granularity, start, end, by_game)
 
     def getTopData(self, n: int = 15) -> pd.DataFrame:
         """Get Top N games By Playtime"""
@@ -322,14 +544,28 @@ class SteamDashboard:
             "#FFD700", "#4682B4", "#2E8B57"
         ]
 
-        self.dashboard = None
-        self.generateDashboard()
+        self.dashboard = None # Built on Demand (generateDashboard / Template Miss in save)
 
-    def generatePlaytimeChart(self, top_n: int = 10) -> alt.Chart:
-        """Generate Pie Chart of Top Games by Playtime"""
+    def _playtimeRows(self, top_n: int = 10) -> pd.DataFrame:
+        """Top Games with Share of Top-N Playtime (%)"""
         top_df = self.user.getTopData(top_n).copy()
         total_playtime = top_df['playtime_forever'].sum()
         top_df['playtime_percentage'] = (top_df['playtime_forever'] / total_playtime * 100).round(2)
+        return top_df
+
+    @staticmethod
+    def _playtimeSubtitle(top_df: pd.DataFrame) -> str:
+        """Pie Subtitle (Data-Dependent, Patched into Templates)"""
+        return f"Total Playtime: {top_df['playtime_forever'].sum():.1f} Hrs"
+
+    @staticmethod
+    def _metricRow(metric: str, value) -> pd.DataFrame:
+        """Single-Row Frame Backing a Big-Number Display"""
+        return pd.DataFrame({'Metric': [metric], 'Value': [value]})
+
+    def generatePlaytimeChart(self, top_n: int = 10) -> alt.Chart:
+        """Generate Pie Chart of Top Games by Playtime"""
+        top_df = self._playtimeRows(top_n)
 
         return alt.Chart(top_df).mark_arc(
             stroke = 'black', strokeWidth = 1
@@ -355,17 +591,14 @@ class SteamDashboard:
             width = 700, height = 400,
             title = alt.TitleParams(
                 text = f"Top Games",
-                subtitle = f"Total Playtime: {total_playtime:.1f} Hrs",
+                subtitle = self._playtimeSubtitle(top_df),
                 anchor = 'middle', fontSize = 20, subtitleFontSize = 16
             )
         )
 
     def generateLevelDisplay(self) -> alt.Chart:
         """Generate Player Level Display"""
-        data = pd.DataFrame({
-            'Metric': ['Level'],
-            'Value': [self.user.player_level]
-        })
+        data = self._metricRow('Level', self.user.player_level)
 
         return alt.Chart(data).mark_text(
             align = 'center', baseline = 'middle',
@@ -381,11 +614,7 @@ class SteamDashboard:
 
     def generatePlayedDisplay(self) -> alt.Chart:
         """Create Played Games Display"""
-
-        data = pd.DataFrame({
-            'Metric': ['Played'],
-            'Value': [self.user.getNumberPlayed()]
-        })
+        data = self._metricRow('Played', self.user.getNumberPlayed())
 
         return alt.Chart(data).mark_text(
             align = 'center', baseline = 'middle',
@@ -399,6 +628,17 @@ class SteamDashboard:
             title = alt.TitleParams(text = 'Played', anchor = 'middle', fontSize = 20)
         )
 
+    def _layoutSlots(self) -> tuple:
+        """Fresh Datasets and Data-Dependent Values Filling the Dashboard Template (Pandas Only)"""
+        top_df = self._playtimeRows()
+        datasets = {
+            'level': toRecords(self._metricRow('Level', self.user.player_level)),
+            'played': toRecords(self._metricRow('Played', self.user.getNumberPlayed())),
+            'games': toRecords(top_df),
+        }
+        values = {'playtime_subtitle': self._playtimeSubtitle(top_df)}
+        return datasets, values
+
     def generateDashboard(self) -> None:
         """Generate Complete Dashboard"""
         playtime_chart = self.generatePlaytimeChart()
@@ -423,7 +663,7 @@ class SteamDashboard:
             labelFontSize = 12, titleFontSize = 16
         )
 
-    def updateTemplate(self, template_json: dict, output_path: str) -> None:
+    def updateTemplate(self, template_json: dict, output_path: str, fresh_json: Optional[dict] = None) -> None:
         """Update Existing JSON Template with Fresh Data while Preserving Structure"""
         def _get_keys(current_json: dict) -> dict:
             keys_dict = {
@@ -442,8 +682,8 @@ class SteamDashboard:
             return keys_dict
 
         try:
-            # Load Dashboard JSON with Fresh Data
-            dashboard_json = self.dashboard.to_dict()
+            # Load Dashboard JSON with Fresh Data (Serialized Once by save)
+            dashboard_json = fresh_json if (fresh_json is not None) else self.dashboard.to_dict()
             dashboard_datasets = dashboard_json.get('datasets', {})
 
             # Identify Keys for Level, Played, Games Data in Template
@@ -475,51 +715,68 @@ class SteamDashboard:
 
     def save(self, filename: Optional[str] = None) -> None:
         """Save Dashboard to File"""
-        if self.dashboard is None:
-            print("Dashboard Not Generated")
-            return
-
         if filename is None:
             filename = f"{self.user.username}_Dashboard"
 
         if not os.path.exists(os.path.join(PWD, 'Charts')):
             os.makedirs(os.path.join(PWD, 'Charts'))
 
-        with open(os.path.join(PWD, f"Charts/{filename}.json"), 'w') as f:
-            json.dump(self.dashboard.to_dict(), f, indent = 2)
-
-        # Load Dashboard from JSON File
-        with open(os.path.join(PWD, f"Charts/{filename}.json"), 'r') as f:
-            spec = json.load(f)
-
-        self.dashboard = alt.Chart.from_dict(spec)
-
-        # Save as HTML (Interactive)
-        with open(os.path.join(PWD, f"Charts/{filename}.html"), 'w') as f:
-            f.write(self.dashboard.to_html())
+        # Fill Compiled Template with Fresh Data; Altair Only Runs When Layout Code Changes
+        start = time.perf_counter()
+        templates = TemplateStore(os.path.join(PWD, 'Charts', 'Templates'))
+        exports = ExportStage(manifest = os.path.join(PWD, 'Charts', 'Templates', 'manifest.json'))
+        datasets, values = self._layoutSlots()
+        fingerprint = layoutFingerprint(SteamDashboard, sorted(datasets), sorted(values))
+        content = contentFingerprint(fingerprint, datasets, values)
+
+        # Unchanged Inputs: Skip Building, Rendering and Writing (Nothing New to Commit / Deploy)
+        paths = [os.path.join(PWD, f"Charts/{filename}.{ext}") for ext in ('json', 'html', 'png', 'svg')]
+        vega_paths = [vegaPath(paths[0])] if precompileEnabled() else [] # Compiled Vega (DASHBOARD_PRECOMPILE = 1)
+        if exports.isCurrent(paths + vega_paths, content):
+            print(f"Dashboard Unchanged in {(time.perf_counter() - start) * 1000:.0f} ms - Skipping Export")
+            exports.run()
+            return
 
-        self.dashboard.save(os.path.join(PWD, f"Charts/{filename}.png")) # Save as PNG (Static)
-        self.dashboard.save(os.path.join(PWD, f"Charts/{filename}.svg")) # Save as SVG (Vector)
+        spec = templates.render(filename, fingerprint, datasets, values)
+        source = 'template'
+        if spec is None:
+            self.generateDashboard()
+            spec = self.dashboard.to_dict()
+            templates.compile(filename, fingerprint, spec, datasets, values)
+            source = 'altair'
+        print(f"Dashboard Spec Built in {(time.perf_counter() - start) * 1000:.0f} ms ({source})")
+
+        # Save as JSON, HTML (Interactive), PNG (Static), SVG (Vector)
+        json_path, html_path, png_path, svg_path = paths
+        exports.add(json_path, spec, fingerprint = content, indent = 2)
+        exports.add(html_path, spec, fingerprint = content)
+        exports.add(png_path, spec, fingerprint = content)
+        exports.add(svg_path, spec, fingerprint = content)
+        for vega_path in vega_paths:
+            exports.add(vega_path, spec, fingerprint = content)
+        exports.run()
 
         # Replace All JSON with Fresh Data while Preserving Structure
         for file in os.listdir(os.path.join(PWD, 'Charts')):
-            if file.endswith('.json'):
+            if file.endswith('.json') and (not file.endswith(VEGA_SUFFIX)): # Compiled Vega is Not a Template
                 template_path = os.path.join(PWD, 'Charts', file)
 
                 with open(template_path, 'r') as f:
                     template_json = json.load(f)
 
-                self.updateTemplate(template_json, template_path)
+                self.updateTemplate(template_json, template_path, spec)
 
 if __name__ == '__main__':
     load_dotenv()
 
     USERNAME = 'Dipto9999'
     API_KEY = os.getenv("STEAM_API_KEY")
+    FIXTURES = FixtureStore.fromEnv() # DASHBOARD_FIXTURES = record | replay for Offline Runs
 
     try:
-        user = SteamUser(USERNAME, SteamAPI(API_KEY))
+        user = SteamUser(USERNAME, SteamAPI(API_KEY, fixtures = FIXTURES))
         SteamDashboard(user).save()
+        getTransport().report()
         print("Execution Completed Successfully!")
 
     except Exception as e:
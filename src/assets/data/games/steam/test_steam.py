@@ -0,0 +1,191 @@
+"""
+Steam Tests
+Author: Muntakim Rahman
+Description: SteamUser Against a Canned Steam Web API (Scripted Adapter), Recorded and Replayed Through FixtureStore.
+"""
+
+# Import Packages
+import json
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import parse_qsl, urlparse
+
+import steam
+from fixtures import FixtureStore
+from http_transport import PooledTransport
+
+OWNED = [
+    {'appid': 72850, 'name': 'The Elder Scrolls V: Skyrim', 'playtime_forever': 6000, 'playtime_2weeks': 0, 'rtime_last_played': 1700000000},
+    {'appid': 489830, 'name': 'The Elder Scrolls V: Skyrim Special Edition', 'playtime_forever': 3000, 'playtime_2weeks': 120, 'rtime_last_played': 1760000000},
+    {'appid': 10, 'name': 'Counter-Strike', 'playtime_forever': 600, 'playtime_2weeks': 0, 'rtime_last_played': 1600000000},
+    {'appid': 20, 'name': 'Team Fortress Classic', 'playtime_forever': 30, 'playtime_2weeks': 0, 'rtime_last_played': 1500000000}, # No Stats
+]
+ACHIEVEMENTS = { # appid -> (Unlocked, Locked) apinames
+    '72850': (['A1', 'A2'], ['A3']),
+    '489830': (['B1'], ['B2', 'B3', 'B4']),
+    '10': ([], ['C1']),
+}
+
+class SteamServer(HTTPAdapter):
+    """Serves Canned Steam Web API Responses by Path; Counts Requests per Path"""
+
+    def __init__(self, owned: list = OWNED, level: int = 42, delay: float = 0.0, failing: tuple = ()):
+        super().__init__()
+        self.owned = owned
+        self.level = level
+        self.delay = delay # Seconds per IPlayerService Call
+        self.failing = failing # Path Prefixes Answered with 500
+        self.requests: dict = {}
+        self.lock = threading.Lock()
+
+    def _route(self, path: str, query: dict) -> tuple:
+        if self.failing and path.startswith(self.failing):
+            return 500, {}
+        if path.startswith('/IPlayerService'):
+            time.sleep(self.delay)
+        if path.startswith('/ISteamUser/ResolveVanityURL'):
+            return 200, {'response': {'steamid': '765', 'success': 1}}
+        if path.startswith('/IPlayerService/GetOwnedGames'):
+            return 200, {'response': {'game_count': len(self.owned), 'games': self.owned}}
+        if path.startswith('/IPlayerService/GetRecentlyPlayedGames'):
+            return 200, {'response': {'games': [game for game in self.owned if game['playtime_2weeks']]}}
+        if path.startswith('/IPlayerService/GetBadges'):
+            return 200, {'response': {'badges': [], 'player_level': self.level}}
+        if path.startswith('/IPlayerService/GetSteamLevel'):
+            return 200, {'response': {'player_level': self.level}}
+        if path.startswith('/ISteamUserStats/GetPlayerAchievements'):
+            if query['appid'] not in ACHIEVEMENTS:
+                return 400, {'playerstats': {'error': 'Requested app has no stats', 'success': False}}
+            unlocked, locked = ACHIEVEMENTS[query['appid']]
+            achievements = [{'apiname': name, 'achieved': 1} for name in unlocked] + [{'apiname': name, 'achieved': 0} for name in locked]
+            return 200, {'playerstats': {'achievements': achievements, 'success': True}}
+        if path.startswith('/ISteamUserStats/GetSchemaForGame'):
+            unlocked, locked = ACHIEVEMENTS[query['appid']]
+            return 200, {'game': {'availableGameStats': {'achievements': [{'name': name} for name in unlocked + locked]}}}
+        return 404, {}
+
+    def send(self, request, **kwargs):
+        parsed = urlparse(request.url)
+        with self.lock:
+            self.requests[parsed.path] = self.requests.get(parsed.path, 0) + 1
+        status, body = self._route(parsed.path, dict(parse_qsl(parsed.query)))
+
+        response = requests.Response()
+        response.status_code = status
+        response.url = request.url
+        response.request = request
+        response._content = json.dumps(body).encode()
+        return response
+
+    def calls(self, prefix: str) -> int:
+        return sum(count for path, count in self.requests.items() if path.startswith(prefix))
+
+@pytest.fixture
+def steam_env(tmp_path, monkeypatch):
+    """SteamUser Factory; Backups, History and Caches Written Under tmp_path"""
+    monkeypatch.setattr(steam, 'PWD', str(tmp_path))
+    monkeypatch.setattr(steam.SteamUser, 'SCHEMA_CACHE', str(tmp_path / 'SteamSchemas.json'))
+
+    def _user(server: SteamServer = None, mode: str = 'live') -> steam.SteamUser:
+        transport = PooledTransport(max_retries = 0)
+        transport.mount('http://', server or SteamServer())
+        fixtures = FixtureStore(mode, root = str(tmp_path / 'fixtures'))
+        return steam.SteamUser('Tester', steam.SteamAPI('SECRET', transport = transport, fixtures = fixtures))
+
+    return _user
+
+def _achievements(user: steam.SteamUser) -> dict:
+    with open(user._achievementsPath(), 'r', encoding = 'utf-8') as f:
+        return json.load(f)['games']
+
+def test_achievement_counts_and_no_stats_game(steam_env):
+    user = steam_env()
+    counts = _achievements(user)
+    assert {appid: (game['unlocked'], game['total']) for appid, game in counts.items()} == {
+        '72850': (2, 3), '489830': (1, 4), '10': (0, 1), '20': (0, 0), # 400 "No Stats" is an Empty Result
+    }
+
+def test_unchanged_activity_served_from_cache(steam_env):
+    steam_env()
+    server = SteamServer()
+    user = steam_env(server)
+    assert server.calls('/ISteamUserStats') == 0
+    assert len(user.achievements_df) == len(OWNED)
+
+    changed = [dict(game, playtime_2weeks = 240) if game['appid'] == 10 else game for game in OWNED]
+    server = SteamServer(changed)
+    steam_env(server)
+    assert server.calls('/ISteamUserStats/GetPlayerAchievements') == 1 # Only the Game Played Since
+    assert server.calls('/ISteamUserStats/GetSchemaForGame') == 0 # Names Unchanged: Cached Schema Reused
+
+def test_replayed_no_stats_is_cached_not_failed(steam_env, tmp_path, capsys):
+    steam_env(mode = 'record')
+    os.remove(tmp_path / 'Tester_Achievements.json')
+    capsys.readouterr()
+
+    user = steam_env(mode = 'replay')
+    assert 'Failed' not in capsys.readouterr().out
+    assert _achievements(user)['20'] == {'activity': [0, 1500000000], 'unlocked': 0, 'total': 0}
+
+def test_endpoints_fetched_concurrently(steam_env):
+    server = SteamServer()
+    user = steam_env(server)
+    server.delay = 0.2
+    user.api_client.session._buckets.clear() # Full Burst Again: Measure Overlap, Not Host Throttling
+
+    start = time.perf_counter()
+    user._fetchEndpoints()
+    assert time.perf_counter() - start < 0.6 # Four 0.2 s Calls Overlap (Serial Would Be 0.8 s)
+    assert server.calls('/IPlayerService') == 2 * 4
+    assert (user.player_level == 42) and (len(user.recent_df) == 1) and (len(user.owned_df) == len(OWNED))
+
+def test_failed_endpoint_keeps_others(steam_env):
+    user = steam_env(SteamServer(failing = ('/IPlayerService/GetRecentlyPlayedGames',)))
+    assert user.recent_df.empty
+    assert user.player_level == 42
+    assert len(user.stats_df) == len(OWNED) - 1 # Skyrim SE Folded into Skyrim
+
+def test_failed_owned_games_loads_backup_with_live_level(steam_env):
+    steam_env()
+    user = steam_env(SteamServer(level = 43, failing = ('/IPlayerService/GetOwnedGames',)))
+    assert len(user.stats_df) == len(OWNED) - 1 # From the Backup Written by the First Run
+    assert user.player_level == 43 # Live Level Wins over the Backup's
+
+def test_consolidated_stats_sum_editions(steam_env):
+    user = steam_env()
+    skyrim = user.stats_df.set_index('appid').loc[steam.SteamUser.SKYRIM_ID]
+
+    assert steam.SteamUser.SKYRIM_SE_ID not in set(user.stats_df['appid'])
+    assert skyrim['name'] == 'Skyrim'
+    assert skyrim['playtime_forever'] == (6000 + 3000) / 60
+    assert (skyrim['achievements_unlocked'], skyrim['achievements_total']) == (2 + 1, 3 + 4)
+    assert skyrim['completion_pct'] == pytest.approx(100 * 3 / 7, abs = 0.05) # Recomputed from the Sums
+
+def test_consolidate_groups_in_one_pass(steam_env, monkeypatch):
+    user = steam_env()
+    monkeypatch.setattr(steam.SteamUser, 'CONSOLIDATED_APPS', {1: [2, 3], 10: [11], 50: [51]})
+    stats_df = pd.DataFrame({
+        'appid': [1, 2, 3, 10, 11, 51, 99],
+        'playtime_forever': [10.0, 5.0, 1.0, 7.0, 3.0, 4.0, 8.0],
+        'achievements_unlocked': [1, None, 2, 0, 4, 1, 0], # Missing Values Skipped
+        'achievements_total': [5, 5, 5, 10, 10, 2, 0],
+        'rtime_last_played': [100, 300, 200, 0, 0, 0, 0], # No Rule: Canonical Entry's Value Kept
+    })
+
+    consolidated = user._consolidateApps(stats_df).set_index('appid')
+    assert consolidated.index.tolist() == [1, 10, 51, 99] # 51 Has No Canonical Entry Owned: Left Alone
+    assert consolidated['playtime_forever'].to_dict() == {1: 16.0, 10: 10.0, 51: 4.0, 99: 8.0}
+    assert consolidated['achievements_unlocked'].to_dict() == {1: 3, 10: 4, 51: 1, 99: 0}
+    assert consolidated['achievements_total'].to_dict() == {1: 15, 10: 20, 51: 2, 99: 0}
+    assert consolidated.loc[1, 'rtime_last_played'] == 100
+
+def test_consolidate_without_editions_is_unchanged(steam_env):
+    user = steam_env()
+    stats_df = pd.DataFrame({'appid': [steam.SteamUser.SKYRIM_SE_ID, 10], 'playtime_forever': [1.0, 2.0]})
+    assert user._consolidateApps(stats_df) is stats_df
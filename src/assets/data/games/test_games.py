@@ -0,0 +1,47 @@
+"""
+Games Dashboard Tests
+Author: Muntakim Rahman
+Description: Combined Steam + PSN Datasets per Breakpoint (Users Built Directly from Stats Frames; No API or Backups).
+"""
+
+# Import Packages
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+from games import Games_Dashboard, Games_User
+
+def _games_user() -> Games_User:
+    steam_user = SimpleNamespace(player_level = 42, stats_df = pd.DataFrame({
+        'appid': range(1, 13),
+        'name': [f"Steam Game {i}" for i in range(1, 13)],
+        'playtime_forever': [float(10 * i) for i in range(1, 13)],
+    }))
+    psn_user = SimpleNamespace(trophy_level = 300, trophy_counts = {'gold': 3, 'bronze': 40}, stats_df = pd.DataFrame({
+        'title_id': ['CUSA1', 'CUSA2', 'CUSA3'],
+        'name': ['PSN Game 1', 'PSN Game 2', 'Steam Game 12'], # Last is Cross-Platform
+        'playtime_forever': [200.0, 5.0, 30.0],
+    }))
+    return Games_User(steam_user, psn_user)
+
+@pytest.fixture
+def dashboard() -> Games_Dashboard:
+    return Games_Dashboard(_games_user())
+
+@pytest.mark.parametrize("name", list(Games_Dashboard.BREAKPOINTS))
+def test_breakpoint_pie_budget(dashboard, name):
+    cfg = Games_Dashboard.BREAKPOINTS[name]
+    datasets, _ = dashboard._layoutSlots(cfg)
+    assert len(datasets['games']) == cfg['pie']['top_n']
+    assert [row['name'] for row in datasets['games']] == dashboard.user.getTopData(cfg['pie']['top_n'])['name'].tolist()
+
+def test_breakpoint_shares_match_standard(dashboard):
+    standard, _ = dashboard._layoutSlots()
+    shares = {row['name']: row['playtime_percentage'] for row in standard['games']}
+    assert sum(shares.values()) == pytest.approx(100, abs = 0.1)
+
+    for name, cfg in Games_Dashboard.BREAKPOINTS.items():
+        datasets, _ = dashboard._layoutSlots(cfg)
+        for row in datasets['games']:
+            assert row['playtime_percentage'] == shares[row['name']], name
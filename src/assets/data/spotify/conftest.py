@@ -0,0 +1,80 @@
+"""
+Spotify Test Fixtures
+Author: Muntakim Rahman
+Description: Synthetic Spotify Library Recorded Through FixtureStore, Then Served to SpotifyClient in Replay Mode.
+"""
+
+# Import Packages
+import pandas as pd
+import pytest
+
+import spotify
+from fixtures import FixtureStore
+
+ARTISTS = ["Alka Yagnik", "Arijit Singh", "A. R. Rahman", "Shreya Ghoshal", "Pritam", "Sonu Nigam",
+    "Kishore Kumar", "Lata Mangeshkar", "Atif Aslam", "Shaan", "KK", "Sunidhi Chauhan"]
+
+def savedItem(index: int, added_at: str, artists: list) -> dict:
+    """One /me/tracks Item"""
+    return {
+        "added_at": added_at,
+        "track": {
+            "id": f"t{index}",
+            "name": f"Song {index}",
+            "artists": [{"name": artist} for artist in artists],
+            "album": {"name": f"Album {index % 7}"},
+            "duration_ms": 180000 + index,
+        },
+    }
+
+def library(size: int = 240, start: str = "2015-01-01", end: str = "2026-06-30") -> list:
+    """Saved Tracks Newest-First, Spread Evenly over [start, end]; Artist i Gets a Skewed Share of Tracks"""
+    added = pd.date_range(start, end, periods = size, tz = "UTC")[::-1]
+    items = []
+    for index, added_at in enumerate(added):
+        artists = [ARTISTS[(index * index) % len(ARTISTS) % (1 + index % len(ARTISTS))]]
+        if index % 5 == 0: # Some Collaborations
+            artists.append(ARTISTS[(index + 3) % len(ARTISTS)])
+        items.append(savedItem(index, added_at.strftime("%Y-%m-%dT%H:%M:%SZ"), artists))
+    return items
+
+class FakeSpotify:
+    """Spotipy Stand-In Serving a Fixed Library (Only Used While Recording)"""
+
+    def __init__(self, items: list, recent: list = ()):
+        self.items = items
+        self.recent = list(recent)
+
+    def current_user_saved_tracks(self, limit, offset):
+        return {"total": len(self.items), "items": self.items[offset:offset + limit]}
+
+    def current_user_top_tracks(self, limit, time_range):
+        return {"items": [item["track"] for item in self.items[:limit]]}
+
+    def current_user_recently_played(self, limit, after = None):
+        return {"items": self.recent[:limit], "cursors": None}
+
+def recordSpotify(root: str, fake: FakeSpotify, skip_offsets: tuple = ()) -> None:
+    """Record Every Call SpotifyUser Makes Against fake (Pages at skip_offsets Left Unrecorded)"""
+    recorder = FixtureStore("record", root = root).wrap(fake, "spotify")
+    batch = spotify.SpotifyClient.SAVED_TRACKS_BATCH
+    for offset in range(0, len(fake.items) + batch, batch):
+        if offset not in skip_offsets:
+            recorder.current_user_saved_tracks(limit = batch, offset = offset)
+    recorder.current_user_top_tracks(limit = 10, time_range = "long_term")
+    recorder.current_user_recently_played(limit = 25)
+    recorder.current_user_recently_played(limit = 50, after = None)
+
+@pytest.fixture
+def replay(tmp_path, monkeypatch):
+    """Build a Replay-Mode SpotifyClient for a FakeSpotify; Snapshots / History Written Under tmp_path"""
+    monkeypatch.setattr(spotify, "PWD", str(tmp_path))
+    recordings = []
+
+    def _replay(fake: FakeSpotify, page_workers: int = 1, skip_offsets: tuple = (), store: type = FixtureStore) -> spotify.SpotifyClient:
+        root = str(tmp_path / "fixtures" / str(len(recordings)))
+        recordSpotify(root, fake, skip_offsets)
+        recordings.append(root)
+        return spotify.SpotifyClient(None, None, None, page_workers = page_workers, fixtures = store("replay", root = root))
+
+    return _replay
@@ -12,16 +12,29 @@ import altair as alt
 
 import json
 import shutil
+import time
 
 import os
+import sys
 from dotenv import load_dotenv
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import spotipy
 from spotipy.oauth2 import SpotifyOAuth
 
+PWD = os.path.dirname(os.path.abspath(__file__))
+
+# Resolve Shared Module Path
+sys.path.insert(0, os.path.join(PWD, '..', 'common'))
+
+from fixtures import FixtureStore
+from http_transport import PooledTransport, getTransport
+from export_stage import ExportStage, writeBreakpointManifest
+from play_history import PlayHistory
+from vega_precompile import precompileEnabled, vegaPath
+from spec_template import TemplateStore, contentFingerprint, layoutFingerprint, sharedDatasetsEnabled, splitDatasets, toRecords
 
 class SpotifyClient:
     """Handles Spotify API Interactions"""
@@ -32,44 +45,119 @@ class SpotifyClient:
         "user-library-read" # Saved/Liked Tracks (Your Music Library)
     ]
 
-    def __init__(self, client_id: str, client_secret: str, redirect_uri: str):
-        redirect_uri = redirect_uri.strip().rstrip("/") # Remove Trailing Slash
-
-        # Initialize Spotipy Client with OAuth
-        _script_dir = os.path.dirname(os.path.abspath(__file__))
-        self.client = spotipy.Spotify(
-            auth_manager = SpotifyOAuth(
-                scope = " ".join(self.SCOPES),
-                client_id = client_id,
-                client_secret = client_secret,
-                redirect_uri = redirect_uri,
-                cache_path = os.path.join(_script_dir, ".cache"),
+    SAVED_TRACKS_BATCH = 50 # Max Page Size Allowed by /me/tracks
+    PAGE_RETRIES = 2 # Re-Fetch Attempts for Failed / Empty Saved Track Pages Before Failing the Full Fetch
+
+    def __init__(self, client_id: str, client_secret: str, redirect_uri: str, page_workers: int = 1,
+        transport: Optional[PooledTransport] = None,
+        fixtures: Optional[FixtureStore] = None,
+    ):
+        self.page_workers = max(1, page_workers) # Concurrent Saved Track Pages (1 = Serial)
+        self.page_latencies: list = [] # (Offset, Seconds) per Saved Track Page
+        self.fixtures = fixtures or FixtureStore() # Live by Default; Record / Replay for Offline Runs
+
+        client = None # Replay Mode Serves Fixtures without OAuth
+        if not self.fixtures.offline:
+            redirect_uri = redirect_uri.strip().rstrip("/") # Remove Trailing Slash
+            session = transport or getTransport() # Pooled Keep-Alive Session (Throttling + Retries)
+
+            # Initialize Spotipy Client with OAuth
+            _script_dir = os.path.dirname(os.path.abspath(__file__))
+            client = spotipy.Spotify(
+                auth_manager = SpotifyOAuth(
+                    scope = " ".join(self.SCOPES),
+                    client_id = client_id,
+                    client_secret = client_secret,
+                    redirect_uri = redirect_uri,
+                    cache_path = os.path.join(_script_dir, ".cache"),
+                    requests_session = session,
+                ),
+                requests_session = session,
+                requests_timeout = session.timeout,
             )
-        )
+        self.client = self.fixtures.wrap(client, "spotify")
 
     def _parseTrack(self, track: dict) -> dict:
         """Parse Track Data Structure"""
         return {
+            "id": track.get("id"), # Spotify Track ID (None for Local Files)
             "track": track["name"],
-            "artists": ", ".join(artist["name"] for artist in track["artists"]),
+            "artists": ", ".join(artist["name"] for artist in track["artists"]), # Display String
+            "artist_names": [artist["name"] for artist in track["artists"]], # Structured Credits (Names May Contain Commas)
+            "album": (track.get("album") or {}).get("name"),
+            "duration_ms": track.get("duration_ms"),
         }
 
+    def _parseSavedItems(self, items: list) -> pd.DataFrame:
+        """Parse Saved Track Items into Rows"""
+        saved_rows = []
+        for item in items:
+            track_data = self._parseTrack(item["track"])
+            track_data["added_at"] = item.get("added_at") # Timestamp When Track Added to Library
+            saved_rows.append(track_data)
+        return pd.DataFrame(saved_rows)
+
+    def _getSavedTrackPage(self, batch_size: int, offset: int) -> dict:
+        """Fetch Raw Saved Tracks Page, Recording Page Latency"""
+        start = time.perf_counter()
+        page = self.client.current_user_saved_tracks(limit = batch_size, offset = offset)
+        self.page_latencies.append((offset, time.perf_counter() - start))
+        return page or {}
+
     def _getSavedTrackBatch(self, batch_size: int, offset: int) -> pd.DataFrame:
         """Fetch User's Saved/Liked Tracks in Batches (for Pagination)"""
         try:
-            saved_tracks = self.client.current_user_saved_tracks(limit = batch_size, offset = offset)
-            saved_rows = []
-
-            for item in saved_tracks.get("items", []):
-                track_data = self._parseTrack(item["track"])
-                track_data["added_at"] = item.get("added_at") # Timestamp When Track Added to Library
-                saved_rows.append(track_data)
-
-            return pd.DataFrame(saved_rows)
+            saved_tracks = self._getSavedTrackPage(batch_size, offset)
+            return self._parseSavedItems(saved_tracks.get("items", []))
         except Exception as e:
             print(f"Failed to Get Saved Tracks: {e}")
             return pd.DataFrame()
 
+    def _reportPageLatency(self) -> None:
+        """Print Per-Page Latency Summary for Saved Track Pagination"""
+        if not self.page_latencies:
+            return
+        latencies_ms = pd.Series([secs for _, secs in self.page_latencies]) * 1000
+        print(
+            f"Saved Track Pages: {len(latencies_ms)} (Workers: {self.page_workers}) | "
+            f"Mean {latencies_ms.mean():.0f} ms | P95 {latencies_ms.quantile(0.95):.0f} ms | Max {latencies_ms.max():.0f} ms"
+        )
+
+    def getNewSavedTracks(self, known_keys: set) -> tuple:
+        """Fetch Saved Tracks Added Since Last Snapshot.
+
+        Saved Tracks are Returned Newest-First, so Pagination Stops at the First (id, added_at)
+        Already in known_keys. Returns (New Tracks DataFrame, Library Total), or (None, None) on Failure.
+        """
+        try:
+            self.page_latencies = []
+            batches = []
+            total = None
+            offset = 0
+
+            while True:
+                page = self._getSavedTrackPage(self.SAVED_TRACKS_BATCH, offset)
+                total = page.get("total", total)
+                batch = self._parseSavedItems(page.get("items", []))
+                if batch.empty: # Reached End of Library
+                    break
+
+                known = [(track_id, added_at) in known_keys for track_id, added_at in zip(batch["id"], batch["added_at"])]
+                if any(known): # Remaining Tracks Already in Snapshot
+                    batches.append(batch.iloc[:known.index(True)])
+                    break
+
+                batches.append(batch)
+                offset += self.SAVED_TRACKS_BATCH
+            self._reportPageLatency()
+
+            new_df = pd.concat(batches, ignore_index = True) if batches else pd.DataFrame()
+            return new_df, total
+
+        except Exception as e:
+            print(f"Failed to Get New Saved Tracks: {e}")
+            return None, None
+
     def getTopTracks(self, limit: int = 10) -> pd.DataFrame:
         """Fetch User's Top Tracks (Long Term)"""
         try:
@@ -95,19 +183,86 @@ class SpotifyClient:
             print(f"Failed to Get Recent Tracks: {e}")
             return pd.DataFrame()
 
+    def _getSavedTracksSerial(self, batch_size: int) -> list:
+        """Walk Saved Tracks One Page at a Time Until an Empty Page"""
+        tracks = []
+        offset = 0
+        while True:
+            batch = self._getSavedTrackBatch(batch_size = batch_size, offset = offset)
+            if batch.empty: # Assume All Tracks Retrieved
+                break
+            tracks.append(batch)
+            offset += batch_size # Move to Next Batch
+        return tracks
+
+    def _getSavedTracksConcurrent(self, batch_size: int) -> list:
+        """Read Library Total from First Page, Then Fan Out Remaining Offsets over Worker Pool"""
+        first_page = self._getSavedTrackPage(batch_size, 0)
+        first_batch = self._parseSavedItems(first_page.get("items", []))
+        if first_batch.empty:
+            return []
+
+        total = first_page.get("total") or len(first_batch)
+        offsets = list(range(batch_size, total, batch_size))
+
+        # Map Preserves Offset Order, so Pages Concatenate in added_at Order (Newest First)
+        with ThreadPoolExecutor(max_workers = self.page_workers) as pool:
+            batches = list(pool.map(lambda offset: self._getSavedTrackBatch(batch_size, offset), offsets))
+
+        # Failed Pages Come Back Empty: Retry Them, and Never Return a Partial Library (Callers Save It as a Full Snapshot)
+        pages = dict(zip(offsets, batches))
+        for _ in range(self.PAGE_RETRIES):
+            missing = [offset for offset, batch in pages.items() if batch.empty]
+            if not missing:
+                break
+            print(f"Retrying Empty Saved Track Pages at Offsets {missing}")
+            for offset in missing:
+                pages[offset] = self._getSavedTrackBatch(batch_size, offset)
+
+        missing = [offset for offset, batch in pages.items() if batch.empty]
+        if missing:
+            raise RuntimeError(f"Saved Track Pages at Offsets {missing} Still Empty after {self.PAGE_RETRIES} Retries")
+
+        return [first_batch] + [pages[offset] for offset in offsets]
+
+    def getPlaysSince(self, after: Optional[pd.Timestamp] = None, max_pages: int = 20) -> pd.DataFrame:
+        """Fetch Recently Played Tracks Strictly After Cursor (Oldest First), Following 'after' Cursors"""
+        try:
+            recent_rows = []
+            cursor = int(after.timestamp() * 1000) if after is not None else None # Unix ms
+
+            for _ in range(max_pages):
+                recent_tracks = self.client.current_user_recently_played(limit = 50, after = cursor)
+                items = recent_tracks.get("items", [])
+                for track_info in items:
+                    row = self._parseTrack(track_info["track"])
+                    row["played_at"] = track_info.get("played_at")
+                    recent_rows.append(row)
+
+                next_cursor = (recent_tracks.get("cursors") or {}).get("after")
+                if (len(items) < 50) or (not next_cursor) or (cursor is None): # No Further Pages
+                    break
+                cursor = int(next_cursor)
+
+            if not recent_rows:
+                return pd.DataFrame()
+
+            plays_df = pd.DataFrame(recent_rows)
+            plays_df["played_at"] = pd.to_datetime(plays_df["played_at"], utc = True, format = "ISO8601")
+            return plays_df.sort_values("played_at", ignore_index = True)
+        except Exception as e:
+            print(f"Failed to Get Plays Since {after}: {e}")
+            return pd.DataFrame()
+
     def getSavedTracks(self) -> pd.DataFrame:
         """Fetch User's Saved Tracks (Handles Pagination). Used to Retrieve 1K+ Liked Songs."""
         try:
-            tracks = []
-            offset = 0
-            batch_size = 50
-
-            while True:
-                batch = self._getSavedTrackBatch(batch_size = batch_size, offset = offset)
-                if batch.empty: # Assume All Tracks Retrieved
-                    break
-                tracks.append(batch)
-                offset += batch_size # Move to Next Batch
+            self.page_latencies = []
+            if self.page_workers > 1:
+                tracks = self._getSavedTracksConcurrent(self.SAVED_TRACKS_BATCH)
+            else:
+                tracks = self._getSavedTracksSerial(self.SAVED_TRACKS_BATCH)
+            self._reportPageLatency()
 
             if tracks: # Concatenate Batches
                 return pd.concat(tracks, ignore_index = True)
@@ -120,6 +275,8 @@ class SpotifyClient:
 class SpotifyUser:
     """Represents Artist Spotify User and Their Music Data"""
 
+    RECONCILE_DAYS = 7 # Full Library Re-Fetch Cadence (Picks Up Removed Tracks)
+
     def __init__(self, username: str, api_client: SpotifyClient):
         self.username = username
         self.api_client = api_client
@@ -128,6 +285,11 @@ class SpotifyUser:
         self.recent_df = pd.DataFrame()
         self.top_tracks_df = pd.DataFrame()
         self.saved_tracks_df = pd.DataFrame()
+        self.history = PlayHistory(os.path.join(PWD, f"{username}_PlayHistory"))
+
+        # Interned Artist Index over saved_tracks_df (Built Once per Run)
+        self.artist_names = pd.Index([]) # Canonical Artist Name per Integer Artist ID
+        self.track_artists = pd.DataFrame(columns = ["track_idx", "artist_id"]) # One Row per (Track, Artist) Credit
 
         self._getData()
 
@@ -137,73 +299,218 @@ class SpotifyUser:
 
         self.recent_df = self.api_client.getRecentTracks()
         self.top_tracks_df = self.api_client.getTopTracks()
-        self.saved_tracks_df = self.api_client.getSavedTracks()
+        self.saved_tracks_df = self._syncLibrary()
+        self._buildArtistIndex()
+        self.saved_tracks_df = self.compactTracks(self.saved_tracks_df) # Artist Credits Now Live in Artist Index
+        self._syncPlayHistory()
+
+    @staticmethod
+    def compactTracks(tracks_df: pd.DataFrame) -> pd.DataFrame:
+        """Dictionary-Encode Saved Tracks for Analytics
+
+        Artists / Albums / Album Art → Categorical, added_at → datetime64 (UTC), duration_ms → int32.
+        Structured Credits (artist_names) are Dropped; Use the Artist Index Instead.
+        """
+        if tracks_df.empty:
+            return tracks_df
+
+        compact_df = tracks_df.drop(columns = ["artist_names"], errors = "ignore").copy()
+        for col in ["artists", "album", "album_image"]: # Low-Cardinality Strings Repeated Across Tracks
+            if col in compact_df.columns:
+                compact_df[col] = compact_df[col].astype("category")
+        if "added_at" in compact_df.columns:
+            compact_df["added_at"] = pd.to_datetime(compact_df["added_at"], utc = True, format = "ISO8601")
+        if "duration_ms" in compact_df.columns:
+            compact_df["duration_ms"] = pd.to_numeric(compact_df["duration_ms"], errors = "coerce").fillna(0).astype("int32")
+        return compact_df.reset_index(drop = True)
+
+    def _buildArtistIndex(self) -> None:
+        """Intern Saved Track Artist Credits to Integer IDs, Resolving _ARTIST_ALIASES Once"""
+        if self.saved_tracks_df.empty:
+            return
+
+        tracks_df = self.saved_tracks_df.reset_index(drop = True)
+        if "artist_names" in tracks_df.columns:
+            credits = tracks_df["artist_names"]
+        else: # Legacy Rows without Structured Credits
+            credits = tracks_df["artists"].astype(str).str.split(", ")
+
+        credits = credits.explode().dropna().astype(str).str.strip()
+        credits = credits[credits != ""].replace(self._ARTIST_ALIASES)
+
+        artist_ids, self.artist_names = pd.factorize(credits)
+        self.track_artists = pd.DataFrame({
+            "track_idx": credits.index.to_numpy(dtype = "int32"),
+            "artist_id": artist_ids.astype("int32"),
+        }).drop_duplicates(ignore_index = True) # Aliases Can Collapse Two Credits on One Track
+
+    def _syncPlayHistory(self) -> None:
+        """Append Plays Since Last Logged play_at to Play History"""
+        plays_df = self.api_client.getPlaysSince(self.history.lastPlayedAt())
+        written = self.history.append(plays_df)
+        print(f"Play History: {written} New Plays Logged")
+
+    def getPlayHistory(self, start: Optional[pd.Timestamp] = None, end: Optional[pd.Timestamp] = None) -> pd.DataFrame:
+        """Get Logged Plays in [start, end) without Re-Querying the API"""
+        return self.history.read(start, end)
+
+    def _libraryPath(self) -> str:
+        """Path to Persisted Saved Tracks Snapshot"""
+        return os.path.join(PWD, f"{self.username}_Library.json")
+
+    def _loadLibrary(self) -> tuple:
+        """Load Saved Tracks Snapshot. Returns (Tracks DataFrame, Last Reconciled Timestamp)"""
+        path = self._libraryPath()
+        if not os.path.exists(path):
+            return pd.DataFrame(), None
+
+        try:
+            with open(path, "r", encoding = "utf-8") as f:
+                snapshot = json.load(f)
+            tracks_df = pd.DataFrame(snapshot.get("tracks", []))
+            reconciled_at = snapshot.get("reconciled_at")
+            return tracks_df, (pd.Timestamp(reconciled_at) if reconciled_at else None)
+        except Exception as e:
+            print(f"Failed to Load Library Snapshot: {e}")
+            return pd.DataFrame(), None
+
+    def _saveLibrary(self, tracks_df: pd.DataFrame, reconciled_at: pd.Timestamp) -> None:
+        """Persist Saved Tracks Snapshot (Newest-First, Keyed by id + added_at)
+
+        The Snapshot is Committed by the Workflow, so It is Rewritten Only When the Track Set or
+        reconciled_at Changes (No Per-Run Timestamps), Leaving Unchanged Runs Without a Diff.
+        """
+        snapshot = json.dumps({
+            "username": self.username,
+            "reconciled_at": reconciled_at.isoformat(),
+            "tracks": tracks_df.to_dict(orient = "records"),
+        }, ensure_ascii = False)
+
+        path = self._libraryPath()
+        if os.path.exists(path):
+            with open(path, "r", encoding = "utf-8") as f:
+                if f.read() == snapshot:
+                    print(f"Library Snapshot Unchanged: {len(tracks_df)} Tracks")
+                    return
+
+        with open(path, "w", encoding = "utf-8") as f:
+            f.write(snapshot)
+        print(f"Library Snapshot Saved: {len(tracks_df)} Tracks")
+
+    def _syncLibrary(self) -> pd.DataFrame:
+        """Delta Sync Saved Tracks Against Snapshot, with Periodic Full Reconcile for Removals"""
+        now = pd.Timestamp.now(tz = "UTC")
+        snapshot_df, reconciled_at = self._loadLibrary()
+
+        needs_reconcile = (
+            snapshot_df.empty
+            or ("id" not in snapshot_df.columns) # Snapshot Predates Track IDs
+            or ("artist_names" not in snapshot_df.columns) # Snapshot Predates Structured Credits
+            or (reconciled_at is None)
+            or (now - reconciled_at >= pd.Timedelta(days = self.RECONCILE_DAYS))
+        )
+
+        if not needs_reconcile:
+            known_keys = set(zip(snapshot_df["id"], snapshot_df["added_at"]))
+            new_df, total = self.api_client.getNewSavedTracks(known_keys)
+
+            if new_df is not None:
+                # Newest First; Re-Added Tracks Keep Only Their Latest added_at
+                merged = pd.concat([new_df, snapshot_df], ignore_index = True)
+                merged = merged[~(merged["id"].notna() & merged.duplicated("id"))].reset_index(drop = True)
+
+                if (total is None) or (len(merged) == total):
+                    print(f"Library Delta Sync: {len(new_df)} New Tracks ({len(merged)} Total)")
+                    self._saveLibrary(merged, reconciled_at)
+                    return merged
+                print(f"Library Size Mismatch ({len(merged)} Local vs {total} Remote) - Reconciling")
+
+        # Full Fetch Replaces Snapshot (Drops Tracks Removed from Library)
+        saved_df = self.api_client.getSavedTracks()
+        if saved_df.empty:
+            if not snapshot_df.empty:
+                print("Full Library Fetch Failed - Using Snapshot")
+            return snapshot_df
+
+        self._saveLibrary(saved_df, now)
+        return saved_df
 
     def getTopTracks(self, n: int = 10) -> pd.DataFrame:
         """Get Top N Tracks"""
         return self.top_tracks_df.head(n) if not self.top_tracks_df.empty else pd.DataFrame()
 
-    def getYearlyLibraryGrowth(self) -> pd.DataFrame:
-        """Analyze Yearly Library Growth (Cumulative Tracks + Artists)"""
+    GROWTH_PERIODS = {"yearly": "Y", "monthly": "M", "weekly": "W"} # Granularity → Pandas Period Frequency
+
+    def getLibraryGrowth(self, granularity: str = "yearly") -> pd.DataFrame:
+        """Analyze Library Growth per Period (Cumulative Tracks + Artists)
+
+        Single Pass over Artist Index: Each Artist's First-Added Period is Found Once, and
+        Cumulative Distinct Artists are a Cumsum of New Artists per Period.
+        """
         if (self.saved_tracks_df.empty) or ('added_at' not in self.saved_tracks_df.columns):
             return pd.DataFrame()
 
-        # Filter Out None Values
-        df = self.saved_tracks_df[self.saved_tracks_df['added_at'].notna()].copy()
+        freq = self.GROWTH_PERIODS.get(granularity.lower())
+        if freq is None:
+            print(f"Unknown Growth Granularity '{granularity}' (Expected One of {list(self.GROWTH_PERIODS)})")
+            return pd.DataFrame()
+
+        # Filter Out None Values (Positional Index Matches track_idx in Artist Index)
+        df = self.saved_tracks_df.reset_index(drop = True)
+        df = df[df['added_at'].notna()].copy()
         if df.empty:
             return pd.DataFrame()
 
         try:
-            # Convert to Datetime and Group by Year
-            df['added_at'] = pd.to_datetime(df['added_at'], utc = True).dt.tz_localize(None)
-            df['time_period'] = df['added_at'].dt.to_period('Y')
+            # Convert to Datetime (No-Op on Compact Frames) and Group by Period
+            df['added_at'] = pd.to_datetime(df['added_at'], utc = True, format = "ISO8601").dt.tz_localize(None)
+            df['time_period'] = df['added_at'].dt.to_period(freq)
         except Exception as e:
             print(f"Error Converting 'added_at' to Datetime: {e}")
             return pd.DataFrame()
 
         growth = df.groupby('time_period')['track'].count().reset_index()
         growth.columns = ['time_period', 'tracks_added']
-        growth['time_period'] = growth['time_period'].astype(str)
         growth = growth.sort_values('time_period')
         growth['cumulative_tracks'] = growth['tracks_added'].cumsum()
 
-        # Compute Cumulative Distinct Artists up to Each Year
-        cumulative_artists: dict = {}
-        for yr_str in sorted(growth['time_period'].unique()):
-            total_artists: set = set()
-            for artists_str in df.loc[df['time_period'].astype(str) <= yr_str, 'artists'].dropna():
-                for artist in str(artists_str).split(', '):
-                    if artist.strip(): # Avoid Empty Artist Names
-                        total_artists.add(artist.strip())
-            cumulative_artists[yr_str] = len(total_artists)
-        # Map Cumulative Artist Counts to Growth DataFrame
-        growth['cumulative_artists'] = growth['time_period'].map(cumulative_artists).fillna(0).astype(int)
+        # First Period Each Artist Appears (via Artist Index), Then New Artists per Period
+        credits = self.track_artists[self.track_artists['track_idx'].isin(df.index)]
+        first_seen = df['time_period'].reindex(credits['track_idx']).groupby(credits['artist_id'].to_numpy()).min()
+        new_artists = first_seen.value_counts()
+
+        growth['cumulative_artists'] = growth['time_period'].map(new_artists).fillna(0).cumsum().astype(int)
+        growth['time_period'] = growth['time_period'].astype(str)
+
+        return growth.reset_index(drop = True)
+
+    def getYearlyLibraryGrowth(self) -> pd.DataFrame:
+        """Analyze Yearly Library Growth (Cumulative Tracks + Artists)"""
+        return self.getLibraryGrowth("yearly")
+
+    def getMonthlyLibraryGrowth(self) -> pd.DataFrame:
+        """Analyze Monthly Library Growth (Cumulative Tracks + Artists)"""
+        return self.getLibraryGrowth("monthly")
 
-        return growth
+    def getWeeklyLibraryGrowth(self) -> pd.DataFrame:
+        """Analyze Weekly Library Growth (Cumulative Tracks + Artists)"""
+        return self.getLibraryGrowth("weekly")
 
     # Map Known Collaboration / Variant Artist Names to Canonical Name
     _ARTIST_ALIASES: dict = {
         "Alka Yagnik & Arvind Hasabnish": "Alka Yagnik",
     }
 
-    def _normalizeArtist(self, name: str) -> str:
-        """Return Canonical Artist Name, Resolving Known Aliases."""
-        return self._ARTIST_ALIASES.get(name, name)
-
     def getTopSavedArtists(self, n: int = 10) -> pd.DataFrame:
         """Get Most Saved/Liked Artists from Library, with Alias Consolidation."""
-        if self.saved_tracks_df.empty:
+        if self.track_artists.empty:
             return pd.DataFrame()
 
-        # Split Comma-Separated Artist Credits, Then Normalize Each Name
-        artists = []
-        for artists_str in self.saved_tracks_df['artists']:
-            for artist in artists_str.split(','):
-                artists.append(self._normalizeArtist(artist.strip()))
-
-        artist_counts = pd.Series(artists).value_counts().head(n).reset_index()
-        artist_counts.columns = ['artist', 'track_count']
-        return artist_counts
+        counts = self.track_artists['artist_id'].value_counts().head(n)
+        return pd.DataFrame({
+            'artist': self.artist_names[counts.index].to_numpy(),
+            'track_count': counts.to_numpy(),
+        })
 
 class SpotifyDashboard:
     """Creates Visualizations for Spotify User Data"""
@@ -217,8 +524,227 @@ class SpotifyDashboard:
             "#00695C", "#B8860B",
         ]
 
-        self.dashboard = None
-        self.generateDashboard()
+        self.dashboard = None # Built on Demand (generateDashboard / Template Miss in save)
+        self._data_model = None # Layout-Independent Datasets (Built on First Use)
+
+    MODEL_TOP_N = 25 # Rows Kept per Ranked Dataset; Charts Slice to Their Own top_n
+
+    # Per-Layout Data Budget (Overridden in LAYOUTS): Datasets are Cut to What a Layout Draws Before Serializing.
+    # Pie Shares and Cumulative Growth are Computed over the Full Set First, so Every Layout Shows the Same Values.
+    DATA_BUDGET = dict(
+        table_rows = 10, # Top Songs / Recently Played Rows
+        pie_slices = 10, # Top Artists in Pie (and Legend)
+        growth_periods = None, # Most Recent Growth Periods (None = Full Timeline)
+        growth_granularity = "yearly", # Growth Period (yearly | monthly | weekly)
+    )
+    GROWTH_COLUMNS = ["year", "cumulative_tracks", "cumulative_artists"] # Drawn by Growth Chart
+
+    # Responsive Layout Configurations (See generateDashboard)
+    LAYOUTS = {
+        "standard": dict(
+            font_scale = 1.00, title_size = 40, spacer_height = 16,
+            hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Standard Dashboard to Maximize Space for Titles and Charts
+            growth_width = 400, growth_height = 320,
+            pie_width = 300, pie_height = 320,
+            legend_width = 180, legend_height = 320,
+            top_width = 370, top_height = 380,
+            recent_width = 370, recent_height = 380,
+            axis_label = 11, axis_title = 14, legend_label = 10, legend_title = 12,
+            padding = {"left": 30, "right": 30, "top": 20, "bottom": 30}, spacing = 20,
+        ),
+        "tablet_portrait": dict( # Includes iPad Mini (768px), iPad Air (820px)
+            font_scale = 0.50, title_size = 28, spacer_height = 5,
+            hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Smaller Tablet Layout
+            vconcat = True, split_charts = True, hconcat_songs = True, # Vertically Concatenated with Pie Chart, Top Songs, Recently Played
+            growth_width = 280, growth_height = 160,
+            pie_width = 200, pie_height = 200,
+            legend_width = 120, legend_height = 200,
+            top_width = 280, top_height = 200,
+            recent_width = 280, recent_height = 200,
+            axis_label = 6, axis_title = 8, legend_label = 6, legend_title = 7,
+            padding = {"left": 8, "right": 8, "top": 8, "bottom": 12}, spacing=6,
+        ),
+        "tablet": dict( # Includes Larger Tablets, iPad Pro, Small Desktops (901-1200px)
+            font_scale = 0.65, title_size = 28, spacer_height = 8,
+            hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Smaller Tablet Layout
+            vconcat = True, split_charts = True, hconcat_songs = True, # Vertically Concatenated with Pie Chart, Top Songs, Recently Played
+            growth_width = 380, growth_height = 200,
+            pie_width = 280, pie_height = 260,
+            legend_width = 160, legend_height = 260,
+            top_width = 360, top_height = 260,
+            recent_width = 360, recent_height = 260,
+            axis_label = 8, axis_title = 10, legend_label = 8, legend_title = 9,
+            padding = {"left": 14, "right": 14, "top": 12, "bottom": 18}, spacing = 10,
+        ),
+        "landscape": dict(
+            font_scale = 0.57, title_size = 18, spacer_height = 8,
+            hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Smaller Landscape Layout
+            growth_width = 280, growth_height = 180,
+            pie_width = 180, pie_height = 180,
+            legend_width = 0, legend_height = 0, # No Legend
+            pie_slices = 8, growth_periods = 8, # Data Budget (See DATA_BUDGET)
+            top_width = 235, top_height = 200,
+            recent_width = 235, recent_height = 200,
+            axis_label = 7, axis_title = 9, legend_label = 6, legend_title = 8,
+            padding = {"left": 10, "right": 10, "top": 12, "bottom": 18}, spacing = 10,
+        ),
+        "portrait": dict(
+            # Stacked in Single Col; Each Chart Spans Full Width
+            font_scale = 0.60, title_size = 14, spacer_height = 0,
+            hide_recent_artist = False, hide_top_artist = True,  # No Artist Names on Mobile Top Songs
+            growth_width = 200, growth_height = 150, # Narrower Growth
+            pie_width = 90, pie_height = 90, # Compact Pie
+            legend_width = 0, legend_height = 0, # No Legend
+            pie_slices = 6, growth_periods = 6, # Data Budget (See DATA_BUDGET); Cards Keep All Table Rows
+            top_width = 260, top_height = 220, # Full-Width Top Songs
+            recent_width = 260, recent_height = 220, # Full-Width Recently Played
+            axis_label = 8, axis_title = 9, legend_label = 7, legend_title = 8,
+            title_anchor = "middle", # Center Sub-Chart Titles on Mobile
+            padding = {"left": 5, "right": 5, "top": 0, "bottom": 15}, spacing = 0,
+        ),
+    }
+
+    def _getDataModel(self) -> dict:
+        """Layout-Independent Datasets, Computed Once and Reused by Every Layout"""
+        if self._data_model is not None:
+            return self._data_model
+
+        start = time.perf_counter()
+
+        # Top Songs Rows
+        tracks_df = self.user.getTopTracks(self.MODEL_TOP_N)
+        if tracks_df.empty:
+            top_songs = pd.DataFrame([{"rank": 1, "song": "No data", "artist": "", "y_pos": 0}])
+        else:
+            top_songs = self._rankedTrackRows(tracks_df)
+
+        # Recently Played Rows
+        recent_df = self.user.recent_df
+        if recent_df.empty:
+            recently_played = pd.DataFrame([{"rank": 1, "song": "No recent plays", "artist": "", "time": "", "y_pos": 0}])
+        else:
+            recent_df = recent_df.head(self.MODEL_TOP_N)
+            played_at = recent_df["played_at"] if "played_at" in recent_df else pd.Series("", index = recent_df.index)
+            recently_played = self._rankedTrackRows(recent_df, times = self._formatPlayedAt(played_at))
+
+        self._data_model = {
+            "top_songs": top_songs,
+            "recently_played": recently_played,
+            "growth": {}, # Granularity -> Growth Timeline (Filled by _growthRows)
+            "top_artists": self.user.getTopSavedArtists(self.MODEL_TOP_N),
+        }
+        self._growthRows(self.DATA_BUDGET["growth_granularity"]) # Library Growth (Default Granularity)
+        print(f"Dashboard Data Model Prepared in {(time.perf_counter() - start) * 1000:.0f} ms")
+        return self._data_model
+
+    @staticmethod
+    def _rankedTrackRows(tracks_df: pd.DataFrame, times: Optional[pd.Series] = None) -> pd.DataFrame:
+        """Track Table Rows (Rank, Song, Artist, [Time], Row Position) Built Column-Wise"""
+        n_rows = len(tracks_df)
+        rows = {
+            "rank": range(1, n_rows + 1),
+            "song": tracks_df["track"].to_numpy(),
+            "artist": tracks_df["artists"].to_numpy(),
+        }
+        if times is not None:
+            rows["time"] = times.to_numpy()
+        rows["y_pos"] = range(n_rows)
+        return pd.DataFrame(rows)
+
+    @staticmethod
+    def _formatPlayedAt(played_at: pd.Series) -> pd.Series:
+        """ISO Timestamps -> 'HH:MM UTC' (Unparseable Kept as First 16 Characters, Missing as Empty)"""
+        raw = played_at.fillna("").astype(str)
+        parsed = pd.to_datetime(raw, utc = True, format = "ISO8601", errors = "coerce")
+        formatted = (parsed.dt.strftime("%H:%M") + " UTC").where(parsed.notna(), raw.str[:16])
+        return formatted.where(raw != "", "")
+
+    def _dataBudget(self, layout: str) -> dict:
+        """Layout's Data Budget (DATA_BUDGET Defaults with LAYOUTS Overrides)"""
+        settings = self.LAYOUTS.get(layout.lower(), self.LAYOUTS["standard"])
+        return {key: settings.get(key, default) for key, default in self.DATA_BUDGET.items()}
+
+    def _growthRows(self, granularity: str = "yearly", periods: Optional[int] = None) -> pd.DataFrame:
+        """Library Growth at a Granularity, Cut to the Most Recent Periods (Drawn Columns Only).
+        Cumulative Totals are Computed over the Full History Before Trimming."""
+        cache = self._getDataModel()["growth"]
+        if granularity not in cache:
+            growth_df = self.user.getLibraryGrowth(granularity)
+            if not growth_df.empty:
+                growth_df['year'] = growth_df['time_period'].astype(str)
+                growth_df = growth_df[[column for column in self.GROWTH_COLUMNS if column in growth_df.columns]]
+            cache[granularity] = growth_df
+
+        growth_df = cache[granularity]
+        return growth_df.tail(periods).reset_index(drop = True) if periods else growth_df
+
+    def _artistShareRows(self, top_n: int = 10) -> pd.DataFrame:
+        """Pie Rows (Artist, Saved Track Count, Share %) for Top Artists.
+        Shares are Taken over the Default Budget's Artists Before Cutting to top_n, so Every Layout Shows the Same %."""
+        artists_df = self._getDataModel()["top_artists"].head(max(top_n, self.DATA_BUDGET["pie_slices"]))
+        if artists_df.empty:
+            return pd.DataFrame()
+
+        counts = artists_df["track_count"]
+        share_total = counts.head(self.DATA_BUDGET["pie_slices"]).sum()
+        return pd.DataFrame({
+            "artist": artists_df["artist"].to_numpy(),
+            "count": counts.astype(int).to_numpy(),
+            "pct": (100 * counts / share_total).round(1).to_numpy(),
+        }).head(top_n)
+
+    def _artistLegendRows(self, top_n: int = 10) -> pd.DataFrame:
+        """Legend Rows (Artist, Label, Row Index) Matching Pie Slice Order"""
+        artists_df = self._getDataModel()["top_artists"].head(top_n)
+        if artists_df.empty:
+            return pd.DataFrame()
+
+        artists = artists_df["artist"].astype(str)
+        counts = artists_df["track_count"].astype(int).map("{:,}".format)
+        return pd.DataFrame({
+            "artist": artists_df["artist"].to_numpy(),
+            "label": (artists + " (" + counts + ")").to_numpy(),
+            "idx": range(len(artists_df)),
+        })
+
+    @staticmethod
+    def _legendRowRange(n_rows: int, height: int) -> list:
+        """Vertical Pixel Range Spanned by Legend Rows"""
+        ROW_TOP_OFFSET = 30 # Vertical Start Position of First Legend Row
+        VERTICAL_PADDING = 40 # Total Vertical Padding for Row Spacing
+        MIN_ROW_STEP = 22 # Minimum Pixels Between Legend Rows
+
+        row_step = max(MIN_ROW_STEP, int((height - VERTICAL_PADDING) / n_rows))
+        return [ROW_TOP_OFFSET, ROW_TOP_OFFSET + row_step * (n_rows - 1)]
+
+    def _layoutSlots(self, layout: str) -> tuple:
+        """Fresh Datasets and Data-Dependent Values Filling a Layout's Template Slots (Pandas Only)"""
+        settings = self.LAYOUTS.get(layout.lower(), self.LAYOUTS["standard"])
+        budget = self._dataBudget(layout)
+        model = self._getDataModel()
+
+        datasets = {
+            "top_songs": toRecords(model["top_songs"].head(budget["table_rows"])),
+            "recently_played": toRecords(model["recently_played"].head(budget["table_rows"])),
+        }
+        values = {}
+
+        growth_df = self._growthRows(budget["growth_granularity"], budget["growth_periods"])
+        if not growth_df.empty:
+            datasets["growth"] = toRecords(growth_df)
+
+        shares_df = self._artistShareRows(budget["pie_slices"])
+        if not shares_df.empty:
+            datasets["artist_shares"] = toRecords(shares_df)
+
+        if settings["legend_width"] > 0:
+            legend_df = self._artistLegendRows(budget["pie_slices"])
+            if not legend_df.empty:
+                datasets["artist_legend"] = toRecords(legend_df)
+                values["legend_domain"] = legend_df["artist"].tolist()
+                values["legend_range"] = self._legendRowRange(len(legend_df), settings["legend_height"])
+
+        return datasets, values
 
     def generateTrackTable(self, df: pd.DataFrame,
         title: str,
@@ -329,53 +855,20 @@ class SpotifyDashboard:
     def generateTopSongsChart(self, top_n: int = 10, width: int = 380, height: int = 320, font_scale: float = 1.0, hide_artist: bool = False) -> alt.Chart:
         """Generate Top Songs Chart"""
         range_label = "Past Year"
-        tracks_df = self.user.getTopTracks(top_n)
-
-        if tracks_df.empty:
-            df = pd.DataFrame([{"rank": 1, "song": "No data", "artist": "", "y_pos": 0}])
-        else:
-            rows = []
-            for i, (_, t) in enumerate(tracks_df.iterrows()):
-                rows.append({
-                    "rank": i + 1,
-                    "song": t["track"],
-                    "artist": t["artists"],
-                    "y_pos": i,
-                })
-            df = pd.DataFrame(rows)
+        df = self._getDataModel()["top_songs"].head(top_n)
 
         return self.generateTrackTable(df, "Top Songs", range_label, width, height, show_time = False, hide_artist = hide_artist, font_scale = font_scale)
 
     def generateRecentlyPlayedChart(self, top_n: int = 10, width: int = 760, height: int = 300, font_scale: float = 1.0, hide_artist: bool = False) -> alt.Chart:
         """Generate Recently Played Chart"""
-        recent_df = self.user.recent_df
-
-        if recent_df.empty:
-            df = pd.DataFrame([{"rank": 1, "song": "No recent plays", "artist": "", "time": "", "y_pos": 0}])
-        else:
-            rows = []
-            for i, (_, t) in enumerate(recent_df.head(top_n).iterrows()):
-                played_at = t.get("played_at", "")
-                time_str = ""
-                if played_at:
-                    try:
-                        dt = datetime.fromisoformat(str(played_at).replace("Z", "+00:00"))
-                        time_str = dt.strftime("%H:%M") + " UTC"
-                    except Exception:
-                        time_str = str(played_at)[:16]
-                rows.append({
-                    "rank": i + 1,
-                    "song": t["track"],
-                    "artist": t["artists"],
-                    "time": time_str,
-                    "y_pos": i,
-                })
-            df = pd.DataFrame(rows)
+        df = self._getDataModel()["recently_played"].head(top_n)
 
         return self.generateTrackTable(df, "Recently Played", "", width, height, show_time=True, hide_artist=hide_artist, font_scale=font_scale)
 
-    def generateLibraryGrowthChart(self, width: int = 600, height: int = 300, font_scale: float = 1.0, title_anchor: str = "start") -> alt.Chart:
-        """Generate Yearly Library Growth Area Chart"""
+    def generateLibraryGrowthChart(self, width: int = 600, height: int = 300, font_scale: float = 1.0, title_anchor: str = "start",
+        periods: Optional[int] = None, granularity: str = "yearly",
+    ) -> alt.Chart:
+        """Generate Library Growth Area Chart (Most Recent periods at granularity; None = Full Timeline)"""
 
         # ── Layout Constants
         TRACKS_HEIGHT_RATIO = 0.55  # Fraction of Total Height for Tracks Sub-Chart
@@ -398,7 +891,7 @@ class SpotifyDashboard:
         # Color Constants
         ARTIST_COLOR = "#1a237e" # Dark Blue for Artists Sub-Chart
 
-        growth_df = self.user.getYearlyLibraryGrowth()
+        growth_df = self._growthRows(granularity, periods)
         if growth_df.empty:
             return alt.Chart(
                 pd.DataFrame(
@@ -409,7 +902,6 @@ class SpotifyDashboard:
             ).properties(
                 width = width, height = height
             )
-        growth_df['year'] = growth_df['time_period'].astype(str)
 
         def area_chart(y_field, y_title, color, opacity, height_ratio, chart_title):
             """Generate Area Sub-Chart for a Growth Metric"""
@@ -481,19 +973,10 @@ class SpotifyDashboard:
         TITLE_FONT = 20 # Chart Title Font Size
         SUBTITLE_FONT = 13 # Chart Subtitle Font Size
 
-        artists_df = self.user.getTopSavedArtists(top_n)
-        if artists_df.empty:
+        df = self._artistShareRows(top_n)
+        if df.empty:
             return alt.Chart(pd.DataFrame({"name": ["No data"], "share": [1]})).mark_arc().encode(theta = "share:Q").properties(width=width, height=height)
 
-        total = artists_df["track_count"].sum()
-        rows = []
-        for i, (_, artist) in enumerate(artists_df.iterrows()):
-            rows.append({
-                "artist": artist["artist"],
-                "count": int(artist["track_count"]),
-                "pct": round(100 * artist["track_count"] / total, 1),
-            })
-        df = pd.DataFrame(rows)
         outer_r = int(min(width, height) * OUTER_RADIUS_RATIO)
 
         return (
@@ -530,9 +1013,6 @@ class SpotifyDashboard:
         """Generate Artists Legend for Pie Chart"""
 
         # Layout Constants
-        ROW_TOP_OFFSET = 30 # Vertical Start Position of First Legend Row
-        VERTICAL_PADDING = 40 # Total Vertical Padding for Row Spacing
-        MIN_ROW_STEP = 22 # Minimum Pixels Between Legend Rows
         DOT_X = 26 # Horizontal Position of Color Dots
         LABEL_X = 46 # Horizontal Position of Artist Labels
         LABEL_DX = 12 # Horizontal Offset Between Dot and Label
@@ -545,30 +1025,17 @@ class SpotifyDashboard:
         LABEL_FONT = 13 # Artist Label Font Size
         EMPTY_TITLE_FONT = 14 # Placeholder Title Font Size
 
-        artists_df = self.user.getTopSavedArtists(top_n)
-
-        rows = []
-        for i, (_, artist) in enumerate(artists_df.head(top_n).iterrows()):
-            artist_name = artist["artist"]
-            count = int(artist["track_count"])
-            rows.append({
-                "artist": artist_name,
-                "label": f"{artist_name} ({count:,})",
-                "idx": i,
-            })
-
-        if not rows:
+        df = self._artistLegendRows(top_n)
+        if df.empty:
             return alt.Chart(
                 pd.DataFrame({"t": [""]})
             ).mark_text().encode(
                 text = "t:N"
             ).properties(width = width, height = height)
 
-        df = pd.DataFrame(rows)
         ordered_domain = df["artist"].tolist() # Ensure Legend Colors Match Pie Slices
         color_scale = alt.Scale(range = self.colors, domain = ordered_domain)
-
-        row_step = max(MIN_ROW_STEP, int((height - VERTICAL_PADDING) / len(df)))
+        row_range = self._legendRowRange(len(df), height)
 
         # Legend chart: colored legend_markers + artist legend_labels
         legend_markers = (
@@ -579,9 +1046,7 @@ class SpotifyDashboard:
                     "idx:O",
                     title = None,
                     axis = None,
-                    scale = alt.Scale(
-                        range = [ROW_TOP_OFFSET, ROW_TOP_OFFSET + row_step * (len(df) - 1)]
-                    )
+                    scale = alt.Scale(range = row_range)
                 ),
                 x = alt.value(DOT_X),
                 color = alt.Color("artist:N", scale = color_scale, legend = None),
@@ -593,9 +1058,7 @@ class SpotifyDashboard:
             .encode(
                 y = alt.Y(
                     "idx:O", title = None, axis = None,
-                    scale = alt.Scale(
-                        range = [ROW_TOP_OFFSET, ROW_TOP_OFFSET + row_step * (len(df) - 1)]
-                    )
+                    scale = alt.Scale(range = row_range)
                 ),
                 x = alt.value(LABEL_X),
                 text = alt.Text("label:N"),
@@ -630,70 +1093,8 @@ class SpotifyDashboard:
             Top Songs | Recently Played
         """
 
-        LAYOUTS = {
-            "standard": dict(
-                font_scale = 1.00, title_size = 40, spacer_height = 16,
-                hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Standard Dashboard to Maximize Space for Titles and Charts
-                growth_width = 400, growth_height = 320,
-                pie_width = 300, pie_height = 320,
-                legend_width = 180, legend_height = 320,
-                top_width = 370, top_height = 380,
-                recent_width = 370, recent_height = 380,
-                axis_label = 11, axis_title = 14, legend_label = 10, legend_title = 12,
-                padding = {"left": 30, "right": 30, "top": 20, "bottom": 30}, spacing = 20,
-            ),
-            "tablet_portrait": dict( # Includes iPad Mini (768px), iPad Air (820px)
-                font_scale = 0.50, title_size = 28, spacer_height = 5,
-                hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Smaller Tablet Layout
-                vconcat = True, split_charts = True, hconcat_songs = True, # Vertically Concatenated with Pie Chart, Top Songs, Recently Played
-                growth_width = 280, growth_height = 160,
-                pie_width = 200, pie_height = 200,
-                legend_width = 120, legend_height = 200,
-                top_width = 280, top_height = 200,
-                recent_width = 280, recent_height = 200,
-                axis_label = 6, axis_title = 8, legend_label = 6, legend_title = 7,
-                padding = {"left": 8, "right": 8, "top": 8, "bottom": 12}, spacing=6,
-            ),
-            "tablet": dict( # Includes Larger Tablets, iPad Pro, Small Desktops (901-1200px)
-                font_scale = 0.65, title_size = 28, spacer_height = 8,
-                hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Smaller Tablet Layout
-                vconcat = True, split_charts = True, hconcat_songs = True, # Vertically Concatenated with Pie Chart, Top Songs, Recently Played
-                growth_width = 380, growth_height = 200,
-                pie_width = 280, pie_height = 260,
-                legend_width = 160, legend_height = 260,
-                top_width = 360, top_height = 260,
-                recent_width = 360, recent_height = 260,
-                axis_label = 8, axis_title = 10, legend_label = 8, legend_title = 9,
-                padding = {"left": 14, "right": 14, "top": 12, "bottom": 18}, spacing = 10,
-            ),
-            "landscape": dict(
-                font_scale = 0.57, title_size = 18, spacer_height = 8,
-                hide_recent_artist = True, hide_top_artist = True, # Hide Artist Names on Smaller Landscape Layout
-                growth_width = 280, growth_height = 180,
-                pie_width = 180, pie_height = 180,
-                legend_width = 0, legend_height = 0, # No Legend
-                top_width = 235, top_height = 200,
-                recent_width = 235, recent_height = 200,
-                axis_label = 7, axis_title = 9, legend_label = 6, legend_title = 8,
-                padding = {"left": 10, "right": 10, "top": 12, "bottom": 18}, spacing = 10,
-            ),
-            "portrait": dict(
-                # Stacked in Single Col; Each Chart Spans Full Width
-                font_scale = 0.60, title_size = 14, spacer_height = 0,
-                hide_recent_artist = False, hide_top_artist = True,  # No Artist Names on Mobile Top Songs
-                growth_width = 200, growth_height = 150, # Narrower Growth
-                pie_width = 90, pie_height = 90, # Compact Pie
-                legend_width = 0, legend_height = 0, # No Legend
-                top_width = 260, top_height = 220, # Full-Width Top Songs
-                recent_width = 260, recent_height = 220, # Full-Width Recently Played
-                axis_label = 8, axis_title = 9, legend_label = 7, legend_title = 8,
-                title_anchor = "middle", # Center Sub-Chart Titles on Mobile
-                padding = {"left": 5, "right": 5, "top": 0, "bottom": 15}, spacing = 0,
-            ),
-        }
-
         # Fallback to Standard Layout if Unrecognized Layout Specified
-        settings = LAYOUTS.get(layout.lower(), LAYOUTS["standard"])
+        settings = self.LAYOUTS.get(layout.lower(), self.LAYOUTS["standard"])
 
         spacer = alt.Chart(
             pd.DataFrame([{"x": 0}])
@@ -703,22 +1104,28 @@ class SpotifyDashboard:
         ).properties(width = 10, height = settings["spacer_height"])
 
         title_anchor = settings.get("title_anchor", "start")
+        budget = self._dataBudget(layout)
         growth_chart = self.generateLibraryGrowthChart(
             width = settings["growth_width"], height = settings["growth_height"],
-            font_scale = settings["font_scale"], title_anchor = title_anchor
+            font_scale = settings["font_scale"], title_anchor = title_anchor,
+            periods = budget["growth_periods"], granularity = budget["growth_granularity"],
         )
         pie_chart = self.generateTopArtistsPieChart(
+            top_n = budget["pie_slices"],
             width = settings["pie_width"], height = settings["pie_height"],
             font_scale = settings["font_scale"], title_anchor = title_anchor
         )
         pie_legend = self.generateArtistsLegendChart(
+            top_n = budget["pie_slices"],
             width = settings["legend_width"], height = settings["legend_height"],
             font_scale = settings["font_scale"]) if (settings["legend_width"] > 0) else None
         top_songs = self.generateTopSongsChart(
+            top_n = budget["table_rows"],
             width = settings["top_width"], height = settings["top_height"],
             font_scale = settings["font_scale"], hide_artist = settings.get("hide_top_artist", False)
         )
         recently_played = self.generateRecentlyPlayedChart(
+            top_n = budget["table_rows"],
             width = settings["recent_width"], height = settings["recent_height"],
             font_scale = settings["font_scale"], hide_artist = settings.get("hide_recent_artist", False)
         )
@@ -771,6 +1178,45 @@ class SpotifyDashboard:
             labelLimit = 120,
         )
 
+    def _buildLayoutSpec(self, layout: str) -> dict:
+        """Full Altair Path: Build Layout and Serialize (with Portrait Card Data)"""
+        self.generateDashboard(layout)
+        spec_dict = self.dashboard.to_dict()
+
+        # For Portrait: Inject Card Data (Top Songs + Recently Played) to Render as Mobile Cards in React
+        if (layout == "portrait") and (hasattr(self, "_card_data")):
+            songs_spec = self._card_data["topSongs"].to_dict()
+            recent_spec = self._card_data["recentlyPlayed"].to_dict()
+            if ("datasets" not in spec_dict):
+                spec_dict["datasets"] = {}
+
+            # Inject Top Songs and Recently Played Specs in Dashboard Datasets for Access in React
+            songs_dataset = songs_spec.get("datasets", {})
+            recent_dataset = recent_spec.get("datasets", {})
+
+            # Update Dashboard Datasets with Card Specs
+            spec_dict["datasets"].update(songs_dataset)
+            spec_dict["datasets"].update(recent_dataset)
+
+            # Store Dataset Keys for Easy Access
+            spec_dict["_cardData"] = {
+                "topSongsDataset": list(songs_dataset.keys())[0] if songs_dataset else None,
+                "recentlyPlayedDataset": list(recent_dataset.keys())[0] if recent_dataset else None,
+            }
+
+        return spec_dict
+
+    @staticmethod
+    def _shippedSpec(spec_dict: dict) -> dict:
+        """Layout JSON as Shipped to React (Transparent Background, Pinned Schema)"""
+        export_dict = dict(spec_dict)
+        card_data = export_dict.pop("_cardData", None)
+        export_dict["background"] = None # Transparent
+        export_dict["$schema"] = "https://vega.github.io/schema/vega-lite/v5.20.1.json" # Match Vega-Lite Version Used by Altair
+        if card_data is not None:
+            export_dict["_cardData"] = card_data
+        return export_dict
+
     def save(self, filename: Optional[str] = None) -> None:
         """Generate and Save All Responsive Dashboard Layouts.
 
@@ -781,6 +1227,10 @@ class SpotifyDashboard:
             {username}_TabletPortrait.json (iPad Mini/Air)
             {username}_Landscape.json (Mobile Landscape)
             {username}_Portrait.json (Mobile Portrait)
+            {username}_{Layout}.svg (Static First Paint per Layout Above)
+            {username}_Breakpoints.json (Layout -> Static SVG, Width, Height)
+            {username}_{Layout}.vg.json (Compiled Vega per Layout, DASHBOARD_PRECOMPILE = 1)
+            {username}_Datasets.json (Datasets Shared by the Layouts Above, DASHBOARD_DATASETS = shared)
             {username}_Dashboard.json (Standard Reference Copy)
             {username}_Dashboard.html (Interactive HTML Reference)
         """
@@ -813,58 +1263,81 @@ class SpotifyDashboard:
             "portrait": "Portrait",
         }
 
-        # Iterate Through
-        for layout in responsive_layouts:
-            self.generateDashboard(layout)
-            out_path = os.path.join(charts_dir, f"{self.user.username}_{layout_labels[layout]}.json")
-            spec_dict = self.dashboard.to_dict()
-            spec_dict["background"] = None # Transparent
-            spec_dict["$schema"] = "https://vega.github.io/schema/vega-lite/v5.20.1.json" # Match Vega-Lite Version Used by Altair
-
-            # For Portrait: Inject Card Data (Top Songs + Recently Played) to Render as Mobile Cards in React
-            if (layout == "portrait") and (hasattr(self, "_card_data")):
-                songs_spec = self._card_data["topSongs"].to_dict()
-                recent_spec = self._card_data["recentlyPlayed"].to_dict()
-                if ("datasets" not in spec_dict):
-                    spec_dict["datasets"] = {}
-
-                # Inject Top Songs and Recently Played Specs in Dashboard Datasets for Access in React
-                songs_dataset = songs_spec.get("datasets", {})
-                recent_dataset = recent_spec.get("datasets", {})
-
-                # Update Dashboard Datasets with Card Specs
-                spec_dict["datasets"].update(songs_dataset)
-                spec_dict["datasets"].update(recent_dataset)
-
-                # Store Dataset Keys for Easy Access
-                spec_dict["_cardData"] = {
-                    "topSongsDataset": list(songs_dataset.keys())[0] if songs_dataset else None,
-                    "recentlyPlayedDataset": list(recent_dataset.keys())[0] if recent_dataset else None,
-                }
-
-            # Save Vega-Lite Spec JSON for Each Layout
-            with open(out_path, "w", encoding = "utf-8") as f:
-                json.dump(spec_dict, f, indent = 2, ensure_ascii = False)
-
-        # Save Standard Layouts as Reference Copy
-        self.generateDashboard("standard")
-        spec_dict = self.dashboard.to_dict()
-        spec_dict["background"] = None # Transparent
-        spec_dict["$schema"] = "https://vega.github.io/schema/vega-lite/v5.20.1.json" # Match Vega-Lite Version Used by Altair
-        dashboard_json_path = os.path.join(charts_dir, f"{filename}.json")
-
-        # Export Vega-Lite Spec JSON
-        with open(dashboard_json_path, "w", encoding = "utf-8") as f:
-            json.dump(spec_dict, f, indent = 2, ensure_ascii = False)
+        # Compiled Layout Templates: Altair Only Runs When Layout Code (or Slot Shape) Changes
+        templates = TemplateStore(os.path.join(charts_dir, "Templates"))
+        # Artifacts Written Together Once Every Spec is Built; Unchanged Layouts are Skipped via the Manifest
+        exports = ExportStage(manifest = os.path.join(charts_dir, "Templates", "manifest.json"))
 
-        # Export HTML Reference Copy
-        html_path = os.path.join(charts_dir, f"{filename}.html")
-        with open(html_path, "w", encoding = "utf-8") as f:
-            f.write(self.dashboard.to_html())
+        # Slot Data per Layout (Data Model is Shared; Only Layout Sizing Differs)
+        shared = sharedDatasetsEnabled()
+        precompile = precompileEnabled()
+        layout_slots = {}
+        for layout in responsive_layouts:
+            slots_start = time.perf_counter()
+            datasets, values = self._layoutSlots(layout)
+            fingerprint = layoutFingerprint(SpotifyDashboard, layout, sorted(datasets), sorted(values))
+            content = contentFingerprint(fingerprint, datasets, values, shared = shared)
+            layout_slots[layout] = (datasets, values, fingerprint, content, time.perf_counter() - slots_start)
+
+        # Shared Data File Holds Every Layout's Datasets, so Any Changed Layout Rewrites All of Them
+        data_path = os.path.join(charts_dir, f"{self.user.username}_Datasets.json")
+        data_content = contentFingerprint("|".join(slots[3] for slots in layout_slots.values()), {})
+        rebuild_all = shared and (not exports.isCurrent([data_path], data_content))
+        shared_datasets = {}
 
-        # Export Static PNG/SVG of Dashboard
-        self.dashboard.save(os.path.join(charts_dir, f"{filename}.png"))
-        self.dashboard.save(os.path.join(charts_dir, f"{filename}.svg"))
+        # Iterate Through
+        layout_timings = {}
+        breakpoint_svgs = {} # Layout Label -> Static SVG Path
+        for layout in responsive_layouts:
+            layout_start = time.perf_counter()
+            label = layout_labels[layout]
+            datasets, values, fingerprint, content, slots_seconds = layout_slots[layout]
+            layout_start -= slots_seconds
+
+            # Standard Layout Also Provides the Reference Copy: Vega-Lite Spec JSON, HTML, Static PNG/SVG
+            out_path = os.path.join(charts_dir, f"{self.user.username}_{label}.json")
+            svg_path = os.path.join(charts_dir, f"{self.user.username}_{label}.svg")
+            reference_paths = [os.path.join(charts_dir, f"{filename}.{ext}") for ext in ("json", "html", "png", "svg")] if layout == "standard" else []
+            breakpoint_svgs[label] = svg_path
+
+            vega_paths = [vegaPath(out_path)] if precompile else []
+
+            if (not rebuild_all) and exports.isCurrent([out_path, svg_path] + vega_paths + reference_paths, content):
+                layout_timings[label] = ((time.perf_counter() - layout_start) * 1000, "unchanged")
+                continue
+
+            spec_dict = templates.render(label, fingerprint, datasets, values)
+            source = "template"
+            if spec_dict is None:
+                spec_dict = self._buildLayoutSpec(layout)
+                templates.compile(label, fingerprint, spec_dict, datasets, values)
+                source = "altair"
+
+            # Queue Vega-Lite Spec JSON for Each Layout (Datasets Referenced by Name When Shared)
+            layout_spec = self._shippedSpec(spec_dict)
+            # Static First-Paint SVG of Exactly What the Site Renders (Card Metadata is React-Only)
+            exports.add(svg_path, {key: value for key, value in layout_spec.items() if key != "_cardData"}, fingerprint = content)
+            for vega_path in vega_paths: # Compiled Vega (Datasets Inline)
+                exports.add(vega_path, layout_spec, fingerprint = content)
+            if shared:
+                layout_spec = splitDatasets(layout_spec, shared_datasets)
+            exports.add(out_path, layout_spec, fingerprint = content, indent = 2, ensure_ascii = False)
+            if reference_paths:
+                reference_json, reference_html, reference_png, reference_svg = reference_paths
+                exports.add(reference_json, self._shippedSpec(spec_dict), fingerprint = content, indent = 2, ensure_ascii = False)
+                exports.add(reference_html, spec_dict, fingerprint = content)
+                exports.add(reference_png, spec_dict, fingerprint = content)
+                exports.add(reference_svg, spec_dict, fingerprint = content)
+            layout_timings[label] = ((time.perf_counter() - layout_start) * 1000, source)
+
+        # Compact Shared Data File (React Merges It Back into Each Layout Spec)
+        if rebuild_all:
+            exports.add(data_path, shared_datasets, fingerprint = data_content, separators = (",", ":"), ensure_ascii = False)
+
+        print("Layout Timings: " + " | ".join(f"{label} {ms:.0f} ms ({source})" for label, (ms, source) in layout_timings.items()))
+
+        exports.run()
+        writeBreakpointManifest(os.path.join(charts_dir, f"{self.user.username}_Breakpoints.json"), breakpoint_svgs)
 
         cleanup()
 
@@ -877,9 +1350,11 @@ if __name__ == '__main__':
     CLIENT_ID = os.getenv("SPOTIFY_CLIENT_ID")
     CLIENT_SECRET = os.getenv("SPOTIFY_CLIENT_SECRET")
     REDIRECT_URI = os.getenv("SPOTIFY_REDIRECT_URI")
+    PAGE_WORKERS = 8 # Concurrent Saved Track Page Requests (1 = Serial Pagination)
+    FIXTURES = FixtureStore.fromEnv() # DASHBOARD_FIXTURES = record | replay for Offline Runs
 
     try:
-        if not CLIENT_ID or not CLIENT_SECRET:
+        if (not FIXTURES.offline) and (not CLIENT_ID or not CLIENT_SECRET):
             raise ValueError(
                 "Missing SPOTIFY_CLIENT_ID or SPOTIFY_CLIENT_SECRET. "
                 f"Create .env file With:\n"
@@ -888,9 +1363,10 @@ if __name__ == '__main__':
                 "  SPOTIFY_REDIRECT_URI = your_redirect_uri\n"
             )
 
-        client = SpotifyClient(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI)
+        client = SpotifyClient(CLIENT_ID, CLIENT_SECRET, REDIRECT_URI, page_workers = PAGE_WORKERS, fixtures = FIXTURES)
         user = SpotifyUser(username = "Muntakim", api_client = client)
         SpotifyDashboard(user).save()
+        getTransport().report()
         print("Spotify Dashboard Generated Successfully!")
 
     except Exception as e:
@@ -0,0 +1,328 @@
+"""
+Spotify Tests
+Author: Muntakim Rahman
+Description: SpotifyUser / SpotifyDashboard Against a Synthetic Library Replayed Through FixtureStore (No Network, No OAuth).
+"""
+
+# Import Packages
+import json
+import pandas as pd
+import pytest
+
+import spotify
+
+from conftest import FakeSpotify, library, savedItem
+from fixtures import FixtureStore
+from spec_template import contentFingerprint, layoutFingerprint
+
+class CountingStore(FixtureStore):
+    """Replay Store Logging the Offset of Every Saved Track Page Requested"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = []
+
+    def call(self, namespace, name, params, fetch):
+        if name == "current_user_saved_tracks":
+            self.requests.append(params["offset"])
+        return super().call(namespace, name, params, fetch)
+
+class FlakyStore(CountingStore):
+    """Replay Store Whose Saved Track Page at FLAKY_OFFSET Fails on Its First Request Only"""
+
+    FLAKY_OFFSET = 100
+
+    def call(self, namespace, name, params, fetch):
+        if (name == "current_user_saved_tracks") and (params["offset"] == self.FLAKY_OFFSET) and (self.FLAKY_OFFSET not in self.requests):
+            self.requests.append(params["offset"])
+            raise ConnectionError("Connection Reset")
+        return super().call(namespace, name, params, fetch)
+
+@pytest.fixture
+def dashboard(replay) -> spotify.SpotifyDashboard:
+    user = spotify.SpotifyUser("Tester", replay(FakeSpotify(library())))
+    return spotify.SpotifyDashboard(user)
+
+@pytest.mark.parametrize("layout", list(spotify.SpotifyDashboard.LAYOUTS))
+def test_layout_budget_rows_and_granularity(dashboard, layout):
+    budget = dashboard._dataBudget(layout)
+    datasets, _ = dashboard._layoutSlots(layout)
+
+    full_growth = dashboard.user.getLibraryGrowth(budget["growth_granularity"])
+    periods = budget["growth_periods"] or len(full_growth)
+    assert len(datasets["growth"]) == periods
+    assert [row["year"] for row in datasets["growth"]] == full_growth["time_period"].tail(periods).tolist()
+    assert all(len(row["year"]) == 4 for row in datasets["growth"]) # Yearly Periods
+
+    assert len(datasets["artist_shares"]) == budget["pie_slices"]
+    assert len(datasets["top_songs"]) == budget["table_rows"]
+    if "artist_legend" in datasets:
+        assert len(datasets["artist_legend"]) == budget["pie_slices"]
+
+def test_trimmed_layouts_keep_full_set_values(dashboard):
+    standard, _ = dashboard._layoutSlots("standard")
+    shares = {row["artist"]: row["pct"] for row in standard["artist_shares"]}
+    growth = {row["year"]: row["cumulative_tracks"] for row in standard["growth"]}
+
+    for layout in ("landscape", "portrait"):
+        datasets, _ = dashboard._layoutSlots(layout)
+        assert len(datasets["artist_shares"]) < len(shares) # Actually Trimmed
+        for row in datasets["artist_shares"]:
+            assert row["pct"] == shares[row["artist"]]
+        for row in datasets["growth"]: # Cumulative Totals Include Periods Cut from This Layout
+            assert row["cumulative_tracks"] == growth[row["year"]]
+    assert growth[max(growth)] == len(library())
+
+def test_concurrent_pages_match_serial(replay):
+    fake = FakeSpotify(library())
+    serial = replay(fake).getSavedTracks()
+    concurrent = replay(fake, page_workers = 4).getSavedTracks()
+
+    assert len(serial) == len(fake.items)
+    pd.testing.assert_frame_equal(concurrent, serial)
+    assert serial["id"].tolist() == [item["track"]["id"] for item in fake.items] # Newest First
+
+def test_failed_page_retried(replay):
+    client = replay(FakeSpotify(library()), page_workers = 4, store = FlakyStore)
+    saved_df = client.getSavedTracks()
+
+    assert len(saved_df) == len(library())
+    assert client.fixtures.requests.count(FlakyStore.FLAKY_OFFSET) == 2
+
+def test_page_failing_every_retry_returns_nothing(replay, capsys):
+    client = replay(FakeSpotify(library()), page_workers = 4, skip_offsets = (150,), store = FlakyStore)
+    assert client.getSavedTracks().empty # Never a Partial Library
+
+    assert client.fixtures.requests.count(150) == 1 + spotify.SpotifyClient.PAGE_RETRIES
+    assert "Still Empty after 2 Retries" in capsys.readouterr().out
+
+def _snapshot(tmp_path) -> dict:
+    with open(tmp_path / "Tester_Library.json", "r", encoding = "utf-8") as f:
+        return json.load(f)
+
+def _newTracks(n: int) -> list:
+    return [savedItem(1000 + i, f"2026-07-0{n - i}T12:00:00Z", ["Arijit Singh"]) for i in range(n)]
+
+def test_first_run_full_fetch_saves_snapshot(replay, tmp_path):
+    user = spotify.SpotifyUser("Tester", replay(FakeSpotify(library())))
+    snapshot = _snapshot(tmp_path)
+    assert len(snapshot["tracks"]) == len(user.saved_tracks_df) == len(library())
+    assert pd.Timestamp.now(tz = "UTC") - pd.Timestamp(snapshot["reconciled_at"]) < pd.Timedelta(minutes = 1)
+
+def test_delta_sync_fetches_only_new_pages(replay, tmp_path):
+    spotify.SpotifyUser("Tester", replay(FakeSpotify(library())))
+    reconciled_at = _snapshot(tmp_path)["reconciled_at"]
+
+    client = replay(FakeSpotify(_newTracks(3) + library()), store = CountingStore)
+    user = spotify.SpotifyUser("Tester", client)
+    assert client.fixtures.requests == [0] # New Tracks and the First Known Track Fit on Page One
+    assert len(user.saved_tracks_df) == len(library()) + 3
+    assert user.saved_tracks_df["id"].tolist()[:4] == ["t1000", "t1001", "t1002", "t0"]
+
+    snapshot = _snapshot(tmp_path)
+    assert snapshot["reconciled_at"] == reconciled_at # Delta Sync Never Counts as a Reconcile
+    assert len(snapshot["tracks"]) == len(library()) + 3
+
+def test_unchanged_library_leaves_snapshot_untouched(replay, tmp_path):
+    fake = FakeSpotify(library())
+    spotify.SpotifyUser("Tester", replay(fake))
+    before = (tmp_path / "Tester_Library.json").stat().st_mtime_ns
+
+    spotify.SpotifyUser("Tester", replay(fake))
+    assert (tmp_path / "Tester_Library.json").stat().st_mtime_ns == before
+
+def test_reconcile_after_seven_days_drops_removed_tracks(replay, tmp_path):
+    spotify.SpotifyUser("Tester", replay(FakeSpotify(library())))
+    snapshot = _snapshot(tmp_path)
+    snapshot["reconciled_at"] = (pd.Timestamp.now(tz = "UTC") - pd.Timedelta(days = spotify.SpotifyUser.RECONCILE_DAYS)).isoformat()
+    (tmp_path / "Tester_Library.json").write_text(json.dumps(snapshot), encoding = "utf-8")
+
+    removed = library()[:5] + library()[6:] # t5 Unsaved; Delta Sync Alone Would Never See It
+    client = replay(FakeSpotify(removed), store = CountingStore)
+    user = spotify.SpotifyUser("Tester", client)
+    assert "t5" not in set(user.saved_tracks_df["id"])
+    assert sorted(set(client.fixtures.requests)) == list(range(0, len(removed) + 50, 50)) # Full Walk to the Empty Page
+
+    reconciled_at = pd.Timestamp(_snapshot(tmp_path)["reconciled_at"])
+    assert pd.Timestamp.now(tz = "UTC") - reconciled_at < pd.Timedelta(minutes = 1)
+
+def test_size_mismatch_forces_reconcile(replay, tmp_path):
+    spotify.SpotifyUser("Tester", replay(FakeSpotify(library())))
+
+    removed = library()[:5] + library()[6:]
+    user = spotify.SpotifyUser("Tester", replay(FakeSpotify(removed)))
+    assert len(user.saved_tracks_df) == len(removed)
+
+def test_failed_reconcile_keeps_snapshot(replay, tmp_path):
+    spotify.SpotifyUser("Tester", replay(FakeSpotify(library())))
+    snapshot = _snapshot(tmp_path)
+    snapshot["reconciled_at"] = "2020-01-01T00:00:00+00:00"
+    (tmp_path / "Tester_Library.json").write_text(json.dumps(snapshot), encoding = "utf-8")
+
+    user = spotify.SpotifyUser("Tester", replay(FakeSpotify(library()), page_workers = 4, skip_offsets = (100,)))
+    assert len(user.saved_tracks_df) == len(library())
+    assert _snapshot(tmp_path) == snapshot # Not Overwritten with a Partial Library
+
+GROWTH_LIBRARY = [ # Oldest First: (added_at, Artists)
+    ("2024-01-01T10:00:00Z", ["Pritam"]),
+    ("2024-01-15T10:00:00Z", ["Shaan"]),
+    ("2024-02-10T10:00:00Z", ["Pritam", "KK"]),
+    ("2025-03-03T10:00:00Z", ["Atif Aslam"]),
+    ("2025-03-04T10:00:00Z", ["Alka Yagnik & Arvind Hasabnish"]), # Alias of Alka Yagnik
+    ("2025-03-05T10:00:00Z", ["Alka Yagnik"]),
+]
+
+@pytest.fixture
+def growth_user(replay) -> spotify.SpotifyUser:
+    items = [savedItem(index, added_at, artists) for index, (added_at, artists) in enumerate(GROWTH_LIBRARY)][::-1]
+    return spotify.SpotifyUser("Tester", replay(FakeSpotify(items)))
+
+@pytest.mark.parametrize("granularity, expected", [
+    ("yearly", {"2024": (3, 3), "2025": (6, 5)}),
+    ("monthly", {"2024-01": (2, 2), "2024-02": (3, 3), "2025-03": (6, 5)}),
+    ("weekly", {"2024-01-01/2024-01-07": (1, 1), "2024-01-15/2024-01-21": (2, 2), "2024-02-05/2024-02-11": (3, 3), "2025-03-03/2025-03-09": (6, 5)}),
+])
+def test_library_growth_cumsum(growth_user, granularity, expected):
+    growth_df = growth_user.getLibraryGrowth(granularity)
+    cumulative = zip(growth_df["cumulative_tracks"], growth_df["cumulative_artists"])
+    assert dict(zip(growth_df["time_period"], cumulative)) == expected
+    assert growth_df["tracks_added"].sum() == len(GROWTH_LIBRARY)
+
+def test_library_growth_unknown_granularity(growth_user):
+    assert growth_user.getLibraryGrowth("daily").empty
+
+def test_artist_index_factorizes_credits(replay):
+    items = [
+        savedItem(0, "2026-01-04T00:00:00Z", ["Pritam", "KK"]),
+        savedItem(1, "2026-01-03T00:00:00Z", ["Alka Yagnik", "Alka Yagnik & Arvind Hasabnish"]), # Alias Collapses onto Co-Credit
+        savedItem(2, "2026-01-02T00:00:00Z", ["Earth, Wind & Fire"]), # Comma Inside One Name
+        savedItem(3, "2026-01-01T00:00:00Z", ["Pritam"]),
+    ]
+    user = spotify.SpotifyUser("Tester", replay(FakeSpotify(items)))
+
+    assert user.artist_names.tolist() == ["Pritam", "KK", "Alka Yagnik", "Earth, Wind & Fire"]
+    assert list(zip(user.track_artists["track_idx"], user.track_artists["artist_id"])) == [(0, 0), (0, 1), (1, 2), (2, 3), (3, 0)]
+    assert (user.track_artists.dtypes == "int32").all()
+
+    top_df = user.getTopSavedArtists(2)
+    assert dict(zip(top_df["artist"], top_df["track_count"])) == {"Pritam": 2, "KK": 1}
+
+def test_artist_index_from_legacy_rows(replay):
+    user = spotify.SpotifyUser("Tester", replay(FakeSpotify([])))
+    user.saved_tracks_df = pd.DataFrame({"track": ["Song 0", "Song 1"], "artists": ["Pritam, KK", "Pritam"]}) # No artist_names
+    user._buildArtistIndex()
+
+    assert user.artist_names.tolist() == ["Pritam", "KK"]
+    assert user.track_artists["track_idx"].tolist() == [0, 0, 1]
+
+def test_compact_tracks_dtypes(replay):
+    user = spotify.SpotifyUser("Tester", replay(FakeSpotify(library(size = 60))))
+    compact_df = user.saved_tracks_df
+
+    assert "artist_names" not in compact_df.columns # Credits Live in the Artist Index
+    for column in ("artists", "album"):
+        assert isinstance(compact_df[column].dtype, pd.CategoricalDtype)
+    assert isinstance(compact_df["added_at"].dtype, pd.DatetimeTZDtype) and (str(compact_df["added_at"].dt.tz) == "UTC")
+    assert compact_df["duration_ms"].dtype == "int32"
+    assert compact_df["album"].cat.categories.size == 7 # Repeated Albums Stored Once
+
+def test_compact_tracks_coerces_bad_durations():
+    compact_df = spotify.SpotifyUser.compactTracks(pd.DataFrame({
+        "track": ["Song 0", "Song 1"],
+        "added_at": ["2026-01-01T00:00:00Z", "2026-01-02T00:00:00.5Z"],
+        "duration_ms": [180000, None],
+    }))
+    assert compact_df["duration_ms"].tolist() == [180000, 0]
+    assert compact_df["added_at"].tolist() == [pd.Timestamp("2026-01-01", tz = "UTC"), pd.Timestamp("2026-01-02 00:00:00.5", tz = "UTC")]
+    assert spotify.SpotifyUser.compactTracks(pd.DataFrame()).empty
+
+def _contents(dashboard: spotify.SpotifyDashboard) -> dict:
+    """Layout -> Content Fingerprint, as save() Checks It Against the Output Manifest"""
+    contents = {}
+    for layout in dashboard.LAYOUTS:
+        datasets, values = dashboard._layoutSlots(layout)
+        fingerprint = layoutFingerprint(spotify.SpotifyDashboard, layout, sorted(datasets), sorted(values))
+        contents[layout] = contentFingerprint(fingerprint, datasets, values, shared = True)
+    return contents
+
+def test_data_model_built_once(dashboard, monkeypatch):
+    calls = {"artists": 0, "growth": 0}
+
+    def counted(name: str, method):
+        def wrapper(*args, **kwargs):
+            calls[name] += 1
+            return method(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(dashboard.user, "getTopSavedArtists", counted("artists", dashboard.user.getTopSavedArtists))
+    monkeypatch.setattr(dashboard.user, "getLibraryGrowth", counted("growth", dashboard.user.getLibraryGrowth))
+
+    model = dashboard._getDataModel()
+    for layout in dashboard.LAYOUTS:
+        dashboard._layoutSlots(layout)
+    assert dashboard._getDataModel() is model
+    assert calls == {"artists": 1, "growth": 1} # Every Layout Reads the Memoized Model
+
+    dashboard._growthRows("monthly")
+    dashboard._growthRows("monthly")
+    assert calls["growth"] == 2 # Each Extra Granularity Computed Once
+
+def test_content_fingerprint_tracks_data(replay, dashboard):
+    contents = _contents(dashboard)
+    assert len(set(contents.values())) == len(contents) # Layouts Never Share an Entry
+
+    same = spotify.SpotifyDashboard(spotify.SpotifyUser("Tester", replay(FakeSpotify(library()))))
+    assert _contents(same) == contents
+
+    grown = spotify.SpotifyDashboard(spotify.SpotifyUser("Tester", replay(FakeSpotify(_newTracks(1) + library()))))
+    changed = _contents(grown)
+    assert all(changed[layout] != contents[layout] for layout in contents)
+
+def test_ranked_track_rows():
+    tracks_df = pd.DataFrame({"track": ["Song A", "Song B", "Song C"], "artists": ["KK", "Shaan", "Pritam, KK"]})
+    times = pd.Series(["08:00 UTC", "07:45 UTC", ""])
+    rows = spotify.SpotifyDashboard._rankedTrackRows(tracks_df, times = times)
+
+    assert list(rows.columns) == ["rank", "song", "artist", "time", "y_pos"]
+    assert rows["rank"].tolist() == [1, 2, 3]
+    assert rows["y_pos"].tolist() == [0, 1, 2]
+    assert rows["time"].tolist() == ["08:00 UTC", "07:45 UTC", ""]
+    assert "time" not in spotify.SpotifyDashboard._rankedTrackRows(tracks_df).columns
+
+def test_format_played_at():
+    played_at = pd.Series(["2026-03-01T08:05:09.123Z", "2026-03-01T02:30:00-05:00", "not a timestamp at all", None, ""])
+    assert spotify.SpotifyDashboard._formatPlayedAt(played_at).tolist() == [
+        "08:05 UTC", "07:30 UTC", # Offsets Converted to UTC
+        "not a timestamp ", # Unparseable: First 16 Characters
+        "", "",
+    ]
+
+def test_ranked_rows_scale_to_full_history():
+    n_rows = 5000
+    played_at = pd.Series(pd.date_range("2026-01-01", periods = n_rows, freq = "min", tz = "UTC").strftime("%Y-%m-%dT%H:%M:%SZ"))
+    tracks_df = pd.DataFrame({"track": [f"Song {i}" for i in range(n_rows)], "artists": ["KK"] * n_rows})
+
+    rows = spotify.SpotifyDashboard._rankedTrackRows(tracks_df, times = spotify.SpotifyDashboard._formatPlayedAt(played_at))
+    assert len(rows) == n_rows
+    assert rows["time"].iloc[-1] == "11:19 UTC" # 4999 Minutes after Midnight, Day 4
+    assert rows["rank"].iloc[-1] == n_rows
+
+def test_artist_share_and_legend_rows(dashboard):
+    model_df = dashboard._getDataModel()["top_artists"]
+    shares = dashboard._artistShareRows(10)
+    assert shares["artist"].tolist() == model_df["artist"].head(10).tolist()
+    assert shares["pct"].tolist() == (100 * shares["count"] / shares["count"].sum()).round(1).tolist()
+
+    legend = dashboard._artistLegendRows(10)
+    assert legend["idx"].tolist() == list(range(10))
+    first = model_df.iloc[0]
+    assert legend["label"].iloc[0] == f"{first['artist']} ({first['track_count']:,})"
+
+def test_legend_row_range():
+    assert spotify.SpotifyDashboard._legendRowRange(10, 320) == [30, 30 + 28 * 9]
+    assert spotify.SpotifyDashboard._legendRowRange(10, 200) == [30, 30 + 22 * 9] # Minimum Row Step
+
+def test_empty_library_placeholder_rows(replay):
+    model = spotify.SpotifyDashboard(spotify.SpotifyUser("Tester", replay(FakeSpotify([]))))._getDataModel()
+    assert model["top_songs"].to_dict(orient = "records") == [{"rank": 1, "song": "No data", "artist": "", "y_pos": 0}]
+    assert model["recently_played"]["song"].tolist() == ["No recent plays"]
@@ -1,5 +1,4 @@
 import { useMemo, useEffect, useState } from 'react';
-import { VegaLite } from 'react-vega';
 
 // Import Responsive Chart Specs (Generated by spotify.py)
 import defaultSpotify from '../../assets/data/spotify/Charts/Muntakim_Standard.json';
@@ -7,20 +6,45 @@ import portraitSpotify from '../../assets/data/spotify/Charts/Muntakim_Portrait.
 import landscapeSpotify from '../../assets/data/spotify/Charts/Muntakim_Landscape.json';
 import tabletPortraitSpotify from '../../assets/data/spotify/Charts/Muntakim_TabletPortrait.json';
 import tabletSpotify from '../../assets/data/spotify/Charts/Muntakim_Tablet.json';
+import spotifyDatasets from '../../assets/data/spotify/Charts/Muntakim_Datasets.json';
+import spotifyBreakpoints from '../../assets/data/spotify/Charts/Muntakim_Breakpoints.json';
+
+// Static First-Paint SVGs per Layout (Rendered by spotify.py)
+import defaultSpotifySvg from '../../assets/data/spotify/Charts/Muntakim_Standard.svg';
+import portraitSpotifySvg from '../../assets/data/spotify/Charts/Muntakim_Portrait.svg';
+import landscapeSpotifySvg from '../../assets/data/spotify/Charts/Muntakim_Landscape.svg';
+import tabletPortraitSpotifySvg from '../../assets/data/spotify/Charts/Muntakim_TabletPortrait.svg';
+import tabletSpotifySvg from '../../assets/data/spotify/Charts/Muntakim_Tablet.svg';
+
+import VegaChart from '../VegaChart';
 
 import './index.scss';
 
 // --- Helpers ---
 
-/** Pick Vega Spec Based on Viewport (Same Breakpoints as Steam / GoodReads) */
-const getSpotifySpec = (width, height) => {
-  if (width <= 550 && height >= width) return portraitSpotify; // Phone Portrait
-  if (width <= 900 && width > height) return landscapeSpotify; // Phone Landscape
-  if (width <= 900) return tabletPortraitSpotify; // iPad Mini / Air / Small Tablet
-  if (width <= 1200) return tabletSpotify; // Large Tablet / iPad Pro
-  return defaultSpotify; // Desktop
+/** Pick Layout Based on Viewport (Same Breakpoints as Steam / GoodReads) */
+const getSpotifyLayout = (width, height) => {
+  if (width <= 550 && height >= width) return 'Portrait'; // Phone Portrait
+  if (width <= 900 && width > height) return 'Landscape'; // Phone Landscape
+  if (width <= 900) return 'TabletPortrait'; // iPad Mini / Air / Small Tablet
+  if (width <= 1200) return 'Tablet'; // Large Tablet / iPad Pro
+  return 'Standard'; // Desktop
 };
 
+const spotifyLayouts = {
+  Standard: { spec: defaultSpotify, svg: defaultSpotifySvg },
+  Tablet: { spec: tabletSpotify, svg: tabletSpotifySvg },
+  TabletPortrait: { spec: tabletPortraitSpotify, svg: tabletPortraitSpotifySvg },
+  Landscape: { spec: landscapeSpotify, svg: landscapeSpotifySvg },
+  Portrait: { spec: portraitSpotify, svg: portraitSpotifySvg },
+};
+
+/** Layout Specs Refer to Shared Datasets by Name; Merge Them Back (Inline Datasets Take Precedence) */
+const withDatasets = (spec) => ({
+  ...spec,
+  datasets: { ...spotifyDatasets, ...spec.datasets },
+});
+
 const isPortrait = (width, height) => width <= 550 && height >= width;
 
 /**
@@ -110,9 +134,8 @@ const SpotifyCharts = () => {
   }, []);
 
   // Cache Spec to Avoid Unnecessary Re-Renders
-  const rawSpec = useMemo(() => {
-    return getSpotifySpec(dimensions.width, dimensions.height);
-  }, [dimensions]);
+  const layout = getSpotifyLayout(dimensions.width, dimensions.height);
+  const rawSpec = useMemo(() => withDatasets(spotifyLayouts[layout].spec), [layout]);
 
   const spec = useMemo(() => cleanSpec(rawSpec), [rawSpec]);
 
@@ -123,7 +146,7 @@ const SpotifyCharts = () => {
   return (
     <>
       <div className = "vega-chart" style = {chartsDivStyle}>
-        <VegaLite spec = {spec} actions = {false} />
+        <VegaChart spec = {spec} staticSvg = {spotifyLayouts[layout].svg} size = {spotifyBreakpoints[layout]} />
       </div>
 
       {/* Cards Replace Crowded Vega Tables on Phone Portrait */}
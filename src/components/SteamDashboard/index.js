@@ -1,10 +1,19 @@
 import { useMemo, useEffect, useState } from 'react';
-import { VegaLite } from 'react-vega';
 
 import defaultGames from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Standard.json";
 import portraitGames from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Portrait.json";
 import landscapeGames from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Landscape.json";
 import tabletGames from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Tablet.json";
+import gamesDatasets from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Datasets.json";
+import gamesBreakpoints from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Breakpoints.json";
+
+// Static First-Paint SVGs per Breakpoint (Rendered by games.py)
+import defaultGamesSvg from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Standard.svg";
+import portraitGamesSvg from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Portrait.svg";
+import landscapeGamesSvg from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Landscape.svg";
+import tabletGamesSvg from "../../assets/data/games/Charts/Dipto_9999_Games_Dashboard_Tablet.svg";
+
+import VegaChart from '../VegaChart';
 
 import './index.scss';
 
@@ -15,11 +24,24 @@ const chartContainerStyle = {
   width: '100%',
 };
 
-const getGamesSpec = (width, height) => {
-  if (width <= 550 && height >= width) return portraitGames; // Mobile Portrait
-  if (width <= 900 && width > height) return landscapeGames;  // Mobile Landscape
-  if (width <= 1440) return tabletGames; // Tablet / Laptop
-  return defaultGames; // Wide Desktop
+// Breakpoint Specs Refer to Shared Datasets by Name; Merge Them Back (Inline Datasets Take Precedence)
+const withDatasets = (spec) => ({
+  ...spec,
+  datasets: { ...gamesDatasets, ...spec.datasets },
+});
+
+const getGamesBreakpoint = (width, height) => {
+  if (width <= 550 && height >= width) return 'Portrait'; // Mobile Portrait
+  if (width <= 900 && width > height) return 'Landscape';  // Mobile Landscape
+  if (width <= 1440) return 'Tablet'; // Tablet / Laptop
+  return 'Standard'; // Wide Desktop
+};
+
+const gamesSpecs = {
+  Standard: { spec: defaultGames, svg: defaultGamesSvg },
+  Tablet: { spec: tabletGames, svg: tabletGamesSvg },
+  Landscape: { spec: landscapeGames, svg: landscapeGamesSvg },
+  Portrait: { spec: portraitGames, svg: portraitGamesSvg },
 };
 
 const SteamDashboard = () => {
@@ -40,15 +62,14 @@ const SteamDashboard = () => {
   }, []);
 
   // Pick Games Chart Dynamically Based on Dimensions
+  const breakpoint = getGamesBreakpoint(dimensions.width, dimensions.height);
   const spec = useMemo(() => {
-    return JSON.parse(JSON.stringify(
-      getGamesSpec(dimensions.width, dimensions.height)
-    ));
-  }, [dimensions]);
+    return JSON.parse(JSON.stringify(withDatasets(gamesSpecs[breakpoint].spec)));
+  }, [breakpoint]);
 
   return (
     <div className = "vega-chart" style = {chartContainerStyle}>
-      <VegaLite spec = {spec} actions = {false} />
+      <VegaChart spec = {spec} staticSvg = {gamesSpecs[breakpoint].svg} size = {gamesBreakpoints[breakpoint]} />
     </div>
   );
 };
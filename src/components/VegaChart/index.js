@@ -0,0 +1,41 @@
+import { lazy, Suspense, useEffect, useState } from 'react';
+
+// Vega Runtime is Code-Split; the Static SVG Paints While It Loads
+const VegaLite = lazy(() => import('react-vega').then((module) => ({ default: module.VegaLite })));
+
+const staticStyle = { maxWidth: '100%', height: 'auto' };
+const pendingStyle = { position: 'absolute', visibility: 'hidden' }; // Vega Renders Off-Screen Until Ready
+
+/**
+ * Interactive Vega-Lite Chart with Static First Paint.
+ * staticSvg / size Come from the Breakpoints Manifest Written by the Python Exporters
+ * ({name}_Breakpoints.json); the SVG is Shown Until Vega Has Rendered the Same Layout.
+ */
+const VegaChart = ({ spec, staticSvg, size }) => {
+  const [ready, setReady] = useState(false);
+
+  // New Breakpoint Layout: Show Its Static SVG Again Until Vega Re-Renders
+  useEffect(() => setReady(false), [staticSvg]);
+
+  return (
+    <>
+      {!ready && staticSvg && (
+        <img
+          src = {staticSvg}
+          width = {size?.width}
+          height = {size?.height}
+          style = {staticStyle}
+          alt = ""
+          aria-hidden = "true"
+        />
+      )}
+      <Suspense fallback = {null}>
+        <div style = {ready ? undefined : pendingStyle}>
+          <VegaLite spec = {spec} actions = {false} onNewView = {() => setReady(true)} />
+        </div>
+      </Suspense>
+    </>
+  );
+};
+
+export default VegaChart;